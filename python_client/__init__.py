@@ -0,0 +1,21 @@
+"""
+Odoo Python Client package
+
+Re-exports the public client API so callers can simply use:
+
+    >>> from python_client import OdooClient, AsyncOdooClient
+"""
+
+from .odoo_client import OdooClient, OdooAPIError, OdooConnectionError, create_client
+from .async_client import AsyncOdooClient, create_async_client
+from .loader import RecordLoader
+
+__all__ = [
+    'OdooClient',
+    'OdooAPIError',
+    'OdooConnectionError',
+    'create_client',
+    'AsyncOdooClient',
+    'create_async_client',
+    'RecordLoader',
+]
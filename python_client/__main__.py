@@ -0,0 +1,38 @@
+"""
+Command line entry point
+========================
+
+Usage:
+    python -m python_client export mrp.production --format csv -o mos.csv
+    python -m python_client export --help
+"""
+
+import sys
+from typing import List, Optional
+
+USAGE = (
+    "usage: python -m python_client <command> [options]\n"
+    "\n"
+    "commands:\n"
+    "  export    export the records of a model to JSON Lines, CSV or Parquet\n"
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Dispatch to the subcommand named by the first argument"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print(USAGE, end='')
+        return 0 if argv else 2
+    
+    command, args = argv[0], argv[1:]
+    if command == 'export':
+        from .export import main as export_main
+        return export_main(args)
+    
+    print(f"Unknown command: {command}\n\n{USAGE}", end='', file=sys.stderr)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,686 @@
+"""
+Odoo API Client - asyncio variant
+=================================
+
+Coroutine-based counterpart of :class:`OdooClient` for services that need to
+keep many Odoo calls in flight from a single event loop.
+
+Features:
+- Same method surface as OdooClient (execute, search_read, manufacturing
+  orders, products, users, ...) exposed as coroutines
+- Pooled keep-alive HTTP connections through a shared aiohttp session
+- Lazy, single-flight authentication (concurrent callers share one login)
+- JSON-RPC protocol only (XML-RPC has no asyncio transport in the stdlib)
+
+Requires the optional ``aiohttp`` dependency.
+
+Example usage:
+    >>> import asyncio
+    >>> from python_client import AsyncOdooClient
+    >>> async def main():
+    ...     async with AsyncOdooClient() as client:
+    ...         orders, products = await asyncio.gather(
+    ...             client.search_manufacturing_orders([('state', '=', 'progress')]),
+    ...             client.search_products(limit=10),
+    ...         )
+    >>> asyncio.run(main())
+"""
+
+import os
+import asyncio
+import itertools
+from typing import Dict, List, Any, Optional, AsyncIterator, Union
+from urllib.parse import urljoin
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .codec import JSONCodec, get_codec
+from .schema import SCHEMA_ATTRIBUTES, FIELD_RENAMES, is_invalid_field_error, rename_fields, restore_names
+from .odoo_client import (
+    OdooAPIError,
+    OdooConnectionError,
+    logger,
+    validate_config,
+    READ_METHODS,
+    DEFAULT_PAGE_SIZE,
+    MANUFACTURING_ORDER_FIELDS,
+    MANUFACTURING_ORDER_DETAIL_FIELDS,
+    PRODUCT_FIELDS,
+    USER_FIELDS,
+)
+
+
+class AsyncOdooClient:
+    """
+    Asynchronous Odoo API Client (JSON-RPC over aiohttp)
+    
+    All model helpers mirror :class:`OdooClient` and must be awaited. The
+    underlying HTTP session and the authentication lock are created on first
+    use inside the running event loop (and again if the client is later used
+    from another loop, e.g. a second ``asyncio.run()``); the session should be
+    released with :meth:`close` (or ``async with``).
+    """
+    
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        db: Optional[str] = None,
+        username: Optional[str] = None,
+        api_key: Optional[str] = None,
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 30.0,
+        codec: Union[str, JSONCodec] = 'auto'
+    ):
+        """
+        Initialize async Odoo client with credentials from environment variables or parameters
+        
+        Args:
+            url: Odoo instance URL (default: from ODOO_URL env var)
+            db: Database name (default: from ODOO_DB env var)
+            username: Username/email (default: from ODOO_USERNAME env var)
+            api_key: API key (default: from ODOO_API_KEY env var)
+            pool_size: Maximum number of pooled connections (in-flight requests)
+            pool_size_per_host: Per-host connection limit (0 = no extra limit)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            timeout: Total timeout per request in seconds
+            codec: JSON codec ('auto', 'orjson', 'ujson', 'json' or a JSONCodec)
+        """
+        if aiohttp is None:
+            raise OdooAPIError(
+                "AsyncOdooClient requires the 'aiohttp' package.\n"
+                "Install with: pip install aiohttp"
+            )
+        
+        self.url = url or os.getenv('ODOO_URL')
+        self.db = db or os.getenv('ODOO_DB')
+        self.username = username or os.getenv('ODOO_USERNAME')
+        self.api_key = api_key or os.getenv('ODOO_API_KEY')
+        self.protocol = 'jsonrpc'
+        
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.codec = get_codec(codec)
+        
+        # User ID (set after authentication)
+        self.uid = None
+        
+        # fields_get results, fetched when the server rejects a renamed field
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        
+        validate_config(self.url, self.db, self.username, self.api_key)
+        
+        # Event loop the session and auth lock belong to (see _bind_loop)
+        self._loop = None
+        self._session = None
+        self._auth_lock = None
+        self._request_ids = itertools.count(1)
+        
+        logger.info("Async Odoo client initialized with JSONRPC protocol")
+        logger.info(f"URL: {self.url}, DB: {self.db}, User: {self.username}")
+    
+    async def __aenter__(self) -> 'AsyncOdooClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    def _bind_loop(self) -> None:
+        """Start a new session and auth lock when called from another event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Both are tied to the loop they were first used in
+            self._release_session()
+            self._loop = loop
+            self._auth_lock = asyncio.Lock()
+    
+    def _release_session(self) -> Optional[asyncio.Future]:
+        """
+        Close the session of another event loop (see _bind_loop)
+        
+        A session can only be closed by its own loop. If that loop still
+        runs (in another thread), the close is scheduled there; if it has
+        ended, its connections cannot be closed any more: close() the client
+        (or use ``async with``) before the loop it was used in ends.
+        
+        Returns:
+            Future of the scheduled close, if any
+        """
+        session, loop, self._session = self._session, self._loop, None
+        if session is None or session.closed:
+            return None
+        if loop.is_running():
+            return asyncio.run_coroutine_threadsafe(session.close(), loop)
+        logger.warning(
+            "AsyncOdooClient session dropped unclosed: its event loop ended before close() was called"
+        )
+        return None
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Return the pooled HTTP session, creating it inside the running loop"""
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Content-Type': 'application/json'},
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP session (call it in the loop the client was used in)"""
+        if self._loop is asyncio.get_running_loop():
+            session, self._session = self._session, None
+            if session is not None and not session.closed:
+                await session.close()
+            return
+        closing = self._release_session()
+        if closing is not None:
+            await asyncio.wrap_future(closing)
+    
+    async def _jsonrpc_call(self, endpoint: str, params: Dict[str, Any]) -> Any:
+        """
+        Make a JSON-RPC call to Odoo
+        
+        Args:
+            endpoint: API endpoint (e.g., '/jsonrpc')
+            params: Request parameters
+        
+        Returns:
+            API response result
+        
+        Raises:
+            OdooAPIError: If request fails
+        """
+        url = urljoin(self.url, endpoint)
+        payload = {
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': params,
+            'id': next(self._request_ids)
+        }
+        
+        try:
+            logger.debug(f"Async JSON-RPC call to {endpoint}: {params.get('service')}.{params.get('method')}")
+            async with self._get_session().post(url, data=self.codec.dumps(payload)) as response:
+                response.raise_for_status()
+                data = self.codec.loads(await response.read())
+            
+            # Check for JSON-RPC error
+            if 'error' in data:
+                error = data['error']
+                error_msg = error.get('data', {}).get('message') or error.get('message', 'Unknown error')
+                raise OdooAPIError(f"JSON-RPC Error: {error_msg}")
+            
+            return data.get('result')
+        
+        except aiohttp.ClientConnectionError as e:
+            raise OdooConnectionError(f"HTTP Request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            raise OdooConnectionError(f"HTTP Request failed: timed out after {self.timeout}s")
+        except aiohttp.ClientResponseError as e:
+            if e.status >= 500 or e.status == 429:
+                raise OdooConnectionError(f"HTTP Request failed: {str(e)}")
+            raise OdooAPIError(f"HTTP Request failed: {str(e)}")
+        except aiohttp.ClientError as e:
+            raise OdooAPIError(f"HTTP Request failed: {str(e)}")
+        except ValueError as e:
+            raise OdooAPIError(f"Invalid JSON response: {str(e)}")
+    
+    async def authenticate(self) -> int:
+        """
+        Authenticate with Odoo using API key
+        
+        Concurrent callers are serialized on a lock so only one
+        ``common.authenticate`` request is sent at a time.
+        
+        Returns:
+            User ID (uid)
+        
+        Raises:
+            OdooAPIError: If authentication fails
+        """
+        self._bind_loop()
+        async with self._auth_lock:
+            return await self._authenticate()
+    
+    async def _authenticate(self) -> int:
+        try:
+            logger.info(f"Authenticating user: {self.username}")
+            
+            result = await self._jsonrpc_call('/jsonrpc', {
+                'service': 'common',
+                'method': 'authenticate',
+                'args': [self.db, self.username, self.api_key, {}]
+            })
+            
+            if not result:
+                raise OdooAPIError(
+                    "Authentication failed: Invalid credentials\n"
+                    "Check:\n"
+                    "- ODOO_USERNAME is correct\n"
+                    "- ODOO_API_KEY is valid and active\n"
+                    "- User has API access enabled\n"
+                    "- Database name is correct"
+                )
+            
+            self.uid = result
+            logger.info(f"Authentication successful. User ID: {self.uid}")
+            return self.uid
+        
+        except OdooAPIError:
+            raise
+        except Exception as e:
+            raise OdooAPIError(f"Authentication error: {str(e)}")
+    
+    async def _ensure_authenticated(self) -> int:
+        """Authenticate once; callers arriving meanwhile wait for the same login"""
+        if self.uid:
+            return self.uid
+        self._bind_loop()
+        async with self._auth_lock:
+            if not self.uid:
+                await self._authenticate()
+        return self.uid
+    
+    async def execute(
+        self,
+        model: str,
+        method: str,
+        args: List[Any] = None,
+        kwargs: Dict[str, Any] = None
+    ) -> Any:
+        """
+        Execute a method on an Odoo model
+        
+        Args:
+            model: Model name (e.g., 'mrp.production')
+            method: Method name (e.g., 'search_read')
+            args: Positional arguments
+            kwargs: Keyword arguments
+        
+        Returns:
+            Method result
+        
+        Raises:
+            OdooAPIError: If execution fails
+        """
+        await self._ensure_authenticated()
+        
+        args = args or []
+        kwargs = kwargs or {}
+        
+        try:
+            logger.debug(f"Executing {model}.{method}")
+            
+            try:
+                result = await self._execute_kw(model, method, args, kwargs)
+            except OdooAPIError as e:
+                if method not in READ_METHODS or model not in FIELD_RENAMES or not is_invalid_field_error(e):
+                    raise
+                # Fields renamed across Odoo versions (see OdooClient.execute)
+                adapted = rename_fields(model, method, args, kwargs, await self._fields_get(model))
+                if adapted is None:
+                    raise
+                args, kwargs, renames = adapted
+                logger.info(f"Retrying {model}.{method} with renamed field(s): {', '.join(renames)}")
+                result = await self._execute_kw(model, method, args, kwargs)
+                if method in ('read', 'search_read'):
+                    restore_names(result, renames)
+            
+            logger.debug(f"{model}.{method} executed successfully")
+            return result
+        
+        except OdooAPIError:
+            raise
+        except Exception as e:
+            raise OdooAPIError(f"Execution error on {model}.{method}: {str(e)}")
+    
+    async def _execute_kw(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        return await self._jsonrpc_call('/jsonrpc', {
+            'service': 'object',
+            'method': 'execute_kw',
+            'args': [self.db, self.uid, self.api_key, model, method, args, kwargs]
+        })
+    
+    async def _fields_get(self, model: str) -> Dict[str, Dict[str, Any]]:
+        """Field definitions of a model, fetched once per client"""
+        if model not in self._schemas:
+            self._schemas[model] = await self._execute_kw(model, 'fields_get', [], {'attributes': SCHEMA_ATTRIBUTES})
+        return self._schemas[model]
+    
+    # ==================== Generic CRUD Operations ====================
+    
+    async def search(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = ''
+    ) -> List[int]:
+        """Search for record IDs (see OdooClient.search)"""
+        domain = domain or []
+        kwargs = {}
+        if limit: kwargs['limit'] = limit
+        if offset: kwargs['offset'] = offset
+        if order: kwargs['order'] = order
+        
+        return await self.execute(model, 'search', [domain], kwargs)
+    
+    async def search_count(self, model: str, domain: List[tuple] = None) -> int:
+        """Count records matching a domain"""
+        return await self.execute(model, 'search_count', [domain or []])
+    
+    async def read(
+        self,
+        model: str,
+        ids: List[int],
+        fields: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Read records by IDs (see OdooClient.read)"""
+        kwargs = {}
+        if fields: kwargs['fields'] = fields
+        
+        return await self.execute(model, 'read', [ids], kwargs)
+    
+    async def search_read(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = ''
+    ) -> List[Dict[str, Any]]:
+        """Search and read records in one call (see OdooClient.search_read)"""
+        domain = domain or []
+        kwargs = {}
+        if fields: kwargs['fields'] = fields
+        if limit: kwargs['limit'] = limit
+        if offset: kwargs['offset'] = offset
+        if order: kwargs['order'] = order
+        
+        return await self.execute(model, 'search_read', [domain], kwargs)
+    
+    async def iter_search_read(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        after_id: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all matching records with keyset (id) pagination (see OdooClient.iter_search_read)"""
+        domain = list(domain or [])
+        if fields and 'id' not in fields:
+            fields = list(fields) + ['id']
+        
+        last_id = after_id
+        while True:
+            page = await self.search_read(
+                model, domain + [('id', '>', last_id)], fields,
+                limit=page_size, order='id asc'
+            )
+            if not page:
+                return
+            
+            last_id = page[-1]['id']
+            for record in page:
+                yield record
+            
+            if len(page) < page_size:
+                return
+    
+    async def create(self, model: str, values: Dict[str, Any]) -> int:
+        """Create a new record"""
+        return await self.execute(model, 'create', [values])
+    
+    async def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
+        """Update existing records"""
+        return await self.execute(model, 'write', [ids, values])
+    
+    async def unlink(self, model: str, ids: List[int]) -> bool:
+        """Delete records"""
+        return await self.execute(model, 'unlink', [ids])
+    
+    async def _read_one(self, model: str, record_id: int, fields: List[str], label: str) -> Dict[str, Any]:
+        result = await self.read(model, [record_id], fields)
+        
+        if not result:
+            raise OdooAPIError(f"{label} {record_id} not found")
+        
+        return result[0]
+    
+    # ==================== Manufacturing Orders (mrp.production) ====================
+    
+    async def search_manufacturing_orders(
+        self,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'date_deadline desc'
+    ) -> List[Dict[str, Any]]:
+        """Search manufacturing orders (see OdooClient.search_manufacturing_orders)"""
+        if fields is None:
+            fields = list(MANUFACTURING_ORDER_FIELDS)
+        
+        logger.info(f"Searching manufacturing orders with domain: {domain}")
+        result = await self.search_read('mrp.production', domain, fields, limit, offset, order)
+        logger.info(f"Found {len(result)} manufacturing order(s)")
+        return result
+    
+    async def get_manufacturing_order(self, mo_id: int, fields: List[str] = None) -> Dict[str, Any]:
+        """Get a specific manufacturing order"""
+        if fields is None:
+            fields = list(MANUFACTURING_ORDER_DETAIL_FIELDS)
+        
+        logger.info(f"Getting manufacturing order ID: {mo_id}")
+        return await self._read_one('mrp.production', mo_id, fields, 'Manufacturing order')
+    
+    async def create_manufacturing_order(
+        self,
+        product_id: int,
+        product_qty: float,
+        date_planned_start: str = None,
+        date_deadline: str = None,
+        origin: str = None,
+        **kwargs
+    ) -> int:
+        """Create a new manufacturing order (see OdooClient.create_manufacturing_order)"""
+        values = {
+            'product_id': product_id,
+            'product_qty': product_qty,
+        }
+        
+        if date_planned_start: values['date_planned_start'] = date_planned_start
+        if date_deadline: values['date_deadline'] = date_deadline
+        if origin: values['origin'] = origin
+        
+        # Add any additional fields
+        values.update(kwargs)
+        
+        logger.info(f"Creating manufacturing order for product {product_id}, qty: {product_qty}")
+        mo_id = await self.create('mrp.production', values)
+        logger.info(f"Manufacturing order created with ID: {mo_id}")
+        
+        return mo_id
+    
+    async def update_manufacturing_order(self, mo_id: int, values: Dict[str, Any]) -> bool:
+        """Update a manufacturing order"""
+        logger.info(f"Updating manufacturing order {mo_id}")
+        result = await self.write('mrp.production', [mo_id], values)
+        logger.info(f"Manufacturing order {mo_id} updated successfully")
+        
+        return result
+    
+    # ==================== Products (product.product) ====================
+    
+    async def search_products(
+        self,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'name'
+    ) -> List[Dict[str, Any]]:
+        """Search products (see OdooClient.search_products)"""
+        if fields is None:
+            fields = list(PRODUCT_FIELDS)
+        
+        logger.info(f"Searching products with domain: {domain}")
+        result = await self.search_read('product.product', domain, fields, limit, offset, order)
+        logger.info(f"Found {len(result)} product(s)")
+        return result
+    
+    async def get_product(self, product_id: int, fields: List[str] = None) -> Dict[str, Any]:
+        """Get a specific product"""
+        if fields is None:
+            fields = list(PRODUCT_FIELDS)
+        
+        logger.info(f"Getting product ID: {product_id}")
+        return await self._read_one('product.product', product_id, fields, 'Product')
+    
+    async def create_product(
+        self,
+        name: str,
+        type: str = 'product',
+        list_price: float = 0.0,
+        standard_price: float = 0.0,
+        **kwargs
+    ) -> int:
+        """Create a new product (see OdooClient.create_product)"""
+        values = {
+            'name': name,
+            'type': type,
+            'list_price': list_price,
+            'standard_price': standard_price,
+        }
+        
+        # Add any additional fields
+        values.update(kwargs)
+        
+        logger.info(f"Creating product: {name}")
+        product_id = await self.create('product.product', values)
+        logger.info(f"Product created with ID: {product_id}")
+        
+        return product_id
+    
+    # ==================== Users (res.users) ====================
+    
+    async def search_users(
+        self,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'name'
+    ) -> List[Dict[str, Any]]:
+        """Search users (see OdooClient.search_users)"""
+        if fields is None:
+            fields = list(USER_FIELDS)
+        
+        logger.info(f"Searching users with domain: {domain}")
+        result = await self.search_read('res.users', domain, fields, limit, offset, order)
+        logger.info(f"Found {len(result)} user(s)")
+        return result
+    
+    async def get_user(self, user_id: int, fields: List[str] = None) -> Dict[str, Any]:
+        """Get a specific user"""
+        if fields is None:
+            fields = list(USER_FIELDS)
+        
+        logger.info(f"Getting user ID: {user_id}")
+        return await self._read_one('res.users', user_id, fields, 'User')
+    
+    async def create_user(
+        self,
+        name: str,
+        login: str,
+        email: str = None,
+        **kwargs
+    ) -> int:
+        """Create a new user (see OdooClient.create_user)"""
+        values = {
+            'name': name,
+            'login': login,
+        }
+        
+        if email: values['email'] = email
+        
+        # Add any additional fields
+        values.update(kwargs)
+        
+        logger.info(f"Creating user: {name} ({login})")
+        user_id = await self.create('res.users', values)
+        logger.info(f"User created with ID: {user_id}")
+        
+        return user_id
+    
+    # ==================== Utility Methods ====================
+    
+    async def get_version(self) -> Dict[str, Any]:
+        """
+        Get Odoo version information
+        
+        Returns:
+            Version information dictionary
+        """
+        try:
+            result = await self._jsonrpc_call('/jsonrpc', {
+                'service': 'common',
+                'method': 'version',
+                'args': []
+            })
+            
+            logger.info(f"Odoo version: {result.get('server_version', 'Unknown')}")
+            return result
+        
+        except Exception as e:
+            raise OdooAPIError(f"Failed to get version: {str(e)}")
+    
+    async def test_connection(self) -> bool:
+        """
+        Test the connection to Odoo
+        
+        Returns:
+            True if connection and authentication successful
+        """
+        try:
+            logger.info("Testing Odoo connection...")
+            
+            version = await self.get_version()
+            logger.info(f"Connected to Odoo {version.get('server_version', 'Unknown')}")
+            
+            await self.authenticate()
+            
+            logger.info("✓ Connection test successful!")
+            return True
+        
+        except Exception as e:
+            logger.error(f"✗ Connection test failed: {str(e)}")
+            return False
+
+
+async def create_async_client() -> AsyncOdooClient:
+    """
+    Create and authenticate an async Odoo client using environment variables
+    
+    Returns:
+        Authenticated AsyncOdooClient instance
+    """
+    client = AsyncOdooClient()
+    await client.authenticate()
+    return client
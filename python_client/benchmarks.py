@@ -0,0 +1,283 @@
+"""
+Client micro-benchmarks
+=======================
+
+Runs each client code path against the in-process fake server
+(fakeserver.py) filled with synthetic data (datagen.py), and reports
+records/sec plus p50/p99 run times. Results are appended to a JSON Lines
+history file so regressions show up as deltas against the previous run
+with the same configuration.
+
+Usage:
+    python -m python_client.benchmarks --mos 200000 --latency 0.005 --repeat 5
+    python -m python_client.benchmarks --only search_read_jsonrpc,search_read_columns
+
+Example usage:
+    >>> from python_client.benchmarks import run_benchmarks
+    >>> for result in run_benchmarks(manufacturing_orders=50000, repeat=3):
+    ...     print(result['name'], result['records_per_sec'])
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import platform
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Callable
+
+from .datagen import generate_dataset
+from .fakeserver import FakeOdooServer
+from .odoo_client import OdooClient, MANUFACTURING_ORDER_FIELDS, logger
+
+# Default history file (overridable with ODOO_BENCH_HISTORY)
+DEFAULT_HISTORY_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'odoo_client', 'bench_history.jsonl'
+)
+
+MODEL = 'mrp.production'
+
+
+def _search_read(client: OdooClient) -> int:
+    return len(client.search_read(MODEL, [], MANUFACTURING_ORDER_FIELDS, limit=0))
+
+
+def _search_read_filtered(client: OdooClient) -> int:
+    domain = [('state', 'in', ['confirmed', 'progress']), ('user_id', '!=', False)]
+    return len(client.search_read(MODEL, domain, MANUFACTURING_ORDER_FIELDS, limit=0))
+
+
+def _iter_search_read(client: OdooClient) -> int:
+    return sum(1 for _ in client.iter_search_read(MODEL, [], MANUFACTURING_ORDER_FIELDS, page_size=2000))
+
+
+def _search_read_parallel(client: OdooClient) -> int:
+    return len(client.search_read_parallel(MODEL, [], MANUFACTURING_ORDER_FIELDS, max_workers=4, page_size=2000))
+
+
+def _search_read_stream(client: OdooClient) -> int:
+    return sum(1 for _ in client.search_read_stream(MODEL, [], MANUFACTURING_ORDER_FIELDS))
+
+
+def _search_read_columns(client: OdooClient) -> int:
+    return len(client.search_read_columns(MODEL, [], MANUFACTURING_ORDER_FIELDS))
+
+
+def _as_records(client: OdooClient) -> int:
+    return len(client.search_manufacturing_orders(limit=0, as_records=True))
+
+
+def _read_by_ids(client: OdooClient) -> int:
+    ids = list(range(1, 1001))
+    total = 0
+    for start in range(0, len(ids), 100):
+        total += len(client.read(MODEL, ids[start:start + 100], MANUFACTURING_ORDER_FIELDS))
+    return total
+
+
+def _async_gather(client: OdooClient) -> int:
+    from .async_client import AsyncOdooClient
+    
+    async def run():
+        async with AsyncOdooClient(client.url, client.db, client.username, client.api_key) as async_client:
+            pages = await asyncio.gather(*(
+                async_client.search_read(MODEL, [], MANUFACTURING_ORDER_FIELDS, limit=500, offset=offset)
+                for offset in range(0, 10000, 500)
+            ))
+            return sum(len(page) for page in pages)
+    
+    return asyncio.run(run())
+
+
+# name -> (protocol, function returning the number of records processed)
+BENCHMARKS: Dict[str, tuple] = {
+    'search_read_jsonrpc': ('jsonrpc', _search_read),
+    'search_read_xmlrpc': ('xmlrpc', _search_read),
+    'search_read_filtered': ('jsonrpc', _search_read_filtered),
+    'iter_search_read': ('jsonrpc', _iter_search_read),
+    'search_read_parallel': ('jsonrpc', _search_read_parallel),
+    'search_read_stream': ('jsonrpc', _search_read_stream),
+    'search_read_columns': ('jsonrpc', _search_read_columns),
+    'as_records': ('jsonrpc', _as_records),
+    'read_by_ids': ('jsonrpc', _read_by_ids),
+    'async_gather': ('jsonrpc', _async_gather),
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(-(-q * len(ordered) // 100)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_benchmark(
+    name: str,
+    url: str,
+    db: str,
+    repeat: int = 5,
+    warmup: int = 1
+) -> Dict[str, Any]:
+    """
+    Run one benchmark against a running (fake) server
+    
+    Returns:
+        Result dict with records, run times, p50/p99 and records_per_sec
+    """
+    protocol, func = BENCHMARKS[name]
+    client = OdooClient(url, db, 'admin', 'benchmark', protocol=protocol)
+    client.authenticate()
+    
+    for _ in range(warmup):
+        func(client)
+    
+    durations = []
+    records = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = func(client)
+        durations.append(time.perf_counter() - start)
+    client.close()
+    
+    p50 = percentile(durations, 50)
+    return {
+        'name': name,
+        'protocol': protocol,
+        'records': records,
+        'repeat': repeat,
+        'p50': p50,
+        'p99': percentile(durations, 99),
+        'mean': sum(durations) / len(durations),
+        'records_per_sec': records / p50 if p50 else 0.0,
+    }
+
+
+def run_benchmarks(
+    names: Optional[List[str]] = None,
+    manufacturing_orders: int = 20000,
+    latency: float = 0.0,
+    repeat: int = 5,
+    seed: int = 0,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Start a fake server and run the selected benchmarks
+    
+    Args:
+        names: Benchmarks to run (default: all)
+        manufacturing_orders: Synthetic MOs served by the fake server
+        latency: Seconds added to every request by the fake server
+        repeat: Measured runs per benchmark
+        seed: Data generator seed
+        progress: Called with each result as soon as it is available
+    
+    Returns:
+        List of result dicts
+    """
+    names = names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}. Available: {', '.join(BENCHMARKS)}")
+    
+    data = generate_dataset(manufacturing_orders, seed=seed)
+    results = []
+    with FakeOdooServer(data, latency=latency) as server:
+        for name in names:
+            try:
+                result = run_benchmark(name, server.url, server.db, repeat)
+            except Exception as e:
+                result = {'name': name, 'error': str(e)}
+            result.update({'mos': manufacturing_orders, 'latency': latency})
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def load_history(path: str) -> List[Dict[str, Any]]:
+    """Read previous results from a JSON Lines history file"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def append_history(path: str, results: List[Dict[str, Any]]) -> None:
+    """Append results (stamped with time and environment) to the history file"""
+    stamp = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        for result in results:
+            f.write(json.dumps({**stamp, **result}) + '\n')
+
+
+def _previous(history: List[Dict[str, Any]], result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Last recorded result of the same benchmark and configuration"""
+    for entry in reversed(history):
+        if (entry.get('name') == result['name'] and entry.get('mos') == result['mos']
+                and entry.get('latency') == result['latency'] and 'error' not in entry):
+            return entry
+    return None
+
+
+def format_result(result: Dict[str, Any], previous: Optional[Dict[str, Any]] = None) -> str:
+    """One report line, with the change in records/sec versus a previous run"""
+    if 'error' in result:
+        return f"{result['name']:<22} ERROR: {result['error']}"
+    
+    line = (
+        f"{result['name']:<22} {result['records']:>9} rec  "
+        f"{result['records_per_sec']:>12,.0f} rec/s  "
+        f"p50 {result['p50'] * 1000:>9.1f} ms  p99 {result['p99'] * 1000:>9.1f} ms"
+    )
+    if previous and previous.get('records_per_sec'):
+        change = (result['records_per_sec'] / previous['records_per_sec'] - 1) * 100
+        line += f"  ({change:+.1f}% vs {previous.get('timestamp', 'previous')})"
+    return line
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: python -m python_client.benchmarks"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Benchmark OdooClient code paths against a fake Odoo server")
+    parser.add_argument('--mos', type=int, default=20000, help="manufacturing orders to generate")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument('--repeat', type=int, default=5, help="measured runs per benchmark")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', default='', help="comma-separated benchmark names")
+    parser.add_argument('--history', default=os.getenv('ODOO_BENCH_HISTORY') or DEFAULT_HISTORY_PATH,
+                        help="JSON Lines file results are appended to")
+    parser.add_argument('--no-history', action='store_true', help="do not read or write the history file")
+    args = parser.parse_args(argv)
+    
+    # Keep the per-call INFO logging out of the report
+    logger.setLevel(logging.WARNING)
+    
+    history = [] if args.no_history else load_history(args.history)
+    names = [name.strip() for name in args.only.split(',') if name.strip()] or None
+    
+    print(f"{args.mos} manufacturing orders, {args.latency * 1000:.1f} ms latency, {args.repeat} runs each")
+    results = run_benchmarks(
+        names, args.mos, args.latency, args.repeat, args.seed,
+        progress=lambda result: print(format_result(result, _previous(history, result)), flush=True)
+    )
+    
+    if not args.no_history:
+        append_history(args.history, results)
+        print(f"Results appended to {args.history}")
+    return 1 if any('error' in result for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Read-through record cache
+=========================
+
+Opt-in, in-process cache used by :class:`OdooClient` for models that change
+rarely (products, users, ...).
+
+Features:
+- Entries keyed by (model, id, field set) plus whole ``search_read`` queries
+- Per-model TTLs; models without a TTL are never cached
+- Bounded memory with least-recently-used eviction
+- Hit/miss/eviction counters
+- Invalidation per model, triggered by the client on create/write/unlink
+
+Example usage:
+    >>> from python_client.cache import RecordCache
+    >>> cache = RecordCache(ttls={'product.product': 300, 'res.users': 600})
+    >>> client = OdooClient(cache=cache)
+    >>> client.get_product(15)   # miss -> RPC
+    >>> client.get_product(15)   # hit
+    >>> cache.stats()
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Hashable, Iterable, Callable
+
+from .forksafe import register_fork_reset
+
+
+class RecordCache:
+    """
+    Thread-safe LRU cache with per-model TTLs
+    
+    Values are stored as given; the client stores and returns copies so
+    callers mutating a returned record do not corrupt the cache.
+    """
+    
+    def __init__(
+        self,
+        ttls: Dict[str, float] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache
+        
+        Args:
+            ttls: Time-to-live in seconds per model name
+            default_ttl: TTL for models not listed in ``ttls``
+                (None = do not cache other models)
+            max_entries: Maximum number of cached entries (LRU eviction)
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        
+        self._lock = threading.Lock()
+        register_fork_reset(self)
+        # key -> (expires_at, value); key[0] is always the model name
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._keys_by_model: Dict[str, set] = {}
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock in a forked child (see forksafe)"""
+        self._lock = threading.Lock()
+    
+    def ttl_for(self, model: str) -> Optional[float]:
+        """Return the TTL configured for a model (None = not cached)"""
+        return self.ttls.get(model, self.default_ttl)
+    
+    def is_cached(self, model: str) -> bool:
+        """Whether records of this model are cached at all"""
+        ttl = self.ttl_for(model)
+        return ttl is not None and ttl > 0
+    
+    # ==================== Records ====================
+    
+    @staticmethod
+    def fields_key(fields: Optional[Iterable[str]]) -> Optional[frozenset]:
+        """Normalize a field list into a hashable, order-independent key"""
+        return frozenset(fields) if fields else None
+    
+    def get_record(self, model: str, record_id: int, fields: Optional[Iterable[str]]) -> Optional[Any]:
+        """Return a cached record or None (counts a hit or a miss)"""
+        return self._get((model, 'record', record_id, self.fields_key(fields)))
+    
+    def set_record(self, model: str, record_id: int, fields: Optional[Iterable[str]], record: Any) -> None:
+        """Cache a record read with the given field set"""
+        self._set((model, 'record', record_id, self.fields_key(fields)), record)
+    
+    # ==================== Queries ====================
+    
+    def get_query(self, model: str, query_key: Hashable) -> Optional[Any]:
+        """Return a cached query result (e.g. a search_read page) or None"""
+        return self._get((model, 'query', query_key))
+    
+    def set_query(self, model: str, query_key: Hashable, result: Any) -> None:
+        """Cache a query result"""
+        self._set((model, 'query', query_key), result)
+    
+    # ==================== Maintenance ====================
+    
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """
+        Drop cached entries
+        
+        Args:
+            model: Model whose entries are dropped (None = everything)
+        """
+        with self._lock:
+            if model is None:
+                self._entries.clear()
+                self._keys_by_model.clear()
+            else:
+                for key in self._keys_by_model.pop(model, ()):
+                    self._entries.pop(key, None)
+            self.invalidations += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _get(self, key: tuple) -> Optional[Any]:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def _set(self, key: tuple, value: Any) -> None:
+        model = key[0]
+        ttl = self.ttl_for(model)
+        if ttl is None or ttl <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            self._keys_by_model.setdefault(model, set()).add(key)
+            
+            while len(self._entries) > self.max_entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self._discard_model_key(oldest)
+                self.evictions += 1
+    
+    def _remove(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+        self._discard_model_key(key)
+    
+    def _discard_model_key(self, key: tuple) -> None:
+        keys = self._keys_by_model.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_model[key[0]]
@@ -0,0 +1,313 @@
+"""
+JSON codecs and streaming response parsing
+==========================================
+
+- Pluggable JSON codec used by the JSON-RPC transports. ``get_codec('auto')``
+  picks the fastest installed library (orjson, then ujson) and falls back
+  to the standard library. Every codec encodes ``datetime``/``date``
+  arguments as Odoo's server-side strings (UTC, ``'%Y-%m-%d %H:%M:%S'``).
+- ``iter_jsonrpc_result``: incremental parser for JSON-RPC response bodies
+  that yields the elements of a ``result`` array one at a time, so large
+  ``search_read`` responses never have to be held in memory as a whole body
+  plus a fully parsed list.
+
+Example usage:
+    >>> codec = get_codec()
+    >>> codec.name
+    'orjson'
+    >>> for record in iter_jsonrpc_result(response.iter_content(65536), codec):
+    ...     handle(record)
+"""
+
+import re
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+from .exceptions import OdooAPIError
+
+# Odoo server-side date/datetime string formats
+ODOO_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+ODOO_DATE_FORMAT = '%Y-%m-%d'
+
+
+def _encode_default(obj: Any) -> str:
+    """Encode values the JSON libraries do not handle the way Odoo expects"""
+    if isinstance(obj, datetime):
+        # Odoo stores naive UTC datetimes
+        if obj.tzinfo is not None:
+            obj = obj.astimezone(timezone.utc)
+        return obj.strftime(ODOO_DATETIME_FORMAT)
+    if isinstance(obj, date):
+        return obj.strftime(ODOO_DATE_FORMAT)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """Standard library codec (always available)"""
+    
+    name = 'json'
+    
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), default=_encode_default).encode('utf-8')
+    
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson codec (fastest; serializes straight to bytes)"""
+    
+    name = 'orjson'
+    
+    def dumps(self, obj: Any) -> bytes:
+        # orjson writes datetimes in ISO format ('T' separator, offset) unless passed through
+        return orjson.dumps(obj, default=_encode_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson codec"""
+    
+    name = 'ujson'
+    
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, default=_encode_default).encode('utf-8')
+    
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        if isinstance(data, bytearray):
+            data = bytes(data)
+        return ujson.loads(data)
+
+
+_CODECS = {
+    'orjson': (OrjsonCodec, lambda: orjson is not None),
+    'ujson': (UjsonCodec, lambda: ujson is not None),
+    'json': (JSONCodec, lambda: True),
+}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = 'auto') -> JSONCodec:
+    """
+    Resolve a codec instance
+    
+    Args:
+        codec: 'auto' (fastest installed), 'orjson', 'ujson', 'json',
+            or a JSONCodec instance
+    
+    Returns:
+        JSONCodec instance
+    
+    Raises:
+        OdooAPIError: If the requested library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    
+    name = (codec or 'auto').lower()
+    if name == 'auto':
+        for codec_class, available in _CODECS.values():
+            if available():
+                return codec_class()
+    
+    if name not in _CODECS:
+        raise OdooAPIError(f"Unknown JSON codec: {codec}. Use one of: auto, {', '.join(_CODECS)}")
+    
+    codec_class, available = _CODECS[name]
+    if not available():
+        raise OdooAPIError(f"JSON codec '{name}' requested but not installed (pip install {name})")
+    return codec_class()
+
+
+# ==================== Streaming parser ====================
+
+_WHITESPACE = b' \t\r\n'
+_STRUCTURAL = re.compile(rb'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb'[,\]}\s]')
+
+# Consumed bytes are dropped from the buffer once they exceed this size
+_COMPACT_THRESHOLD = 1 << 20
+
+
+class _StreamParser:
+    """
+    Incremental scanner over a JSON-RPC response object
+    
+    Only the structure needed to split the ``result`` array into elements is
+    tracked; each element is decoded with the configured codec.
+    """
+    
+    def __init__(self, chunks: Iterable[bytes], codec: JSONCodec):
+        self._chunks = iter(chunks)
+        self._codec = codec
+        self._buf = bytearray()
+        self._pos = 0
+    
+    # ---- buffer management ----
+    
+    def _fill(self) -> bool:
+        """Append the next non-empty chunk; False at end of stream"""
+        for chunk in self._chunks:
+            if chunk:
+                self._buf += chunk
+                return True
+        return False
+    
+    def _peek(self) -> Optional[int]:
+        """Skip whitespace and return the next byte (without consuming it)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return None
+    
+    def _expect(self, allowed: bytes) -> int:
+        char = self._peek()
+        if char is None or char not in allowed:
+            found = 'end of stream' if char is None else repr(chr(char))
+            raise OdooAPIError(f"Invalid JSON response: expected one of {allowed.decode()!r}, got {found}")
+        self._pos += 1
+        return char
+    
+    # ---- value scanning ----
+    
+    def _value_end(self) -> int:
+        """Return the end offset of the value starting at self._pos, reading more data as needed"""
+        start = self._pos
+        first = self._buf[start]
+        
+        if first not in b'{["':
+            # number / true / false / null
+            while True:
+                match = _SCALAR_END.search(self._buf, start)
+                if match:
+                    return match.start()
+                if not self._fill():
+                    return len(self._buf)
+        
+        depth = 0
+        in_string = False
+        i = start
+        while True:
+            pattern = _STRING_SPECIAL if in_string else _STRUCTURAL
+            match = pattern.search(self._buf, i)
+            if match is None:
+                i = len(self._buf)
+                if not self._fill():
+                    raise OdooAPIError("Invalid JSON response: truncated body")
+                continue
+            
+            j = match.start()
+            char = self._buf[j]
+            if in_string:
+                if char == 0x5c:  # backslash escape
+                    if j + 1 >= len(self._buf) and not self._fill():
+                        raise OdooAPIError("Invalid JSON response: truncated body")
+                    i = j + 2
+                    continue
+                in_string = False
+                i = j + 1
+                if depth == 0:
+                    return i
+            elif char == 0x22:  # opening quote
+                in_string = True
+                i = j + 1
+            elif char in b'[{':
+                depth += 1
+                i = j + 1
+            else:
+                depth -= 1
+                i = j + 1
+                if depth == 0:
+                    return i
+    
+    def _read_value(self) -> Any:
+        if self._peek() is None:
+            raise OdooAPIError("Invalid JSON response: truncated body")
+        end = self._value_end()
+        try:
+            value = self._codec.loads(self._buf[self._pos:end])
+        except ValueError as e:
+            raise OdooAPIError(f"Invalid JSON response: {str(e)}")
+        self._pos = end
+        
+        # Drop consumed bytes between values (never while scanning one)
+        if self._pos > _COMPACT_THRESHOLD:
+            del self._buf[:self._pos]
+            self._pos = 0
+        return value
+    
+    # ---- response walking ----
+    
+    def iter_result(self) -> Iterator[Any]:
+        self._expect(b'{')
+        if self._peek() == ord('}'):
+            return
+        
+        while True:
+            key = self._read_value()
+            self._expect(b':')
+            
+            if key == 'error':
+                error = self._read_value()
+                error_msg = (error.get('data') or {}).get('message') or error.get('message', 'Unknown error')
+                raise OdooAPIError(f"JSON-RPC Error: {error_msg}")
+            
+            if key == 'result':
+                if self._peek() == ord('['):
+                    self._pos += 1
+                    yield from self._iter_array()
+                else:
+                    result = self._read_value()
+                    if isinstance(result, list):
+                        yield from result
+                    elif result is not None:
+                        yield result
+            else:
+                self._read_value()
+            
+            if self._expect(b',}') == ord('}'):
+                return
+    
+    def _iter_array(self) -> Iterator[Any]:
+        if self._peek() == ord(']'):
+            self._pos += 1
+            return
+        
+        while True:
+            yield self._read_value()
+            if self._expect(b',]') == ord(']'):
+                return
+
+
+def iter_jsonrpc_result(chunks: Iterable[bytes], codec: Optional[JSONCodec] = None) -> Iterator[Any]:
+    """
+    Stream the elements of a JSON-RPC ``result`` array
+    
+    Args:
+        chunks: Raw response body chunks (e.g. ``response.iter_content()``)
+        codec: Codec used to decode each element (default: get_codec())
+    
+    Yields:
+        Decoded elements of the result array (a non-array result is yielded
+        as a single item)
+    
+    Raises:
+        OdooAPIError: On a JSON-RPC error object or malformed body
+    """
+    return _StreamParser(chunks, codec or get_codec()).iter_result()
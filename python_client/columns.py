@@ -0,0 +1,377 @@
+"""
+Columnar search_read results
+============================
+
+Builds a column store from ``search_read`` records so KPI code can aggregate
+over typed arrays instead of looping over tens of thousands of dicts.
+
+Column types are inferred from the first non-empty value of each field:
+- integers / floats -> ``array('q')`` / ``array('d')`` (NaN for empty floats)
+- booleans -> ``array('b')``
+- date / datetime strings -> seconds since the epoch (UTC) in ``array('d')``
+  (NaN for empty), or ``datetime64[s]`` with NaT under NumPy
+- many2one ``[id, name]`` pairs -> an id column (0 for empty) named after the
+  field plus a ``<field>.name`` column
+- categorical fields (``state`` by default) -> ``array('i')`` codes
+  (-1 for empty) and a list of categories
+- anything else (char, text, x2many id lists) -> plain list
+
+With NumPy installed every typed column is returned as an ``ndarray``.
+
+Example usage:
+    >>> cols = client.search_read_columns(
+    ...     'mrp.production', [], ['product_qty', 'qty_produced', 'state', 'product_id'])
+    >>> done = cols['state'] == cols.category_code('state', 'done')   # NumPy
+    >>> cols['qty_produced'][done].sum()
+"""
+
+import re
+import math
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .exceptions import OdooAPIError
+
+# Fields stored as categorical codes unless overridden
+DEFAULT_CATEGORICAL_FIELDS = ('state',)
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2}(\.\d+)?)?$')
+_NAN = float('nan')
+
+
+def parse_odoo_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse an Odoo date/datetime string ('YYYY-MM-DD[ HH:MM:SS]', UTC)
+    
+    Returns:
+        Naive datetime, or None for empty values (False/None/'')
+    """
+    if not value:
+        return None
+    return datetime.fromisoformat(value)
+
+
+def _epoch_seconds(value: str) -> float:
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+class _ColumnBuilder:
+    """Accumulates one field into a typed buffer, inferring the type lazily"""
+    
+    def __init__(self, name: str, categorical: bool):
+        self.name = name
+        self.categorical = categorical
+        self.kind = None
+        # Empty values seen before the type was known
+        self.leading_empty = 0
+        self.data = None
+        self.names = None
+        self.categories = None
+    
+    def append(self, value: Any) -> None:
+        if self.kind is None:
+            if value is False or value is None:
+                self.leading_empty += 1
+                return
+            self._start(value)
+        
+        try:
+            self._append(value)
+        except (TypeError, ValueError):
+            # Value does not fit the inferred type: keep the column as a list
+            self._to_objects()
+            self.data.append(value)
+    
+    def _start(self, value: Any) -> None:
+        if self.categorical:
+            self.kind = 'category'
+            self.data = array('i')
+            self.categories = {}
+        elif isinstance(value, bool):
+            self.kind = 'bool'
+            self.data = array('b')
+        elif isinstance(value, int):
+            self.kind = 'int'
+            self.data = array('q')
+        elif isinstance(value, float):
+            self.kind = 'float'
+            self.data = array('d')
+        elif isinstance(value, str) and _DATE_RE.match(value):
+            self.kind = 'datetime'
+            self.data = array('d')
+        elif (isinstance(value, (list, tuple)) and len(value) == 2
+              and isinstance(value[0], int) and not isinstance(value[0], bool)
+              and isinstance(value[1], str)):
+            self.kind = 'many2one'
+            self.data = array('q')
+            self.names = []
+            # Repeated display names share one string object
+            self._name_pool = {}
+        else:
+            self.kind = 'object'
+            self.data = []
+        
+        for _ in range(self.leading_empty):
+            self._append(False)
+    
+    def _append(self, value: Any) -> None:
+        kind = self.kind
+        empty = value is False or value is None
+        
+        if kind == 'float':
+            self.data.append(_NAN if empty else float(value))
+        elif kind == 'int':
+            if isinstance(value, float):
+                self.kind = 'float'
+                self.data = array('d', self.data)
+                self.data.append(value)
+            elif isinstance(value, str):
+                raise TypeError(value)
+            else:
+                self.data.append(0 if empty else value)
+        elif kind == 'datetime':
+            self.data.append(_NAN if empty else _epoch_seconds(value))
+        elif kind == 'many2one':
+            if empty:
+                self.data.append(0)
+                self.names.append(None)
+            else:
+                record_id, display_name = value
+                self.data.append(record_id)
+                self.names.append(self._name_pool.setdefault(display_name, display_name))
+        elif kind == 'category':
+            if empty:
+                self.data.append(-1)
+            else:
+                self.data.append(self.categories.setdefault(value, len(self.categories)))
+        elif kind == 'bool':
+            if not isinstance(value, bool) and not empty:
+                raise TypeError(value)
+            self.data.append(1 if value else 0)
+        else:
+            self.data.append(value)
+    
+    def _to_objects(self) -> None:
+        """Convert the buffer back to Python values in a plain list"""
+        if self.kind == 'object':
+            return
+        values = _decode(self.kind, self.data, self.names, self.categories_list())
+        self.kind = 'object'
+        self.data = values
+        self.names = None
+        self.categories = None
+    
+    def categories_list(self) -> Optional[List[Any]]:
+        if self.categories is None:
+            return None
+        return list(self.categories)
+    
+    def finish(self, use_numpy: bool) -> Dict[str, Any]:
+        """Return {column name: values} for this field"""
+        if self.kind is None:
+            # Only empty values: nothing to infer a type from
+            return {self.name: [False] * self.leading_empty}
+        
+        data = self.data
+        if use_numpy:
+            data = _to_numpy(self.kind, data)
+        
+        columns = {self.name: data}
+        if self.kind == 'many2one':
+            columns[f"{self.name}.name"] = self.names
+        return columns
+
+
+def _to_numpy(kind: str, data: Any) -> Any:
+    if kind == 'int' or kind == 'many2one':
+        return np.frombuffer(data, dtype=np.int64) if len(data) else np.zeros(0, dtype=np.int64)
+    if kind == 'float':
+        return np.frombuffer(data, dtype=np.float64) if len(data) else np.zeros(0, dtype=np.float64)
+    if kind == 'bool':
+        return np.frombuffer(data, dtype=np.int8).astype(bool) if len(data) else np.zeros(0, dtype=bool)
+    if kind == 'category':
+        return np.frombuffer(data, dtype=np.int32) if len(data) else np.zeros(0, dtype=np.int32)
+    if kind == 'datetime':
+        seconds = np.frombuffer(data, dtype=np.float64) if len(data) else np.zeros(0, dtype=np.float64)
+        result = np.full(len(seconds), np.datetime64('NaT'), dtype='datetime64[s]')
+        present = ~np.isnan(seconds)
+        result[present] = seconds[present].astype(np.int64).astype('datetime64[s]')
+        return result
+    return data
+
+
+def _decode(kind: str, data: Any, names: Optional[List[str]], categories: Optional[List[Any]]) -> List[Any]:
+    """Turn a typed buffer back into Odoo-style values"""
+    if kind == 'float':
+        return [False if math.isnan(v) else v for v in data]
+    if kind == 'bool':
+        return [bool(v) for v in data]
+    if kind == 'datetime':
+        return [
+            False if math.isnan(v)
+            else datetime.fromtimestamp(v, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            for v in data
+        ]
+    if kind == 'many2one':
+        return [[v, n] if v else False for v, n in zip(data, names)]
+    if kind == 'category':
+        return [categories[v] if v >= 0 else False for v in data]
+    return list(data)
+
+
+class ColumnStore:
+    """
+    Column-oriented view of a search_read result
+    
+    Columns are indexed by field name (``store['product_qty']``); many2one
+    fields additionally expose their display names under ``'<field>.name'``.
+    """
+    
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        length: int,
+        kinds: Dict[str, str],
+        categories: Dict[str, List[Any]],
+        is_numpy: bool
+    ):
+        self.columns = columns
+        self.kinds = kinds
+        self.categories = categories
+        self.is_numpy = is_numpy
+        self._length = length
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KeyError(f"No column '{name}' (available: {', '.join(self.columns)})")
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+    
+    def keys(self) -> List[str]:
+        """Column names"""
+        return list(self.columns)
+    
+    def rename(self, names: Dict[str, str]) -> 'ColumnStore':
+        """Return a store with fields renamed ({old: new}), sharing the buffers"""
+        def new_name(column: str) -> str:
+            field, dot, suffix = column.partition('.')
+            return f"{names.get(field, field)}{dot}{suffix}"
+        
+        return ColumnStore(
+            {new_name(column): data for column, data in self.columns.items()},
+            self._length,
+            {names.get(field, field): kind for field, kind in self.kinds.items()},
+            {names.get(field, field): values for field, values in self.categories.items()},
+            self.is_numpy
+        )
+    
+    def category_code(self, field: str, value: Any) -> int:
+        """Code of a categorical value (-1 if it does not occur)"""
+        try:
+            return self.categories[field].index(value)
+        except ValueError:
+            return -1
+    
+    def decode(self, field: str) -> List[Any]:
+        """Return a column as Odoo-style Python values (False for empty)"""
+        kind = self.kinds.get(field, 'object')
+        data = self.columns[field]
+        if self.is_numpy and kind == 'datetime':
+            data = [
+                _NAN if np.isnat(v) else float(v.astype('datetime64[s]').astype(np.int64))
+                for v in data
+            ]
+        return _decode(kind, data, self.columns.get(f"{field}.name"), self.categories.get(field))
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Rebuild the list-of-dicts representation"""
+        fields = list(self.kinds)
+        decoded = [self.decode(field) for field in fields]
+        return [dict(zip(fields, values)) for values in zip(*decoded)] if fields else []
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of the typed buffers in bytes (lists excluded)"""
+        total = 0
+        for data in self.columns.values():
+            if hasattr(data, 'nbytes'):
+                total += data.nbytes
+            elif isinstance(data, array):
+                total += data.itemsize * len(data)
+        return total
+    
+    def __repr__(self) -> str:
+        return f"ColumnStore({self._length} rows, columns={self.keys()})"
+
+
+def build_columns(
+    records: Iterable[Dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+    categorical: Iterable[str] = DEFAULT_CATEGORICAL_FIELDS,
+    use_numpy: Optional[bool] = None
+) -> ColumnStore:
+    """
+    Build a ColumnStore from an iterable of records
+    
+    Records are consumed one at a time, so a streamed response is never
+    materialized as a list of dicts.
+    
+    Args:
+        records: Record dictionaries (e.g. from search_read_stream)
+        fields: Columns to build (default: the keys of the first record)
+        categorical: Fields stored as categorical codes
+        use_numpy: Return NumPy arrays (default: if NumPy is installed)
+    
+    Returns:
+        ColumnStore
+    
+    Raises:
+        OdooAPIError: If NumPy is requested but not installed
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise OdooAPIError(
+            "NumPy columns require the 'numpy' package.\n"
+            "Install with: pip install numpy"
+        )
+    
+    categorical = set(categorical or ())
+    builders = None
+    length = 0
+    
+    for record in records:
+        if builders is None:
+            names = list(fields) if fields else list(record)
+            if 'id' not in names and 'id' in record:
+                names.insert(0, 'id')
+            builders = [_ColumnBuilder(name, name in categorical) for name in names]
+        for builder in builders:
+            builder.append(record.get(builder.name, False))
+        length += 1
+    
+    if builders is None:
+        builders = [_ColumnBuilder(name, name in categorical) for name in (fields or [])]
+    
+    columns = {}
+    kinds = {}
+    categories = {}
+    for builder in builders:
+        columns.update(builder.finish(use_numpy))
+        kinds[builder.name] = builder.kind or 'object'
+        if builder.kind == 'category':
+            categories[builder.name] = builder.categories_list()
+    
+    return ColumnStore(columns, length, kinds, categories, use_numpy)
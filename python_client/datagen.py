@@ -0,0 +1,245 @@
+"""
+Synthetic Odoo data
+===================
+
+Generates realistic ``mrp.production``, ``product.product`` and
+``res.users`` rows (in the shapes ``search_read`` returns) for the fake
+server and the benchmarks. Generation is deterministic for a given seed.
+The ``iter_*`` generators yield one row at a time; ``generate_dataset``
+collects them into the in-memory ``{model: {id: record}}`` tables the fake
+server serves, so its memory use grows with the number of rows.
+
+Example usage:
+    >>> from python_client.datagen import generate_dataset
+    >>> data = generate_dataset(manufacturing_orders=1_000_000, seed=42)
+    >>> len(data['mrp.production'])
+    1000000
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, Optional
+
+from .odoo_client import ODOO_DATETIME_FORMAT
+
+# many2one fields and the model they point to
+RELATIONS = {
+    'mrp.production': {
+        'product_id': 'product.product',
+        'product_uom_id': 'uom.uom',
+        'user_id': 'res.users',
+        'company_id': 'res.company',
+        'bom_id': 'mrp.bom',
+    },
+    'product.product': {
+        'categ_id': 'product.category',
+        'uom_id': 'uom.uom',
+    },
+    'res.users': {
+        'company_id': 'res.company',
+    },
+}
+
+# one2many / many2many fields: (type, model they point to)
+X2MANY_RELATIONS = {
+    'mrp.production': {
+        'move_raw_ids': ('one2many', 'stock.move'),
+        'move_finished_ids': ('one2many', 'stock.move'),
+    },
+    'res.users': {
+        'groups_id': ('many2many', 'res.groups'),
+    },
+}
+
+# fields_get attributes that cannot be inferred from the generated values
+FIELD_ATTRIBUTES = {
+    'mrp.production': {
+        'state': {'type': 'selection'},
+        'priority': {'type': 'selection'},
+    },
+    'product.product': {
+        'description': {'type': 'text'},
+        'type': {'type': 'selection'},
+        'qty_available': {'store': False},
+        'virtual_available': {'store': False},
+    },
+    'res.users': {
+        'lang': {'type': 'selection'},
+    },
+}
+
+# Weighted state distribution of a live shop floor
+MO_STATES = (
+    ('draft', 10), ('confirmed', 25), ('progress', 20),
+    ('to_close', 5), ('done', 35), ('cancel', 5),
+)
+
+COMPANY = [1, 'My Company']
+UNIT = [1, 'Units']
+CATEGORIES = [[1, 'All'], [2, 'All / Saleable'], [3, 'All / Components'], [4, 'All / Finished Goods']]
+
+_PRODUCT_NOUNS = (
+    'Table', 'Chair', 'Cabinet', 'Desk', 'Shelf', 'Drawer', 'Bench', 'Stool',
+    'Frame', 'Panel', 'Bracket', 'Hinge', 'Leg', 'Top', 'Door', 'Handle',
+)
+_PRODUCT_ADJECTIVES = (
+    'Oak', 'Steel', 'Walnut', 'Pine', 'Aluminium', 'Glass', 'Compact',
+    'Large', 'Modular', 'Office', 'Outdoor', 'Premium',
+)
+_FIRST_NAMES = (
+    'Alice', 'Bilel', 'Chen', 'Dina', 'Emil', 'Fatma', 'Goran', 'Hana',
+    'Ines', 'Jonas', 'Karim', 'Lea', 'Mehdi', 'Nora', 'Omar', 'Sara',
+)
+_LAST_NAMES = (
+    'Ben Ali', 'Dubois', 'Garcia', 'Haddad', 'Jensen', 'Kim', 'Martin',
+    'Mansour', 'Novak', 'Rossi', 'Schmidt', 'Trabelsi', 'Weber', 'Zhang',
+)
+
+
+def iter_users(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield ``res.users`` rows with ids 1..count (id 1 is the admin)"""
+    rng = random.Random(f"users-{seed}")
+    for user_id in range(1, count + 1):
+        if user_id == 1:
+            name, login = 'Administrator', 'admin'
+        else:
+            name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+            login = f"{name.lower().replace(' ', '.')}.{user_id}@example.com"
+        yield {
+            'id': user_id,
+            'name': name,
+            'login': login,
+            'email': login if '@' in login else 'admin@example.com',
+            'active': rng.random() > 0.05,
+            'company_id': COMPANY,
+            'groups_id': [1, 2] if user_id == 1 else [1],
+            'lang': 'en_US',
+            'write_date': '2024-01-01 08:00:00',
+            'create_date': '2024-01-01 08:00:00',
+        }
+
+
+def iter_products(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield ``product.product`` rows with ids 1..count"""
+    rng = random.Random(f"products-{seed}")
+    for product_id in range(1, count + 1):
+        name = f"{rng.choice(_PRODUCT_ADJECTIVES)} {rng.choice(_PRODUCT_NOUNS)}"
+        cost = round(rng.uniform(2, 400), 2)
+        on_hand = float(rng.randint(0, 500))
+        yield {
+            'id': product_id,
+            'name': name,
+            'default_code': f"FURN_{product_id:05d}",
+            'barcode': f"{rng.randint(10**12, 10**13 - 1)}",
+            'list_price': round(cost * rng.uniform(1.2, 2.5), 2),
+            'standard_price': cost,
+            'type': 'product',
+            'categ_id': rng.choice(CATEGORIES),
+            'uom_id': UNIT,
+            'qty_available': on_hand,
+            'virtual_available': on_hand + rng.randint(-50, 200),
+            'description': False,
+            'active': rng.random() > 0.03,
+            'write_date': '2024-01-01 08:00:00',
+            'create_date': '2024-01-01 08:00:00',
+        }
+
+
+def iter_manufacturing_orders(
+    count: int,
+    products: int,
+    users: int,
+    seed: int = 0,
+    start: Optional[datetime] = None,
+    span_days: int = 365
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ``mrp.production`` rows with ids 1..count
+    
+    Args:
+        count: Number of manufacturing orders
+        products: Number of products they reference (ids 1..products)
+        users: Number of users they reference (ids 1..users)
+        seed: Random seed
+        start: First planned start date (default: 2024-01-01)
+        span_days: Planned start dates are spread over this many days
+    """
+    rng = random.Random(f"mos-{seed}")
+    start = start or datetime(2024, 1, 1, 8, 0, 0)
+    states = [state for state, _ in MO_STATES]
+    weights = [weight for _, weight in MO_STATES]
+    product_names = {row['id']: row['name'] for row in iter_products(products, seed)}
+    user_names = {row['id']: row['name'] for row in iter_users(users, seed)}
+    span_seconds = span_days * 86400
+    
+    for mo_id in range(1, count + 1):
+        state = rng.choices(states, weights)[0]
+        product_id = rng.randint(1, products)
+        qty = float(rng.choice((1, 2, 5, 10, 10, 20, 25, 50, 100)))
+        
+        planned = start + timedelta(seconds=rng.randrange(span_seconds))
+        deadline = planned + timedelta(hours=rng.randint(4, 24 * 14))
+        written = planned + timedelta(hours=rng.randint(0, 24 * 20))
+        
+        finished = None
+        if state == 'done':
+            produced = qty
+            # Most orders finish before their deadline, some run late
+            finished = planned + timedelta(hours=rng.randint(2, 24 * 16))
+        elif state in ('progress', 'to_close'):
+            produced = float(int(qty * rng.uniform(0.1, 1.0)))
+        else:
+            produced = 0.0
+        
+        user_id = rng.randint(1, users) if rng.random() > 0.1 else None
+        
+        yield {
+            'id': mo_id,
+            'name': f"WH/MO/{mo_id:05d}",
+            'product_id': [product_id, product_names[product_id]],
+            'product_qty': qty,
+            'product_uom_id': UNIT,
+            'state': state,
+            'date_planned_start': planned.strftime(ODOO_DATETIME_FORMAT),
+            'date_deadline': deadline.strftime(ODOO_DATETIME_FORMAT) if rng.random() > 0.05 else False,
+            'priority': '1' if rng.random() < 0.15 else '0',
+            'user_id': [user_id, user_names[user_id]] if user_id else False,
+            'company_id': COMPANY,
+            'origin': f"S{rng.randint(1, count // 3 + 1):05d}" if rng.random() < 0.6 else False,
+            'qty_produced': produced,
+            'qty_producing': produced if state in ('progress', 'to_close') else 0.0,
+            'date_finished': finished.strftime(ODOO_DATETIME_FORMAT) if finished else False,
+            'bom_id': [product_id, f"BoM {product_names[product_id]}"],
+            'move_raw_ids': [],
+            'move_finished_ids': [],
+            'write_date': written.strftime(ODOO_DATETIME_FORMAT),
+            'create_date': planned.strftime(ODOO_DATETIME_FORMAT),
+        }
+
+
+def generate_dataset(
+    manufacturing_orders: int = 10000,
+    products: int = 500,
+    users: int = 50,
+    seed: int = 0
+) -> Dict[str, Dict[int, Dict[str, Any]]]:
+    """
+    Build a complete dataset for the fake server
+    
+    Args:
+        manufacturing_orders: Number of ``mrp.production`` rows
+        products: Number of ``product.product`` rows
+        users: Number of ``res.users`` rows
+        seed: Random seed
+    
+    Returns:
+        {model: {id: record}}
+    """
+    return {
+        'res.users': {row['id']: row for row in iter_users(users, seed)},
+        'product.product': {row['id']: row for row in iter_products(products, seed)},
+        'mrp.production': {
+            row['id']: row
+            for row in iter_manufacturing_orders(manufacturing_orders, products, users, seed)
+        },
+    }
@@ -0,0 +1,648 @@
+"""
+Local domain evaluation
+=======================
+
+Evaluates Odoo domains against records held in memory, so repeated filter
+queries can be answered without an RPC.
+
+- ``compile_domain`` turns a prefix-notation domain (``&``, ``|``, ``!``,
+  implicit AND) into a predicate; supported operators are ``=``, ``!=``,
+  ``<>``, ``in``, ``not in``, ``<``, ``<=``, ``>``, ``>=``, ``like``,
+  ``ilike``, ``not like``, ``not ilike``, ``=like`` and ``=ilike``
+- many2one values (``[id, name]``) compare by id, and by display name for the
+  ``like`` operators; x2many id lists match ``=``/``in`` when any id matches
+- a date-only operand compared with a datetime value is read the way Odoo
+  reads it: ``'2024-03-01 23:59:59'`` for ``>`` and ``<=``, ``00:00:00``
+  otherwise
+- ``sort_records`` follows PostgreSQL: empty values sort last ascending and
+  first descending
+- ``RecordIndex`` keeps records by id with hash indexes (equality / ``in``)
+  and sorted indexes (range comparisons) on hot fields, and only evaluates
+  the full domain on the candidates the indexes leave
+
+Domains the evaluator cannot answer exactly (dotted paths such as
+``product_id.categ_id``, ``child_of``, many2one names as operands, ordering
+on many2one fields, ...) raise :class:`DomainError`, so callers can fall back
+to the server.
+
+Example usage:
+    >>> from python_client.domain import RecordIndex
+    >>> index = RecordIndex(client.search_read('mrp.production', [], fields, limit=0))
+    >>> index.search([('state', 'in', ['confirmed', 'progress']), ('user_id', '=', 7)])
+    >>> index.count(['|', ('date_deadline', '<', '2024-03-01'), ('priority', '=', '1')])
+"""
+
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Iterable, Callable
+
+from .forksafe import register_fork_reset
+
+# Fields indexed by RecordIndex unless overridden
+DEFAULT_HASH_FIELDS = ('state', 'user_id', 'product_id')
+DEFAULT_SORTED_FIELDS = ('date_deadline',)
+
+# Changes per upsert/remove call above which sorted indexes are rebuilt
+# lazily instead of updated in place
+SORTED_REBUILD_THRESHOLD = 1000
+
+_RANGE_OPERATORS = ('<', '<=', '>', '>=')
+_LIKE_OPERATORS = ('like', 'ilike', 'not like', 'not ilike', '=like', '=ilike')
+
+_DATE_ONLY = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+class DomainError(ValueError):
+    """Domain that cannot be evaluated locally"""
+
+
+def _is_many2one(value: Any) -> bool:
+    return (isinstance(value, (list, tuple)) and len(value) == 2
+            and isinstance(value[0], int) and isinstance(value[1], str))
+
+
+def _key(value: Any) -> Any:
+    """Comparable form of a field value (many2one pairs compare by id, empty is False)"""
+    if value is None:
+        return False
+    if _is_many2one(value):
+        return value[0]
+    return value
+
+
+def _empty(value: Any) -> bool:
+    return value is False or value is None or value == []
+
+
+def _operand(value: Any) -> Any:
+    """Domain value in the form Odoo returns field values (dates as strings)"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def datetime_bound(operator: str, value: Any) -> Any:
+    """
+    Operand as Odoo compares it with a datetime field
+    
+    A date-only string means the end of that day for '>' and '<=', and its
+    start for every other operator; other values are returned unchanged.
+    """
+    if isinstance(value, str) and _DATE_ONLY.fullmatch(value):
+        return value + (' 23:59:59' if operator in ('>', '<=') else ' 00:00:00')
+    return value
+
+
+def _is_datetime(value: Any) -> bool:
+    return isinstance(value, str) and len(value) > 10 and _DATE_ONLY.match(value) is not None
+
+
+def _reject_name_operand(field: str, value: Any) -> None:
+    """Odoo name-searches non-id operands of relational fields: leave that to the server"""
+    if isinstance(value, str):
+        raise DomainError(f"Cannot match '{field}' against the name {value!r} locally")
+
+
+def _like_pattern(operator: str, value: Any) -> 're.Pattern':
+    text = str(value)
+    if operator in ('=like', '=ilike'):
+        # SQL wildcards, anchored
+        parts = (re.escape(part) for part in re.split(r'([%_])', text))
+        pattern = ''.join({'%': '.*', '_': '.'}.get(part, part) for part in parts if part)
+        pattern = f"^{pattern}$"
+    else:
+        pattern = re.escape(text)
+    return re.compile(pattern, (re.IGNORECASE if 'ilike' in operator else 0) | re.DOTALL)
+
+
+def _compile_leaf(leaf: Any) -> Callable[[Dict[str, Any]], bool]:
+    if not isinstance(leaf, (list, tuple)) or len(leaf) != 3:
+        raise DomainError(f"Invalid domain term: {leaf!r}")
+    field, operator, value = leaf
+    
+    # Odoo's TRUE_LEAF / FALSE_LEAF
+    if field in (1, 0) and operator == '=' and value == 1:
+        return (lambda record: True) if field == 1 else (lambda record: False)
+    if not isinstance(field, str) or '.' in field:
+        raise DomainError(f"Cannot evaluate '{field}' locally")
+    
+    operator = operator.lower()
+    if operator == '<>':
+        operator = '!='
+    value = _operand(value)
+    
+    if operator in ('=', '!='):
+        if value is False or value is None:
+            def equals(record):
+                return _empty(record.get(field, False))
+        else:
+            bound = datetime_bound(operator, value)
+            
+            def equals(record):
+                actual = record.get(field, False)
+                if isinstance(actual, list):
+                    _reject_name_operand(field, value)
+                if isinstance(actual, list) and not _is_many2one(actual):
+                    return value in actual
+                if _is_datetime(actual):
+                    return actual == bound
+                return _key(actual) == value
+        if operator == '=':
+            return equals
+        return lambda record: not equals(record)
+    
+    if operator in ('in', 'not in'):
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            value = [value]
+        values = {_operand(v) for v in value if v is not False and v is not None}
+        with_empty = any(v is False or v is None for v in value)
+        
+        names = [v for v in values if isinstance(v, str)]
+        
+        def contains(record):
+            actual = record.get(field, False)
+            if names and isinstance(actual, list):
+                _reject_name_operand(field, names[0])
+            if _empty(actual):
+                return with_empty
+            if isinstance(actual, list) and not _is_many2one(actual):
+                return not values.isdisjoint(actual)
+            return _key(actual) in values
+        
+        if operator == 'in':
+            return contains
+        return lambda record: not contains(record)
+    
+    if operator in _RANGE_OPERATORS:
+        compare = {
+            '<': lambda a, b: a < b, '<=': lambda a, b: a <= b,
+            '>': lambda a, b: a > b, '>=': lambda a, b: a >= b,
+        }[operator]
+        bound = datetime_bound(operator, value)
+        
+        def in_range(record):
+            actual = record.get(field, False)
+            if _empty(actual):
+                return False
+            if isinstance(actual, list):
+                _reject_name_operand(field, value)
+            try:
+                return compare(_key(actual), bound if _is_datetime(actual) else value)
+            except TypeError:
+                return False
+        return in_range
+    
+    if operator in _LIKE_OPERATORS:
+        pattern = _like_pattern(operator, value)
+        negate = operator.startswith('not')
+        
+        def like(record):
+            actual = record.get(field, False)
+            if _is_many2one(actual):
+                actual = actual[1]
+            elif isinstance(actual, list):
+                raise DomainError(f"Cannot evaluate '{operator}' on '{field}' locally")
+            if _empty(actual):
+                return negate
+            found = pattern.search(str(actual)) is not None
+            return not found if negate else found
+        return like
+    
+    raise DomainError(f"Unsupported domain operator: {operator}")
+
+
+class Domain:
+    """
+    Compiled domain
+    
+    ``node`` is the parsed tree: ('leaf', field, operator, value),
+    ('and', [nodes]), ('or', [nodes]) or ('not', node).
+    """
+    
+    __slots__ = ('node', 'match')
+    
+    def __init__(self, node: tuple, match: Callable[[Dict[str, Any]], bool]):
+        self.node = node
+        self.match = match
+    
+    def __call__(self, record: Dict[str, Any]) -> bool:
+        return self.match(record)
+
+
+def _and(predicates: List[Callable]) -> Callable:
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda record: all(predicate(record) for predicate in predicates)
+
+
+def _or(predicates: List[Callable]) -> Callable:
+    return lambda record: any(predicate(record) for predicate in predicates)
+
+
+def compile_domain(domain: Optional[List[Any]]) -> Domain:
+    """
+    Parse and compile a domain
+    
+    Args:
+        domain: Odoo domain in prefix notation (None or [] matches everything)
+    
+    Returns:
+        Domain (callable on a record dict)
+    
+    Raises:
+        DomainError: If the domain is malformed or uses something that
+            cannot be evaluated locally
+    """
+    if isinstance(domain, Domain):
+        return domain
+    
+    # (node, predicate) pairs, built from the end of the prefix expression
+    stack = []
+    for item in reversed(list(domain or [])):
+        if item in ('&', '|'):
+            if len(stack) < 2:
+                raise DomainError(f"Missing operands for '{item}' in domain {domain!r}")
+            first, second = stack.pop(), stack.pop()
+            kind = 'and' if item == '&' else 'or'
+            children = []
+            for node, _ in (first, second):
+                children.extend(node[1] if node[0] == kind else [node])
+            combine = _and if kind == 'and' else _or
+            stack.append(((kind, children), combine([first[1], second[1]])))
+        elif item == '!':
+            if not stack:
+                raise DomainError(f"Missing operand for '!' in domain {domain!r}")
+            node, predicate = stack.pop()
+            stack.append((('not', node), lambda record, predicate=predicate: not predicate(record)))
+        else:
+            predicate = _compile_leaf(item)
+            stack.append((('leaf', item[0], str(item[1]).lower(), _operand(item[2])), predicate))
+    
+    if not stack:
+        return Domain(('and', []), lambda record: True)
+    if len(stack) == 1:
+        return Domain(*stack[0])
+    # Terms left on the stack are implicitly AND-ed (stack holds them reversed)
+    terms = list(reversed(stack))
+    return Domain(('and', [node for node, _ in terms]), _and([predicate for _, predicate in terms]))
+
+
+def top_level_leaves(domain: Optional[List[Any]]) -> List[tuple]:
+    """
+    Leaves that are implicitly AND-ed at the top level of a domain
+    
+    Leaves nested under '&', '|' or '!' are left out, so every record
+    matching the domain matches each returned leaf.
+    
+    Args:
+        domain: Odoo domain in prefix notation
+    
+    Returns:
+        Leaves as tuples, in domain order
+    """
+    leaves = []
+    # Operands still missing to complete the current top-level term
+    pending = 0
+    for item in domain or []:
+        if item in ('&', '|'):
+            pending = pending + 1 if pending else 2
+        elif item == '!':
+            pending = pending or 1
+        elif pending:
+            pending -= 1
+        else:
+            leaves.append(tuple(item))
+    return leaves
+
+
+def match_domain(record: Dict[str, Any], domain: Optional[List[Any]]) -> bool:
+    """Evaluate a domain against one record"""
+    return compile_domain(domain)(record)
+
+
+def sort_records(records: List[Dict[str, Any]], order: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Sort records by an Odoo order clause ('date_deadline desc, id')
+    
+    Like PostgreSQL, empty values sort last ascending and first descending
+    (boolean fields sort False before True); the sort is stable.
+    
+    Raises:
+        DomainError: On a many2one field, which Odoo orders by the related
+            model's ``_order`` rather than by id
+    """
+    for part in reversed([p.strip() for p in (order or 'id').split(',') if p.strip()]):
+        field, *direction = part.split()
+        descending = bool(direction) and direction[0].lower() == 'desc'
+        values = [r.get(field, False) for r in records]
+        if any(_is_many2one(value) for value in values):
+            raise DomainError(f"Cannot order by many2one field '{field}' locally")
+        if any(value is True for value in values):
+            records = sorted(records, key=lambda r: bool(r.get(field, False)), reverse=descending)
+            continue
+        present = [r for r in records if not _empty(r.get(field, False))]
+        empty = [r for r in records if _empty(r.get(field, False))]
+        present.sort(key=lambda r: _key(r[field]), reverse=descending)
+        records = empty + present if descending else present + empty
+    return records
+
+
+class RecordIndex:
+    """
+    In-memory records of one model with secondary indexes
+    
+    Hash indexes map a field value (many2one id, False for empty) to record
+    ids; sorted indexes keep (value, id) pairs of non-empty values for range
+    queries and are rebuilt lazily after changes. Records are stored as
+    given; do not mutate them after adding them.
+    """
+    
+    def __init__(
+        self,
+        records: Iterable[Dict[str, Any]] = (),
+        hash_fields: Iterable[str] = DEFAULT_HASH_FIELDS,
+        sorted_fields: Iterable[str] = DEFAULT_SORTED_FIELDS
+    ):
+        """
+        Initialize the index
+        
+        Args:
+            records: Records to add (dicts with an 'id')
+            hash_fields: Fields indexed for '=' and 'in'
+            sorted_fields: Fields indexed for '<', '<=', '>', '>=' (and '=')
+        """
+        self.hash_fields = tuple(hash_fields)
+        self.sorted_fields = tuple(sorted_fields)
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self._hash: Dict[str, Dict[Any, set]] = {field: {} for field in self.hash_fields}
+        # field -> (values, ids), None when it must be rebuilt
+        self._sorted: Dict[str, Optional[tuple]] = {field: None for field in self.sorted_fields}
+        # Indexed fields holding values the indexes cannot answer for
+        # (x2many lists, mixed types): always scanned
+        self._unindexable = set()
+        # Hash-indexed fields holding many2one values
+        self._relational = set()
+        self._lock = threading.RLock()
+        register_fork_reset(self)
+        self.upsert(records)
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock in a forked child (see forksafe)"""
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __contains__(self, record_id: int) -> bool:
+        return record_id in self.records
+    
+    def get(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """Record by id, or None"""
+        return self.records.get(record_id)
+    
+    # ==================== Maintenance ====================
+    
+    def upsert(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Add records, replacing those with the same id"""
+        with self._lock:
+            for count, record in enumerate(records, 1):
+                if count == SORTED_REBUILD_THRESHOLD:
+                    self._drop_sorted()
+                record_id = record['id']
+                previous = self.records.get(record_id)
+                if previous is not None:
+                    self._unindex(record_id, previous)
+                self.records[record_id] = record
+                for field, buckets in self._hash.items():
+                    value = record.get(field, False)
+                    key = self._hash_key(value)
+                    if key is None:
+                        self._unindexable.add(field)
+                    elif _is_many2one(value):
+                        self._relational.add(field)
+                    buckets.setdefault(key, set()).add(record_id)
+                for field, index in self._sorted.items():
+                    if index is not None:
+                        self._sorted_update(field, index, record_id, record, insert=True)
+    
+    def remove(self, ids: Iterable[int]) -> None:
+        """Drop records by id (unknown ids are ignored)"""
+        with self._lock:
+            for count, record_id in enumerate(ids, 1):
+                if count == SORTED_REBUILD_THRESHOLD:
+                    self._drop_sorted()
+                record = self.records.pop(record_id, None)
+                if record is not None:
+                    self._unindex(record_id, record)
+    
+    def clear(self) -> None:
+        """Drop all records"""
+        with self._lock:
+            self.records.clear()
+            for buckets in self._hash.values():
+                buckets.clear()
+            self._drop_sorted()
+            self._unindexable.clear()
+            self._relational.clear()
+    
+    def _drop_sorted(self) -> None:
+        for field in self._sorted:
+            self._sorted[field] = None
+    
+    def _unindex(self, record_id: int, record: Dict[str, Any]) -> None:
+        for field, buckets in self._hash.items():
+            key = self._hash_key(record.get(field, False))
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.discard(record_id)
+                if not bucket:
+                    del buckets[key]
+        for field, index in self._sorted.items():
+            if index is not None:
+                self._sorted_update(field, index, record_id, record, insert=False)
+    
+    def _sorted_update(self, field: str, index: tuple, record_id: int, record: Dict[str, Any], insert: bool) -> None:
+        """Insert or delete one (value, id) pair of a built sorted index"""
+        value = record.get(field, False)
+        if _empty(value):
+            return
+        value = _key(value)
+        values, ids = index
+        try:
+            low = bisect_left(values, value)
+            high = bisect_right(values, value, low)
+        except TypeError:
+            self._sorted[field] = None
+            return
+        # Pairs with an equal value are ordered by id
+        position = bisect_left(ids, record_id, low, high)
+        if insert:
+            values.insert(position, value)
+            ids.insert(position, record_id)
+        elif position < high and ids[position] == record_id:
+            del values[position]
+            del ids[position]
+    
+    @staticmethod
+    def _hash_key(value: Any) -> Any:
+        key = _key(value)
+        if isinstance(key, list):
+            # x2many values are not hash-indexed
+            return None
+        return False if _empty(key) else key
+    
+    def _sorted_index(self, field: str) -> Optional[tuple]:
+        index = self._sorted[field]
+        if index is None:
+            try:
+                pairs = sorted(
+                    (_key(record[field]), record_id)
+                    for record_id, record in self.records.items()
+                    if not _empty(record.get(field, False))
+                )
+            except TypeError:
+                self._unindexable.add(field)
+                return None
+            index = ([value for value, _ in pairs], [record_id for _, record_id in pairs])
+            self._sorted[field] = index
+        return index
+    
+    # ==================== Queries ====================
+    
+    def search(
+        self,
+        domain: Optional[List[Any]] = None,
+        order: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Records matching a domain
+        
+        Args:
+            domain: Odoo domain
+            order: Order clause (default: 'id')
+            offset: Skip records
+            limit: Maximum records (None/0 = all)
+        
+        Returns:
+            The stored record dicts (not copies)
+        
+        Raises:
+            DomainError: If the domain cannot be evaluated locally
+        """
+        compiled = compile_domain(domain)
+        with self._lock:
+            candidates, exact = self._candidates(compiled.node)
+            records = self.records
+            if candidates is None:
+                matches = [record for record in records.values() if compiled.match(record)]
+            elif exact:
+                # The indexes answered every term: no need to re-check
+                matches = [records[i] for i in sorted(candidates)]
+            else:
+                matches = [records[i] for i in sorted(candidates) if compiled.match(records[i])]
+        
+        if order and order.strip() != 'id' and order.strip().lower() != 'id asc':
+            matches = sort_records(matches, order)
+        elif candidates is None:
+            matches.sort(key=lambda record: record['id'])
+        end = offset + limit if limit else None
+        return matches[offset:end]
+    
+    def count(self, domain: Optional[List[Any]] = None) -> int:
+        """Number of records matching a domain"""
+        return len(self.search(domain))
+    
+    def _candidates(self, node: tuple) -> tuple:
+        """
+        Matching ids according to the indexes
+        
+        Returns:
+            (ids, exact): ids is a superset of the matches (None = full
+            scan), exactly the matches when ``exact``
+        """
+        kind = node[0]
+        if kind == 'leaf':
+            ids = self._leaf_candidates(*node[1:])
+            return ids, ids is not None
+        if kind == 'and':
+            results = [self._candidates(child) for child in node[1]]
+            sets = [ids for ids, _ in results if ids is not None]
+            if not sets:
+                return None, False
+            sets.sort(key=len)
+            result = set(sets[0])
+            for other in sets[1:]:
+                result &= other
+            return result, all(exact for _, exact in results)
+        if kind == 'or':
+            result = set()
+            exact = True
+            for child in node[1]:
+                ids, child_exact = self._candidates(child)
+                if ids is None:
+                    return None, False
+                result |= ids
+                exact = exact and child_exact
+            return result, exact
+        return None, False
+    
+    def _leaf_candidates(self, field: Any, operator: str, value: Any) -> Optional[set]:
+        if operator == 'in' and not isinstance(value, (list, tuple, set, frozenset)):
+            value = [value]
+        
+        if field == 'id':
+            if operator == '=':
+                return {value} & self.records.keys()
+            if operator == 'in':
+                return set(value) & self.records.keys()
+            return None
+        
+        if field in self._unindexable:
+            return None
+        
+        if field in self._hash:
+            buckets = self._hash[field]
+            if field in self._relational:
+                for item in (value if operator == 'in' else [value]):
+                    _reject_name_operand(field, item)
+            if operator == '=':
+                return set(buckets.get(self._hash_key(value), ()))
+            if operator == 'in':
+                result = set()
+                for item in value:
+                    result |= buckets.get(self._hash_key(item), set())
+                return result
+        
+        if field in self._sorted and operator in _RANGE_OPERATORS + ('=',):
+            if value is False or value is None:
+                return None
+            index = self._sorted_index(field)
+            if index is None:
+                return None
+            values, ids = index
+            if values and _is_datetime(values[0]):
+                value = datetime_bound(operator, value)
+            try:
+                if operator == '<':
+                    selected = ids[:bisect_left(values, value)]
+                elif operator == '<=':
+                    selected = ids[:bisect_right(values, value)]
+                elif operator == '>':
+                    selected = ids[bisect_right(values, value):]
+                elif operator == '>=':
+                    selected = ids[bisect_left(values, value):]
+                else:
+                    selected = ids[bisect_left(values, value):bisect_right(values, value)]
+            except TypeError:
+                return None
+            return set(selected)
+        return None
+    
+    def __repr__(self) -> str:
+        return f"RecordIndex({len(self.records)} records, hash={list(self.hash_fields)}, sorted={list(self.sorted_fields)})"
@@ -0,0 +1,13 @@
+"""
+Exceptions raised by the Odoo Python client
+"""
+
+
+class OdooAPIError(Exception):
+    """Custom exception for Odoo API errors"""
+    pass
+
+
+class OdooConnectionError(OdooAPIError):
+    """Transport-level failure (timeout, connection error, HTTP 5xx/429); safe to retry for reads"""
+    pass
@@ -0,0 +1,489 @@
+"""
+Bulk export
+===========
+
+Streams every record of a model matching a domain to a JSON Lines, CSV or
+Parquet output without holding the result set in memory:
+
+- ids are listed in ascending order (``id > last_id``), one search per round
+  of pages, and each page is read by a pool of fetchers; pages are written
+  strictly in id order, with at most ``2 * workers`` pages in flight
+- records deleted (or no longer matching the domain) between listing and
+  reading their page are skipped
+- progress (last exported id, records, bytes written) is checkpointed next to
+  the output after each durable write, so an interrupted export resumes from
+  the last exported id with ``resume=True``
+- Parquet output is a directory of part files (one per ``row_group_size``
+  rows) and requires ``pyarrow``
+
+Usage:
+    python -m python_client export mrp.production --format csv -o mos.csv
+    python -m python_client export mrp.production --domain '[["state", "=", "done"]]' --resume
+
+Example usage:
+    >>> from python_client.export import export_model
+    >>> stats = export_model(client, 'product.product', 'products.jsonl', workers=4)
+    >>> stats['records_per_sec']
+"""
+
+import io
+import os
+import sys
+import csv
+import json
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+from .codec import JSONCodec
+from .jsonstore import JSONFileStore
+from .odoo_client import OdooAPIError, OdooClient, logger
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'parquet')
+
+# Records per id page / per Parquet part file
+DEFAULT_EXPORT_PAGE_SIZE = 1000
+DEFAULT_ROW_GROUP_SIZE = 100000
+
+# Checkpoint written next to a file output (inside a Parquet directory)
+STATE_SUFFIX = '.export-state.json'
+PARQUET_STATE_FILE = '_export_state.json'
+
+_MANY2ONE = 'many2one'
+_X2MANY = ('one2many', 'many2many')
+
+
+def _state_path(path: str, output_format: str) -> str:
+    if output_format == 'parquet':
+        return os.path.join(path, PARQUET_STATE_FILE)
+    return path + STATE_SUFFIX
+
+
+def _save_state(store: JSONFileStore, state: Dict[str, Any]) -> None:
+    with store.update() as stored:
+        stored.clear()
+        stored.update(state)
+
+
+# ==================== Writers ====================
+
+class _JsonlWriter:
+    """One JSON object per line, records kept in Odoo's representation"""
+    
+    def __init__(self, path: str, fields: List[str], schema: Dict[str, Any], position: int, codec: JSONCodec):
+        self.codec = codec
+        self._file = _open_at(path, position)
+        self._position = position
+    
+    def write(self, records: List[Dict[str, Any]]) -> bool:
+        dumps = self.codec.dumps
+        self._file.write(b''.join(dumps(record) + b'\n' for record in records))
+        self._file.flush()
+        self._position = self._file.tell()
+        return True
+    
+    def position(self) -> int:
+        return self._position
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CsvWriter:
+    """
+    CSV with a header row
+    
+    many2one fields become an id column plus a ``<field>.name`` column,
+    x2many fields a comma-separated id list; empty values are left blank.
+    """
+    
+    def __init__(self, path: str, fields: List[str], schema: Dict[str, Any], position: int, codec: JSONCodec):
+        self.fields = fields
+        self.types = {field: schema.get(field, {}).get('type') for field in fields}
+        self._file = _open_at(path, position)
+        self._position = position
+        if position == 0:
+            header = []
+            for field in fields:
+                header.append(field)
+                if self.types[field] == _MANY2ONE:
+                    header.append(f"{field}.name")
+            self._write_rows([header])
+    
+    def write(self, records: List[Dict[str, Any]]) -> bool:
+        self._write_rows([self._row(record) for record in records])
+        return True
+    
+    def _row(self, record: Dict[str, Any]) -> List[Any]:
+        row = []
+        for field in self.fields:
+            value = record.get(field, False)
+            field_type = self.types[field]
+            if field_type == _MANY2ONE:
+                row.extend(value[:2] if value else ('', ''))
+            elif field_type in _X2MANY:
+                row.append(','.join(map(str, value or ())))
+            elif value is False and field_type != 'boolean':
+                row.append('')
+            else:
+                row.append(value)
+        return row
+    
+    def _write_rows(self, rows: List[List[Any]]) -> None:
+        # Encoded per page so the checkpoint is a plain byte offset
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        self._file.write(buffer.getvalue().encode('utf-8'))
+        self._file.flush()
+        self._position = self._file.tell()
+    
+    def position(self) -> int:
+        return self._position
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Directory of ``part-NNNNN.parquet`` files of ``row_group_size`` rows
+    
+    Buffered rows only become durable when their part file is written, so a
+    resumed export restarts after the last complete part.
+    """
+    
+    def __init__(self, path: str, fields: List[str], schema: Dict[str, Any], position: int, row_group_size: int):
+        self.path = path
+        self.fields = fields
+        self.types = {field: schema.get(field, {}).get('type') for field in fields}
+        self.row_group_size = row_group_size
+        self.part = position
+        self._buffer: List[Dict[str, Any]] = []
+        os.makedirs(path, exist_ok=True)
+    
+    def write(self, records: List[Dict[str, Any]]) -> bool:
+        self._buffer.extend(records)
+        if len(self._buffer) < self.row_group_size:
+            return False
+        self.flush()
+        return True
+    
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        table = pa.table({name: column for name, column in self._columns(self._buffer)})
+        part_path = os.path.join(self.path, f"part-{self.part:05d}.parquet")
+        pq.write_table(table, part_path + '.tmp')
+        os.replace(part_path + '.tmp', part_path)
+        self.part += 1
+        self._buffer = []
+    
+    def _columns(self, records: List[Dict[str, Any]]):
+        for field in self.fields:
+            values = [record.get(field, False) for record in records]
+            field_type = self.types[field]
+            if field_type == 'boolean':
+                yield field, pa.array(values, type=pa.bool_())
+                continue
+            if field_type == _MANY2ONE:
+                yield field, pa.array([v[0] if v else None for v in values], type=pa.int64())
+                yield f"{field}.name", pa.array([v[1] if v else None for v in values], type=pa.string())
+                continue
+            if field_type in _X2MANY:
+                yield field, pa.array([v or [] for v in values], type=pa.list_(pa.int64()))
+                continue
+            
+            values = [None if v is False else v for v in values]
+            if field == 'id' or field_type == 'integer':
+                yield field, pa.array(values, type=pa.int64())
+            elif field_type in ('float', 'monetary'):
+                yield field, pa.array(values, type=pa.float64())
+            elif field_type == 'date':
+                yield field, pa.array(values, type=pa.string()).cast(pa.date32())
+            elif field_type == 'datetime':
+                yield field, pa.array(values, type=pa.string()).cast(pa.timestamp('s'))
+            else:
+                yield field, pa.array([v if v is None else str(v) for v in values], type=pa.string())
+    
+    def position(self) -> int:
+        return self.part
+    
+    def close(self) -> None:
+        self.flush()
+
+
+def _open_at(path: str, position: int):
+    """Open a file for appending after truncating it to a checkpointed offset"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    f = open(path, 'r+b' if position else 'wb')
+    f.truncate(position)
+    f.seek(position)
+    return f
+
+
+def _clear_parquet(path: str, from_part: int = 0) -> None:
+    """Delete part files numbered from_part and up (and leftover temp files)"""
+    if not os.path.isdir(path):
+        return
+    for name in os.listdir(path):
+        if not name.startswith('part-'):
+            continue
+        number = name[5:].split('.', 1)[0]
+        if name.endswith('.tmp') or (number.isdigit() and int(number) >= from_part):
+            os.remove(os.path.join(path, name))
+
+
+# ==================== Export ====================
+
+def export_model(
+    client: OdooClient,
+    model: str,
+    path: Optional[str] = None,
+    output_format: str = 'jsonl',
+    domain: List[Any] = None,
+    fields: List[str] = None,
+    page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+    workers: int = 4,
+    resume: bool = False,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Export all records of a model matching a domain
+    
+    Args:
+        model: Model name
+        path: Output file (Parquet: directory); default '<model>.<format>'
+        output_format: 'jsonl', 'csv' or 'parquet'
+        domain: Search domain
+        fields: Fields to export (default: every stored field except
+            text/html/binary/x2many, see OdooClient.resolve_fields)
+        page_size: Records per read request
+        workers: Concurrent read requests
+        resume: Continue an interrupted export of the same model, domain,
+            fields and format from its last exported id
+        row_group_size: Rows per Parquet part file
+        progress: Called with the running stats after each written page
+    
+    Returns:
+        Stats: records, seconds, records_per_sec, bytes, path, resumed_from
+    
+    Raises:
+        ValueError: On an unknown format, or when resuming an export made
+            with other settings
+        OdooAPIError: If Parquet is requested but pyarrow is not installed
+    """
+    output_format = output_format.lower()
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{output_format}'. Use one of: {', '.join(EXPORT_FORMATS)}")
+    if output_format == 'parquet' and pa is None:
+        raise OdooAPIError(
+            "Parquet export requires the 'pyarrow' package.\n"
+            "Install with: pip install pyarrow"
+        )
+    
+    path = path or f"{model}.{output_format}"
+    domain = list(domain or [])
+    schema = client.fields_get(model)
+    if fields:
+        fields = client.resolve_fields(model, fields, strict=True)
+    else:
+        fields = client.resolve_fields(model, list(schema), lean=True)
+    fields = ['id'] + [field for field in fields if field != 'id']
+    
+    settings = {'model': model, 'domain': domain, 'fields': fields, 'format': output_format}
+    state_path = _state_path(path, output_format)
+    state_store = JSONFileStore(state_path, indent=2)
+    # A missing or unreadable checkpoint starts the export over
+    state = (state_store.read() or None) if resume else None
+    if state is not None:
+        # Round-trip through JSON so domain tuples compare equal to the stored lists
+        if {key: state.get(key) for key in settings} != json.loads(json.dumps(settings)):
+            raise ValueError(f"{state_path} belongs to an export with other settings; rerun without resume")
+        if state.get('complete'):
+            logger.info(f"Export of {model} to {path} is already complete")
+            return _stats(state['records'], 0.0, path, state['last_id'])
+    else:
+        state = dict(settings, last_id=0, records=0, position=0, complete=False)
+    
+    resumed_from = state['last_id']
+    if output_format == 'parquet':
+        _clear_parquet(path, from_part=state['position'])
+        writer = _ParquetWriter(path, fields, schema, state['position'], row_group_size)
+    else:
+        writer_class = _JsonlWriter if output_format == 'jsonl' else _CsvWriter
+        writer = writer_class(path, fields, schema, state['position'], client.codec)
+    _save_state(state_store, state)
+    
+    logger.info(f"Exporting {model} to {path} ({output_format}) after id {resumed_from}")
+    started = time.monotonic()
+    # Written records not yet durable (buffered Parquet rows)
+    pending = {'records': 0, 'last_id': None}
+    
+    def fetch(ids: List[int]) -> List[Dict[str, Any]]:
+        # Unlike read, search_read skips records deleted (or moved out of the
+        # domain) since the ids were listed instead of failing the page
+        return client.search_read(model, domain + [('id', 'in', ids)], fields, limit=0, order='id asc')
+    
+    max_in_flight = 2 * max(1, workers)
+    
+    def pages():
+        # One id search per round of pages keeps the sequential part small
+        block_size = page_size * max_in_flight
+        last_id = resumed_from
+        while True:
+            ids = client.search(model, domain + [('id', '>', last_id)], limit=block_size, order='id asc')
+            for start in range(0, len(ids), page_size):
+                yield ids[start:start + page_size]
+            if len(ids) < block_size:
+                return
+            last_id = ids[-1]
+    
+    def checkpoint(complete: bool = False) -> None:
+        if pending['records']:
+            state['records'] += pending['records']
+            state['last_id'] = pending['last_id']
+            pending['records'] = 0
+        state.update(position=writer.position(), complete=complete)
+        _save_state(state_store, state)
+    
+    def write(records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        pending['records'] += len(records)
+        pending['last_id'] = records[-1]['id']
+        if writer.write(records):
+            checkpoint()
+        if progress:
+            progress(_stats(
+                state['records'] + pending['records'], time.monotonic() - started, path, resumed_from
+            ))
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            in_flight = deque()
+            for ids in pages():
+                in_flight.append(executor.submit(fetch, ids))
+                if len(in_flight) >= max_in_flight:
+                    write(in_flight.popleft().result())
+            while in_flight:
+                write(in_flight.popleft().result())
+        # Parquet: writes the last partial part file
+        writer.close()
+    except BaseException:
+        # Keep what was checkpointed; a partial Parquet part is not written
+        if output_format != 'parquet':
+            writer.close()
+        raise
+    checkpoint(complete=True)
+    
+    stats = _stats(state['records'], time.monotonic() - started, path, resumed_from)
+    logger.info(
+        f"Exported {stats['records']} {model} record(s) to {path} "
+        f"in {stats['seconds']:.1f}s ({stats['records_per_sec']:.0f} records/s)"
+    )
+    return stats
+
+
+def _stats(records: int, seconds: float, path: str, resumed_from: int) -> Dict[str, Any]:
+    return {
+        'records': records,
+        'seconds': seconds,
+        'records_per_sec': records / seconds if seconds > 0 else 0.0,
+        'bytes': _output_size(path),
+        'path': path,
+        'resumed_from': resumed_from,
+    }
+
+
+def _output_size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(path, name))
+            for name in os.listdir(path) if name.startswith('part-')
+        )
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+# ==================== Command line ====================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: python -m python_client export"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog='python -m python_client export',
+        description="Export the records of an Odoo model to JSON Lines, CSV or Parquet"
+    )
+    parser.add_argument('model', help="model name, e.g. mrp.production")
+    parser.add_argument('-o', '--output', help="output file (Parquet: directory); default <model>.<format>")
+    parser.add_argument('-f', '--format', default='jsonl', choices=EXPORT_FORMATS)
+    parser.add_argument('--domain', default='[]', help="search domain as JSON, e.g. '[[\"state\", \"=\", \"done\"]]'")
+    parser.add_argument('--fields', default='', help="comma-separated fields (default: stored, non-heavy fields)")
+    parser.add_argument('--page-size', type=int, default=DEFAULT_EXPORT_PAGE_SIZE, help="records per read request")
+    parser.add_argument('--workers', type=int, default=4, help="concurrent read requests")
+    parser.add_argument('--row-group-size', type=int, default=DEFAULT_ROW_GROUP_SIZE, help="rows per Parquet part file")
+    parser.add_argument('--resume', action='store_true', help="continue an interrupted export from its last exported id")
+    parser.add_argument('--url', help="Odoo URL (default: ODOO_URL)")
+    parser.add_argument('--db', help="database (default: ODOO_DB)")
+    parser.add_argument('--username', help="login (default: ODOO_USERNAME; the key is read from ODOO_API_KEY)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="no progress output")
+    args = parser.parse_args(argv)
+    
+    try:
+        domain = json.loads(args.domain)
+    except ValueError as e:
+        parser.error(f"--domain is not valid JSON: {e}")
+    fields = [field.strip() for field in args.fields.split(',') if field.strip()] or None
+    
+    # Keep the per-call INFO logging out of the progress output
+    logger.setLevel(logging.WARNING)
+    
+    last_report = [0.0]
+    
+    def report(stats: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        if args.quiet or now - last_report[0] < 1.0:
+            return
+        last_report[0] = now
+        print(
+            f"\r{stats['records']} records  {stats['records_per_sec']:.0f} records/s  "
+            f"{stats['bytes'] / 1e6:.1f} MB",
+            end='', file=sys.stderr, flush=True
+        )
+    
+    client = OdooClient(url=args.url, db=args.db, username=args.username)
+    try:
+        stats = export_model(
+            client, args.model, args.output, args.format, domain, fields,
+            page_size=args.page_size, workers=args.workers, resume=args.resume,
+            row_group_size=args.row_group_size, progress=report
+        )
+    except (OdooAPIError, ValueError) as e:
+        print(f"\nExport failed: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("\nInterrupted; rerun with --resume to continue", file=sys.stderr)
+        return 130
+    finally:
+        client.close()
+    
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(
+        f"Exported {stats['records']} {args.model} record(s) to {stats['path']} "
+        f"in {stats['seconds']:.1f}s ({stats['records_per_sec']:.0f} records/s, "
+        f"{stats['bytes'] / 1e6:.1f} MB)"
+    )
+    return 0
@@ -0,0 +1,613 @@
+"""
+In-process fake Odoo server
+===========================
+
+A small threaded HTTP server speaking enough of Odoo's external API to run
+the client (and its benchmarks) without a live instance:
+
+- ``/jsonrpc`` (services ``common`` and ``object``)
+- ``/xmlrpc/2/common`` and ``/xmlrpc/2/object``
+- ``authenticate``, ``login``, ``version``
+- ``execute_kw`` with ``search``, ``read``, ``search_read``, ``search_count``,
+  ``read_group``, ``fields_get``, ``create`` (single values dict or list of
+  dicts), ``write`` and ``unlink``
+
+Data lives in memory as ``{model: {id: record}}`` (see datagen.py). A fixed
+latency (plus optional jitter) can be added to every request to emulate a
+remote server. Like Odoo, ``create_date``/``write_date`` set by the server
+keep microseconds internally (for domains and ordering) but are returned
+truncated to the second.
+
+Example usage:
+    >>> from python_client.fakeserver import FakeOdooServer
+    >>> from python_client.datagen import generate_dataset
+    >>> with FakeOdooServer(generate_dataset(100000), latency=0.02) as server:
+    ...     client = OdooClient(server.url, server.db, 'admin', 'secret')
+    ...     client.search_count('mrp.production')
+"""
+
+import gzip
+import time
+import random
+import threading
+import xmlrpc.client
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Any, Optional
+
+from .codec import get_codec
+from .datagen import RELATIONS, X2MANY_RELATIONS, FIELD_ATTRIBUTES, generate_dataset
+from .domain import compile_domain, sort_records
+from .odoo_client import ODOO_DATETIME_FORMAT
+
+SERVER_VERSION = {
+    'server_version': '17.0',
+    'server_version_info': [17, 0, 0, 'final', 0, ''],
+    'server_serie': '17.0',
+    'protocol_version': 1,
+}
+
+
+# Smallest response body compressed when gzip is enabled
+GZIP_MIN_SIZE = 1024
+
+
+class FakeOdooError(Exception):
+    """Error reported to the client as an Odoo server error"""
+    pass
+
+
+class FakeOdooServer:
+    """
+    Threaded in-memory Odoo stand-in
+    """
+    
+    def __init__(
+        self,
+        data: Optional[Dict[str, Dict[int, Dict[str, Any]]]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        db: str = 'odoo',
+        credentials: Optional[Dict[str, str]] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        gzip: bool = False
+    ):
+        """
+        Initialize the server (call start() or use it as a context manager)
+        
+        Args:
+            data: {model: {id: record}} (default: generate_dataset())
+            latency: Seconds added to every request
+            jitter: Extra random latency of up to this many seconds
+            db: Database name accepted by authenticate
+            credentials: {login: api_key} accepted by authenticate
+                (default: any login/key pair)
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            gzip: Compress responses of clients sending Accept-Encoding: gzip
+                (like a gzip-enabled reverse proxy in front of Odoo)
+        """
+        self.data = data if data is not None else generate_dataset()
+        self.latency = latency
+        self.jitter = jitter
+        self.db = db
+        self.credentials = credentials
+        self.host = host
+        self.port = port
+        self.gzip = gzip
+        
+        self.request_count = 0
+        self._lock = threading.RLock()
+        self._next_ids = {model: max(records, default=0) + 1 for model, records in self.data.items()}
+        # Field names per model (computed on first use, grown by create/write)
+        self._field_names: Dict[str, set] = {}
+        self._codec = get_codec()
+        self._httpd = None
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        if self._httpd is None:
+            raise RuntimeError("FakeOdooServer is not running")
+        # 'localhost' keeps the client's plain-HTTP warning quiet
+        host = 'localhost' if self.host in ('127.0.0.1', 'localhost') else self.host
+        return f"http://{host}:{self._httpd.server_address[1]}"
+    
+    def start(self) -> 'FakeOdooServer':
+        """Start serving in a background thread"""
+        server = self
+        
+        class Handler(_Handler):
+            fake = server
+        
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Stop the server and close its socket"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            self._thread = None
+    
+    def __enter__(self) -> 'FakeOdooServer':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+    
+    # ==================== Dispatch ====================
+    
+    def dispatch(self, service: str, method: str, args: List[Any]) -> Any:
+        """Run one RPC and return its result (raises FakeOdooError)"""
+        with self._lock:
+            self.request_count += 1
+        
+        if service == 'common':
+            if method == 'version':
+                return dict(SERVER_VERSION)
+            if method in ('authenticate', 'login'):
+                return self._authenticate(*args[:3])
+            raise FakeOdooError(f"Unknown method common.{method}")
+        
+        if service == 'object' and method in ('execute_kw', 'execute'):
+            db, uid, api_key, model, model_method = args[:5]
+            call_args = args[5] if len(args) > 5 else []
+            kwargs = args[6] if len(args) > 6 and method == 'execute_kw' else {}
+            if method == 'execute':
+                call_args = args[5:]
+            if db != self.db or not uid:
+                raise FakeOdooError("Access Denied")
+            return self._execute(model, model_method, list(call_args or []), dict(kwargs or {}))
+        
+        raise FakeOdooError(f"Unknown service/method: {service}.{method}")
+    
+    def _authenticate(self, db: str, login: str, api_key: str) -> Any:
+        if db != self.db:
+            raise FakeOdooError(f"Database {db} does not exist")
+        if self.credentials is not None and self.credentials.get(login) != api_key:
+            return False
+        for record in self.data.get('res.users', {}).values():
+            if record.get('login') == login:
+                return record['id']
+        return 2
+    
+    def _execute(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        handler = getattr(self, f"_rpc_{method}", None)
+        if handler is None:
+            raise FakeOdooError(f"The method '{method}' does not exist on the model '{model}'")
+        if model not in self.data:
+            raise FakeOdooError(f"Object {model} doesn't exist")
+        return handler(model, *args, **kwargs)
+    
+    # ==================== Model methods ====================
+    
+    def _search_records(
+        self,
+        model: str,
+        domain: List[Any],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        order: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        self._check_fields(model, [
+            item[0] for item in domain if isinstance(item, (list, tuple)) and isinstance(item[0], str)
+        ])
+        match = compile_domain(self._resolve_names(model, domain))
+        with self._lock:
+            records = [r for r in self.data[model].values() if match(r)]
+        
+        records = self._sort(model, records, order)
+        end = offset + limit if limit else None
+        return records[offset:end]
+    
+    def _resolve_names(self, model: str, domain: List[Any]) -> List[Any]:
+        """Replace many2one names by the ids of the related records so named, like Odoo's name_search"""
+        relations = RELATIONS.get(model, {})
+        resolved = []
+        for item in domain:
+            if isinstance(item, (list, tuple)) and len(item) == 3 and item[0] in relations \
+                    and item[1] in ('=', '!=', 'in', 'not in'):
+                field, operator, value = item
+                values = value if isinstance(value, (list, tuple)) else [value]
+                names = {v for v in values if isinstance(v, str)}
+                if names:
+                    related = self.data.get(relations[field], {})
+                    ids = [v for v in values if not isinstance(v, str)]
+                    ids += [i for i, record in related.items() if record.get('name') in names]
+                    item = (field, 'in' if operator in ('=', 'in') else 'not in', ids)
+            resolved.append(item)
+        return resolved
+    
+    def _sort(self, model: str, records: List[Dict[str, Any]], order: Optional[str]) -> List[Dict[str, Any]]:
+        """Order records, many2one fields by the related record's name (standing in for its _order)"""
+        relations = RELATIONS.get(model, {})
+        named = [part.split()[0] for part in (order or '').split(',') if part.strip() and part.split()[0] in relations]
+        if not named:
+            return sort_records(records, order)
+        
+        keyed = []
+        for record in records:
+            key = dict(record, _record=record)
+            for field in named:
+                value = record.get(field, False)
+                key[field] = value[1] if isinstance(value, list) and value else value
+            keyed.append(key)
+        return [key['_record'] for key in sort_records(keyed, order)]
+    
+    def _rpc_search(self, model, domain=None, offset=0, limit=None, order=None, count=False):
+        records = self._search_records(model, domain or [], offset, limit, order)
+        return len(records) if count else [r['id'] for r in records]
+    
+    def _rpc_search_count(self, model, domain=None, limit=None):
+        return len(self._search_records(model, domain or [], 0, limit))
+    
+    def _rpc_read(self, model, ids, fields=None, load='_classic_read'):
+        self._check_fields(model, fields)
+        with self._lock:
+            table = self.data[model]
+            missing = [i for i in ids if i not in table]
+            if missing:
+                raise FakeOdooError(f"Record does not exist or has been deleted. (Record: {model}({missing[0]},))")
+            return [_project(table[i], fields) for i in ids]
+    
+    def _rpc_search_read(self, model, domain=None, fields=None, offset=0, limit=None, order=None):
+        self._check_fields(model, fields)
+        records = self._search_records(model, domain or [], offset, limit, order)
+        return [_project(r, fields) for r in records]
+    
+    def _rpc_create(self, model, vals_list):
+        single = isinstance(vals_list, dict)
+        created = []
+        with self._lock:
+            for values in ([vals_list] if single else vals_list):
+                record_id = self._next_ids.get(model, 1)
+                self._next_ids[model] = record_id + 1
+                record = self._defaults(model, record_id)
+                record.update(self._normalize(model, values))
+                record['id'] = record_id
+                self._field_names.get(model, set()).update(record)
+                self.data[model][record_id] = record
+                created.append(record_id)
+        return created[0] if single else created
+    
+    def _rpc_write(self, model, ids, values):
+        with self._lock:
+            table = self.data[model]
+            missing = [i for i in ids if i not in table]
+            if missing:
+                raise FakeOdooError(f"Record does not exist or has been deleted. (Record: {model}({missing[0]},))")
+            values = self._normalize(model, values)
+            values['write_date'] = _now()
+            self._field_names.get(model, set()).update(values)
+            for record_id in ids:
+                table[record_id].update(values)
+        return True
+    
+    def _rpc_unlink(self, model, ids):
+        with self._lock:
+            table = self.data[model]
+            for record_id in ids:
+                table.pop(record_id, None)
+        return True
+    
+    def _rpc_fields_get(self, model, allfields=None, attributes=None):
+        """Field definitions inferred from the stored values and datagen's metadata"""
+        with self._lock:
+            samples = {}
+            for record in self.data[model].values():
+                for field, value in record.items():
+                    if samples.get(field) in (None, False):
+                        samples[field] = value
+        
+        definitions = {}
+        for field, value in samples.items():
+            definition = {
+                'type': _field_type(value),
+                'string': field.replace('_', ' ').title(),
+                'store': True,
+                'readonly': field in ('id', 'write_date', 'create_date'),
+            }
+            if field in RELATIONS.get(model, {}):
+                definition.update(type='many2one', relation=RELATIONS[model][field])
+            elif field in X2MANY_RELATIONS.get(model, {}):
+                field_type, comodel = X2MANY_RELATIONS[model][field]
+                definition.update(type=field_type, relation=comodel)
+            definition.update(FIELD_ATTRIBUTES.get(model, {}).get(field, {}))
+            definitions[field] = definition
+        
+        if allfields:
+            definitions = {f: d for f, d in definitions.items() if f in allfields}
+        if attributes:
+            definitions = {
+                f: {k: v for k, v in d.items() if k in attributes} for f, d in definitions.items()
+            }
+        return definitions
+    
+    def _rpc_read_group(self, model, domain, fields, groupby, offset=0, limit=None, orderby=False, lazy=True):
+        groupby = [groupby] if isinstance(groupby, str) else list(groupby or [])
+        if lazy:
+            groupby = groupby[:1]
+        records = self._search_records(model, domain or [])
+        
+        aggregates = []
+        for spec in fields or []:
+            name, _, function = spec.partition(':')
+            field = name
+            if '(' in function:
+                function, field = function[:-1].split('(', 1)
+            if name in groupby or not function and name.split(':')[0] in groupby:
+                continue
+            aggregates.append((name, field, function or 'sum'))
+        
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for record in records:
+            values = tuple(_group_value(record, spec) for spec in groupby)
+            key = tuple(sort_key for _, sort_key in values)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {'records': [], 'values': values}
+            group['records'].append(record)
+        
+        count_key = '__count' if not lazy or not groupby else f"{groupby[0].split(':')[0]}_count"
+        result = []
+        for group in groups.values():
+            row = {}
+            for spec, (label, _) in zip(groupby, group['values']):
+                row[spec] = label
+            row[count_key] = len(group['records'])
+            for name, field, function in aggregates:
+                row[name] = _aggregate(function, [r.get(field, False) for r in group['records']])
+            row['__domain'] = list(domain or [])
+            row['_sort'] = tuple(sort_key for _, sort_key in group['values'])
+            result.append(row)
+        
+        descending = bool(orderby) and orderby.split()[-1].lower() == 'desc'
+        order_field = orderby.split()[0] if orderby else None
+        if order_field and order_field in (name for name, _, _ in aggregates + [(count_key, None, None)]):
+            result.sort(key=lambda row: row[order_field] or 0, reverse=descending)
+        else:
+            # Empty groups (False) come last, like Odoo
+            result.sort(key=lambda row: tuple((k is None, k if k is not None else 0) for k in row['_sort']),
+                        reverse=descending)
+        for row in result:
+            del row['_sort']
+        end = offset + limit if limit else None
+        return result[offset:end]
+    
+    def _check_fields(self, model: str, fields: Optional[List[str]]) -> None:
+        """Reject unknown fields (dotted paths by their first part) like Odoo"""
+        if not fields:
+            return
+        with self._lock:
+            known = self._field_names.get(model)
+            if known is None:
+                known = {'id', 'display_name'}
+                for record in self.data[model].values():
+                    known.update(record)
+                self._field_names[model] = known
+        for field in fields:
+            if field.partition('.')[0] not in known:
+                raise FakeOdooError(f"Invalid field {field!r} on model {model!r}")
+    
+    def _defaults(self, model: str, record_id: int) -> Dict[str, Any]:
+        now = _now()
+        record = {'create_date': now, 'write_date': now}
+        if model == 'mrp.production':
+            record.update({
+                'name': f"WH/MO/{record_id:05d}", 'state': 'draft',
+                'qty_produced': 0.0, 'qty_producing': 0.0,
+            })
+        elif model in ('product.product', 'res.users'):
+            record['active'] = True
+        return record
+    
+    def _normalize(self, model: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Store many2one ids as [id, display_name] like Odoo returns them"""
+        values = dict(values)
+        for field, comodel in RELATIONS.get(model, {}).items():
+            related_id = values.get(field)
+            if isinstance(related_id, int) and not isinstance(related_id, bool):
+                related = self.data.get(comodel, {}).get(related_id)
+                values[field] = [related_id, related.get('name', '') if related else f"{comodel},{related_id}"]
+        return values
+
+
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+
+def _field_type(value: Any) -> str:
+    if isinstance(value, bool) or value is None:
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, list):
+        if len(value) == 2 and isinstance(value[0], int) and isinstance(value[1], str):
+            return 'many2one'
+        return 'one2many'
+    if isinstance(value, str) and len(value) in (19, 26) and value[4] == '-' and value[13] == ':':
+        return 'datetime'
+    if isinstance(value, str) and len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return 'date'
+    return 'char'
+
+
+def _group_value(record: Dict[str, Any], spec: str) -> tuple:
+    """(display value, sort key) of a record for one read_group groupby spec"""
+    field, _, granularity = spec.partition(':')
+    value = record.get(field, False)
+    if value is False or value is None:
+        return False, None
+    if isinstance(value, list):
+        return value, value[0]
+    if field in _PRECISE_FIELDS:
+        value = value[:19]
+    if not granularity and field.startswith('date'):
+        granularity = 'month'
+    if granularity:
+        moment = datetime.fromisoformat(value)
+        if granularity == 'day':
+            return moment.strftime('%d %b %Y'), moment.strftime('%Y-%m-%d')
+        if granularity == 'week':
+            year, week, _ = moment.isocalendar()
+            return f"W{week:02d} {year}", (year, week)
+        if granularity == 'month':
+            return f"{_MONTHS[moment.month - 1]} {moment.year}", (moment.year, moment.month)
+        if granularity == 'quarter':
+            quarter = (moment.month - 1) // 3 + 1
+            return f"Q{quarter} {moment.year}", (moment.year, quarter)
+        return str(moment.year), moment.year
+    return value, value
+
+
+def _aggregate(function: str, values: List[Any]) -> Any:
+    present = [v for v in values if v is not False and v is not None]
+    if function == 'count':
+        return len(present)
+    if function == 'count_distinct':
+        return len({v[0] if isinstance(v, list) else v for v in present})
+    if function == 'array_agg':
+        return present
+    if function == 'bool_and':
+        return all(present)
+    if function == 'bool_or':
+        return any(present)
+    if not present:
+        return False
+    if function == 'avg':
+        return sum(present) / len(present)
+    if function == 'min':
+        return min(present)
+    if function == 'max':
+        return max(present)
+    return sum(present)
+
+
+def _project(record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    if not fields:
+        result = dict(record)
+    else:
+        result = {'id': record['id']}
+        for field in fields:
+            result[field] = record.get(field, False)
+    for field in _PRECISE_FIELDS:
+        value = result.get(field)
+        if isinstance(value, str) and len(value) > 19:
+            result[field] = value[:19]
+    return result
+
+
+# Timestamps stored with microseconds and returned truncated to the second
+_PRECISE_FIELDS = ('create_date', 'write_date')
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime(ODOO_DATETIME_FORMAT + '.%f')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes: without TCP_NODELAY the body of a
+    # keep-alive reply waits ~40 ms for the client's delayed ACK
+    disable_nagle_algorithm = True
+    fake: FakeOdooServer = None
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        
+        delay = self.fake.latency + (random.uniform(0, self.fake.jitter) if self.fake.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        
+        if self.path.rstrip('/') == '/jsonrpc':
+            self._reply(*self._handle_jsonrpc(body))
+        elif self.path.rstrip('/') in ('/xmlrpc/2/common', '/xmlrpc/2/object'):
+            self._reply(*self._handle_xmlrpc(self.path.rstrip('/').rsplit('/', 1)[1], body))
+        else:
+            self._reply(404, 'text/plain', b'Not Found')
+    
+    def _handle_jsonrpc(self, body: bytes) -> tuple:
+        codec = self.fake._codec
+        request_id = None
+        try:
+            request = codec.loads(body)
+            request_id = request.get('id')
+            params = request.get('params') or {}
+            result = self.fake.dispatch(params.get('service'), params.get('method'), params.get('args') or [])
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except Exception as e:
+            response = {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': 200,
+                    'message': 'Odoo Server Error',
+                    'data': {'name': type(e).__name__, 'message': str(e), 'arguments': [str(e)]},
+                },
+            }
+        return 200, 'application/json', codec.dumps(response)
+    
+    def _handle_xmlrpc(self, service: str, body: bytes) -> tuple:
+        try:
+            params, method = xmlrpc.client.loads(body, use_builtin_types=True)
+            result = self.fake.dispatch(service, method, list(params))
+            payload = xmlrpc.client.dumps((result,), methodresponse=True, allow_none=True)
+        except Exception as e:
+            payload = xmlrpc.client.dumps(xmlrpc.client.Fault(1, str(e)), allow_none=True)
+        return 200, 'text/xml', payload.encode('utf-8')
+    
+    def _reply(self, status: int, content_type: str, payload: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if (self.fake.gzip and len(payload) >= GZIP_MIN_SIZE
+                and 'gzip' in self.headers.get('Accept-Encoding', '')):
+            payload = gzip.compress(payload, compresslevel=1)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _serve(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: python -m python_client.fakeserver"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run an in-memory fake Odoo server")
+    parser.add_argument('--port', type=int, default=8069)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--db', default='odoo')
+    parser.add_argument('--mos', type=int, default=10000, help="manufacturing orders to generate")
+    parser.add_argument('--products', type=int, default=500)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--gzip', action='store_true', help="gzip responses when the client accepts it")
+    args = parser.parse_args(argv)
+    
+    data = generate_dataset(args.mos, args.products, args.users, args.seed)
+    server = FakeOdooServer(
+        data, latency=args.latency, db=args.db, host=args.host, port=args.port, gzip=args.gzip
+    ).start()
+    print(f"Fake Odoo serving {args.mos} manufacturing orders at {server.url} (db={args.db})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    _serve()
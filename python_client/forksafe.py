@@ -0,0 +1,41 @@
+"""
+Fork safety
+===========
+
+A forked child inherits every lock of the parent in the state it had at the
+time of ``fork()``, but only the forking thread survives: a lock held by any
+other parent thread (a metrics update, a limiter wait, a pending batch) stays
+held forever and the child deadlocks on its first use.
+
+Objects owning locks register here; after a fork, the child calls their
+``_after_fork()`` method, which recreates the locks and drops state tied to
+parent threads (in-flight slots, pending batches, polling watchers).
+
+Example usage:
+    >>> class Counter:
+    ...     def __init__(self):
+    ...         self._after_fork()
+    ...         register_fork_reset(self)
+    ...     def _after_fork(self):
+    ...         self._lock = threading.Lock()
+"""
+
+import os
+import weakref
+
+# Live objects to reset in a forked child (weak: registering never leaks)
+_instances: 'weakref.WeakSet' = weakref.WeakSet()
+
+
+def register_fork_reset(obj) -> None:
+    """Call ``obj._after_fork()`` in every child forked while obj is alive"""
+    _instances.add(obj)
+
+
+def _reset_in_child() -> None:
+    for obj in list(_instances):
+        obj._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_in_child)
@@ -0,0 +1,126 @@
+"""
+Process-safe JSON file store
+============================
+
+Shared persistence for the small JSON caches of the client (sync
+checkpoints, sessions, schemas). Several threads and several processes
+(cron scripts, workers) may update the same file:
+
+- updates are read-modify-write cycles under a thread lock and an exclusive
+  ``fcntl`` lock on a ``<path>.lock`` side file, so concurrent writers never
+  lose each other's keys (where ``fcntl`` is unavailable, e.g. on Windows,
+  only the thread lock applies)
+- new contents go to a unique temporary file (``mkstemp``, mode 0600) that is
+  atomically renamed over the previous one, so readers never see a partial
+  file and no lock is needed to read
+
+Example usage:
+    >>> store = JSONFileStore('/tmp/state.json')
+    >>> with store.update() as data:
+    ...     data['answer'] = 42
+    >>> store.read()
+    {'answer': 42}
+"""
+
+import os
+import json
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterator
+
+from .forksafe import register_fork_reset
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class JSONFileStore:
+    """
+    JSON object persisted in one file, shared by threads and processes
+    """
+    
+    def __init__(self, path: str, indent: Optional[int] = None):
+        """
+        Initialize the store
+        
+        Args:
+            path: JSON file path (parent directories are created on write)
+            indent: ``json.dump`` indentation of the written file
+        """
+        self.path = path
+        self.indent = indent
+        self._lock = threading.Lock()
+        register_fork_reset(self)
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock in a forked child (see forksafe)"""
+        self._lock = threading.Lock()
+    
+    def read(self) -> Dict[str, Any]:
+        """
+        Return the stored object
+        
+        Returns:
+            The decoded object, or {} if the file is missing or unreadable
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable file: callers fall back to their defaults
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    @contextmanager
+    def update(self) -> Iterator[Dict[str, Any]]:
+        """
+        Read-modify-write the stored object under an exclusive lock
+        
+        Yields the current object; it is written back on exit if the block
+        changed it and raised no exception.
+        """
+        with self._lock, self._file_lock():
+            data = self.read()
+            before = json.dumps(data, sort_keys=True)
+            yield data
+            if json.dumps(data, sort_keys=True) != before:
+                self._write(data)
+    
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        
+        self._makedirs()
+        with open(f"{self.path}.lock", 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _write(self, data: Dict[str, Any]) -> None:
+        directory = self._makedirs()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory or None, prefix=f"{os.path.basename(self.path)}.", suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=self.indent, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _makedirs(self) -> str:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return directory
@@ -0,0 +1,233 @@
+"""
+Request-coalescing record loader
+================================
+
+DataLoader-style batcher on top of :meth:`OdooClient.read`. Single-record
+lookups (``get_product``, ``get_user``, ``get_manufacturing_order``, ...)
+issued within a short time window, or inside an explicit ``batch()`` scope,
+are collected and sent as one ``read`` per model with the union of the
+requested ids and fields. Each caller receives a future resolved from that
+shared response. Odoo fails a whole ``read`` when one id is missing (or not
+readable), so a failed batch is split in halves and read again until the
+failing ids are isolated; only their callers receive the error.
+
+Example usage:
+    >>> loader = RecordLoader(client)
+    >>> with loader.batch():
+    ...     products = [loader.get_product(mo['product_id'][0]) for mo in orders]
+    ...     users = [loader.get_user(mo['user_id'][0]) for mo in orders if mo['user_id']]
+    >>> names = [p.result()['name'] for p in products]
+"""
+
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Iterator
+
+from .odoo_client import (
+    OdooAPIError,
+    OdooConnectionError,
+    OdooClient,
+    logger,
+    MANUFACTURING_ORDER_DETAIL_FIELDS,
+    PRODUCT_FIELDS,
+    USER_FIELDS,
+)
+from .forksafe import register_fork_reset
+
+# Labels used in "not found" errors, matching the OdooClient getters
+RECORD_LABELS = {
+    'mrp.production': 'Manufacturing order',
+    'product.product': 'Product',
+    'res.users': 'User',
+}
+
+
+class _PendingBatch:
+    """Ids and fields requested for one model since the last dispatch"""
+    
+    __slots__ = ('waiters', 'fields')
+    
+    def __init__(self):
+        # id -> list of (future, requested fields or None for all fields)
+        self.waiters: Dict[int, List[tuple]] = {}
+        # Union of requested fields; None once any caller asked for all fields
+        self.fields: Optional[set] = set()
+    
+    def add(self, record_id: int, fields: Optional[List[str]], future: Future) -> None:
+        self.waiters.setdefault(record_id, []).append((future, fields))
+        if fields is None:
+            self.fields = None
+        elif self.fields is not None:
+            self.fields.update(fields)
+
+
+class RecordLoader:
+    """
+    Coalesces single-record reads into batched ``read`` calls
+    
+    Two batching modes are supported and can be mixed:
+    
+    - Time window: the first request starts a timer; everything requested
+      before it fires (``window`` seconds) is sent together. Useful when
+      several threads resolve records concurrently.
+    - Explicit scope: inside ``with loader.batch():`` nothing is sent until
+      the outermost scope exits. Do not wait on futures inside the scope.
+    """
+    
+    def __init__(
+        self,
+        client: OdooClient,
+        window: float = 0.005,
+        max_batch_size: int = 1000
+    ):
+        """
+        Initialize the loader
+        
+        Args:
+            client: Client used to issue the batched reads
+            window: Seconds to wait for more requests before dispatching
+            max_batch_size: Maximum ids per ``read`` call
+        """
+        self.client = client
+        self.window = window
+        self.max_batch_size = max_batch_size
+        
+        self._lock = threading.Lock()
+        register_fork_reset(self)
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._scope_depth = 0
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock and drop pending batches in a forked child (see forksafe)"""
+        self._lock = threading.Lock()
+        # The parent's waiters and timer thread do not exist in the child
+        self._pending = {}
+        self._timer = None
+        self._scope_depth = 0
+    
+    # ==================== Request API ====================
+    
+    def load(self, model: str, record_id: int, fields: List[str] = None) -> Future:
+        """
+        Request a single record
+        
+        Args:
+            model: Model name
+            record_id: Record ID
+            fields: Fields to retrieve (None = all)
+        
+        Returns:
+            Future resolving to the record dictionary, or failing with
+            OdooAPIError if the record does not exist
+        """
+        future = Future()
+        fields = list(fields) if fields is not None else None
+        
+        with self._lock:
+            self._pending.setdefault(model, _PendingBatch()).add(record_id, fields, future)
+            if self._scope_depth == 0 and self._timer is None:
+                self._timer = threading.Timer(self.window, self.dispatch)
+                self._timer.daemon = True
+                self._timer.start()
+        
+        return future
+    
+    def load_many(self, model: str, ids: List[int], fields: List[str] = None) -> List[Future]:
+        """Request several records; returns one future per id, in order"""
+        return [self.load(model, record_id, fields) for record_id in ids]
+    
+    def get_manufacturing_order(self, mo_id: int, fields: List[str] = None) -> Future:
+        """Batched counterpart of OdooClient.get_manufacturing_order"""
+        if fields is None:
+            fields = list(MANUFACTURING_ORDER_DETAIL_FIELDS)
+        return self.load('mrp.production', mo_id, fields)
+    
+    def get_product(self, product_id: int, fields: List[str] = None) -> Future:
+        """Batched counterpart of OdooClient.get_product"""
+        if fields is None:
+            fields = list(PRODUCT_FIELDS)
+        return self.load('product.product', product_id, fields)
+    
+    def get_user(self, user_id: int, fields: List[str] = None) -> Future:
+        """Batched counterpart of OdooClient.get_user"""
+        if fields is None:
+            fields = list(USER_FIELDS)
+        return self.load('res.users', user_id, fields)
+    
+    @contextmanager
+    def batch(self) -> Iterator['RecordLoader']:
+        """
+        Collect every request made inside the block and dispatch them on exit
+        
+        Example:
+            >>> with loader.batch():
+            ...     a = loader.get_product(1)
+            ...     b = loader.get_product(2)
+            >>> a.result(), b.result()
+        """
+        with self._lock:
+            self._scope_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._scope_depth -= 1
+                outermost = self._scope_depth == 0
+            if outermost:
+                self.dispatch()
+    
+    # ==================== Dispatch ====================
+    
+    def dispatch(self) -> None:
+        """Send all pending requests now (one ``read`` per model and chunk)"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        
+        for model, batch in pending.items():
+            self._dispatch_model(model, batch)
+    
+    def _dispatch_model(self, model: str, batch: _PendingBatch) -> None:
+        ids = list(batch.waiters)
+        fields = sorted(batch.fields) if batch.fields is not None else None
+        if fields is not None and 'id' not in fields:
+            fields.append('id')
+        
+        for start in range(0, len(ids), self.max_batch_size):
+            self._read_chunk(model, ids[start:start + self.max_batch_size], fields, batch)
+    
+    def _read_chunk(self, model: str, chunk: List[int], fields: Optional[List[str]], batch: _PendingBatch) -> None:
+        """Read a chunk and resolve its futures, splitting it if the read fails"""
+        logger.debug(f"Batched read of {len(chunk)} {model} record(s)")
+        try:
+            records = {record['id']: record for record in self.client.read(model, chunk, fields)}
+        except Exception as e:
+            if len(chunk) > 1 and not isinstance(e, OdooConnectionError):
+                # A deleted or forbidden id fails the whole read: isolate it
+                middle = len(chunk) // 2
+                self._read_chunk(model, chunk[:middle], fields, batch)
+                self._read_chunk(model, chunk[middle:], fields, batch)
+                return
+            error = e if isinstance(e, OdooAPIError) else OdooAPIError(f"Batched read failed: {str(e)}")
+            for record_id in chunk:
+                for future, _ in batch.waiters[record_id]:
+                    future.set_exception(error)
+            return
+        
+        for record_id in chunk:
+            record = records.get(record_id)
+            for future, requested in batch.waiters[record_id]:
+                if record is None:
+                    label = RECORD_LABELS.get(model, f"{model} record")
+                    future.set_exception(OdooAPIError(f"{label} {record_id} not found"))
+                elif requested is None:
+                    future.set_result(dict(record))
+                else:
+                    future.set_result({
+                        field: record[field]
+                        for field in ['id'] + requested if field in record
+                    })
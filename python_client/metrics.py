@@ -0,0 +1,275 @@
+"""
+Per-call metrics for OdooClient
+===============================
+
+Records, per (model, method, protocol):
+- latency histogram (seconds)
+- request / response payload size histograms (bytes)
+- error counts, retries and record cache hits/misses
+
+and exposes them as a Python snapshot or in the Prometheus text exposition
+format.
+
+Example usage:
+    >>> client = OdooClient()
+    >>> client.search_manufacturing_orders(limit=10)
+    >>> client.metrics.snapshot()['mrp.production.search_read/jsonrpc']['p99']
+    >>> print(client.metrics.render_prometheus())
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+from .forksafe import register_fork_reset
+
+# Default histogram bucket upper bounds
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864
+)
+
+Labels = Tuple[str, str, str]
+
+
+class Histogram:
+    """Fixed-bucket histogram (cumulative counts computed on export)"""
+    
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # One slot per bound plus the +Inf overflow bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+    
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket"""
+        if not self.count:
+            return 0.0
+        
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                if i == len(self.bounds):
+                    # Overflow bucket has no upper bound
+                    return self.bounds[-1]
+                upper = self.bounds[i]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, cumulative count) pairs including +Inf"""
+        pairs = []
+        running = 0
+        for bound, bucket_count in zip(self.bounds, self.counts):
+            running += bucket_count
+            pairs.append((_format_number(bound), running))
+        pairs.append(('+Inf', running + self.counts[-1]))
+        return pairs
+
+
+class _CallStats:
+    __slots__ = ('latency', 'request_size', 'response_size', 'errors', 'retries')
+    
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_size = Histogram(SIZE_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.errors = 0
+        self.retries = 0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe metrics store shared by one or more clients
+    """
+    
+    def __init__(self, enabled: bool = True, prefix: str = 'odoo_client'):
+        """
+        Initialize the registry
+        
+        Args:
+            enabled: Set to False to make all recording a no-op
+            prefix: Metric name prefix used in the Prometheus export
+        """
+        self.enabled = enabled
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        register_fork_reset(self)
+        self._calls: Dict[Labels, _CallStats] = {}
+        # (model, counter name) -> value, e.g. cache hits
+        self._counters: Dict[Tuple[str, str], int] = {}
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock in a forked child (see forksafe)"""
+        self._lock = threading.Lock()
+    
+    def _stats(self, labels: Labels) -> _CallStats:
+        stats = self._calls.get(labels)
+        if stats is None:
+            stats = self._calls[labels] = _CallStats()
+        return stats
+    
+    # ==================== Recording ====================
+    
+    def observe_call(
+        self,
+        model: str,
+        method: str,
+        protocol: str,
+        latency: float,
+        request_bytes: Optional[int] = None,
+        response_bytes: Optional[int] = None,
+        error: bool = False
+    ) -> None:
+        """
+        Record one RPC
+        
+        Args:
+            model: Model name ('' for the common service)
+            method: Method name
+            protocol: 'jsonrpc' or 'xmlrpc'
+            latency: Duration in seconds
+            request_bytes: Encoded request size (None = unknown)
+            response_bytes: Response body size (None = unknown)
+            error: Whether the call failed
+        """
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            stats = self._stats((model, method, protocol))
+            stats.latency.observe(latency)
+            if request_bytes is not None:
+                stats.request_size.observe(request_bytes)
+            if response_bytes is not None:
+                stats.response_size.observe(response_bytes)
+            if error:
+                stats.errors += 1
+    
+    def record_retry(self, model: str, method: str, protocol: str) -> None:
+        """Count a retried call"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._stats((model, method, protocol)).retries += 1
+    
+    def record_cache(self, model: str, hits: int = 0, misses: int = 0) -> None:
+        """Count record cache lookups for a model"""
+        self.increment(model, 'cache_hits', hits)
+        self.increment(model, 'cache_misses', misses)
+    
+    def increment(self, model: str, name: str, value: int = 1) -> None:
+        """Add to a per-model counter"""
+        if not self.enabled or not value:
+            return
+        with self._lock:
+            key = (model, name)
+            self._counters[key] = self._counters.get(key, 0) + value
+    
+    def reset(self) -> None:
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._calls.clear()
+            self._counters.clear()
+    
+    # ==================== Export ====================
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize recorded calls
+        
+        Returns:
+            Mapping of 'model.method/protocol' (or 'method/protocol' for the
+            common service) to calls, errors, retries, latency totals and
+            estimated p50/p95/p99, payload byte totals and cache counters
+        """
+        with self._lock:
+            summary = {}
+            for (model, method, protocol), stats in self._calls.items():
+                key = f"{model}.{method}/{protocol}" if model else f"{method}/{protocol}"
+                latency = stats.latency
+                summary[key] = {
+                    'calls': latency.count,
+                    'errors': stats.errors,
+                    'retries': stats.retries,
+                    'latency_total': latency.total,
+                    'latency_avg': latency.total / latency.count if latency.count else 0.0,
+                    'p50': latency.quantile(0.5),
+                    'p95': latency.quantile(0.95),
+                    'p99': latency.quantile(0.99),
+                    'request_bytes': int(stats.request_size.total),
+                    'response_bytes': int(stats.response_size.total),
+                }
+            for (model, name), value in self._counters.items():
+                summary.setdefault(model, {})[name] = value
+            return summary
+    
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        p = self.prefix
+        lines = []
+        
+        with self._lock:
+            calls = sorted(self._calls.items())
+            counters = sorted(self._counters.items())
+            
+            for attr, name, help_text in (
+                ('latency', 'request_duration_seconds', 'Odoo RPC latency in seconds'),
+                ('request_size', 'request_size_bytes', 'Encoded request payload size in bytes'),
+                ('response_size', 'response_size_bytes', 'Response body size in bytes'),
+            ):
+                lines.append(f"# HELP {p}_{name} {help_text}")
+                lines.append(f"# TYPE {p}_{name} histogram")
+                for labels, stats in calls:
+                    histogram = getattr(stats, attr)
+                    if not histogram.count:
+                        continue
+                    base = _format_labels(labels)
+                    for le, count in histogram.cumulative():
+                        lines.append(f'{p}_{name}_bucket{{{base},le="{le}"}} {count}')
+                    lines.append(f"{p}_{name}_sum{{{base}}} {_format_number(histogram.total)}")
+                    lines.append(f"{p}_{name}_count{{{base}}} {histogram.count}")
+            
+            for attr, name, help_text in (
+                ('errors', 'errors_total', 'Failed Odoo RPCs'),
+                ('retries', 'retries_total', 'Retried Odoo RPCs'),
+            ):
+                lines.append(f"# HELP {p}_{name} {help_text}")
+                lines.append(f"# TYPE {p}_{name} counter")
+                for labels, stats in calls:
+                    lines.append(f"{p}_{name}{{{_format_labels(labels)}}} {getattr(stats, attr)}")
+            
+            for counter_name in sorted({name for (_, name), _ in counters}):
+                lines.append(f"# HELP {p}_{counter_name}_total Client counter {counter_name}")
+                lines.append(f"# TYPE {p}_{counter_name}_total counter")
+                for (model, name), value in counters:
+                    if name == counter_name:
+                        lines.append(f'{p}_{counter_name}_total{{model="{_escape(model)}"}} {value}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    model, method, protocol = labels
+    return f'model="{_escape(model)}",method="{_escape(method)}",protocol="{_escape(protocol)}"'
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
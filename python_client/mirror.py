@@ -0,0 +1,498 @@
+"""
+Local SQLite mirror
+===================
+
+Materializes manufacturing orders, products and users into a local SQLite
+database so that repeated dashboard filters (state, responsible user,
+product, deadline ranges, ...) are answered from indexed local tables
+instead of a round-trip to Odoo.
+
+Features:
+- One table per model; hot filter fields are extracted into indexed
+  columns, the full record is kept as JSON
+- Incremental refresh via ``OdooClient.sync_changes``, with the watermark
+  stored in the same database (committed together with the data)
+- Optional pruning of records deleted in Odoo
+- Query methods returning the same dict shapes as ``search_read``
+
+Example usage:
+    >>> mirror = OdooMirror(client, 'odoo_mirror.db')
+    >>> mirror.refresh()
+    >>> mirror.search_manufacturing_orders(state=['confirmed', 'progress'], user_id=7)
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from .domain import datetime_bound
+from .odoo_client import (
+    OdooAPIError,
+    OdooClient,
+    logger,
+    MANUFACTURING_ORDER_FIELDS,
+    PRODUCT_FIELDS,
+    USER_FIELDS,
+)
+
+# Per-model mirror layout: indexed columns (name -> SQLite type), extra
+# indexes and the domain used when syncing (archived records included)
+MIRROR_MODELS = {
+    'mrp.production': {
+        'table': 'mrp_production',
+        'fields': MANUFACTURING_ORDER_FIELDS,
+        'columns': {
+            'name': 'TEXT',
+            'state': 'TEXT',
+            'user_id': 'INTEGER',
+            'product_id': 'INTEGER',
+            'company_id': 'INTEGER',
+            'date_deadline': 'TEXT',
+            'date_planned_start': 'TEXT',
+        },
+        'indexes': [
+            ('state',), ('user_id',), ('product_id',), ('date_deadline',),
+            ('state', 'date_deadline'), ('user_id', 'state'),
+        ],
+        'domain': [],
+    },
+    'product.product': {
+        'table': 'product_product',
+        'fields': PRODUCT_FIELDS,
+        'columns': {
+            'name': 'TEXT',
+            'default_code': 'TEXT',
+            'barcode': 'TEXT',
+            'categ_id': 'INTEGER',
+            'type': 'TEXT',
+            'active': 'INTEGER',
+        },
+        'indexes': [('default_code',), ('barcode',), ('categ_id',), ('active',)],
+        'domain': ['|', ('active', '=', True), ('active', '=', False)],
+    },
+    'res.users': {
+        'table': 'res_users',
+        'fields': USER_FIELDS,
+        'columns': {
+            'name': 'TEXT',
+            'login': 'TEXT',
+            'email': 'TEXT',
+            'company_id': 'INTEGER',
+            'active': 'INTEGER',
+        },
+        'indexes': [('login',), ('company_id',), ('active',)],
+        'domain': ['|', ('active', '=', True), ('active', '=', False)],
+    },
+}
+
+# Operators accepted by the local query builder
+SQL_OPERATORS = {'=', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'like'}
+
+Condition = Tuple[str, str, Any]
+
+
+class _MirrorCheckpoints:
+    """
+    CheckpointStore backed by the mirror database
+    
+    ``OdooClient.sync_changes`` saves the watermark after each page; the
+    mirror flushes the buffered page and the watermark in one transaction.
+    """
+    
+    def __init__(self, mirror: 'OdooMirror'):
+        self.mirror = mirror
+    
+    def load(self, url: str, db: str, model: str) -> Tuple[Optional[str], int]:
+        rows = self.mirror._fetchall(
+            "SELECT write_date, last_id FROM sync_state WHERE model = ?", (model,)
+        )
+        return rows[0] if rows else (None, 0)
+    
+    def save(self, url: str, db: str, model: str, write_date: str, record_id: int) -> None:
+        self.mirror._flush(model, (write_date, record_id))
+    
+    def reset(self, url: str, db: str, model: str) -> None:
+        with self.mirror._lock:
+            self.mirror._conn.execute("DELETE FROM sync_state WHERE model = ?", (model,))
+            self.mirror._conn.commit()
+
+
+class OdooMirror:
+    """
+    SQLite materialization of mrp.production, product.product and res.users
+    """
+    
+    def __init__(
+        self,
+        client: OdooClient,
+        path: str = 'odoo_mirror.db',
+        page_size: int = 1000
+    ):
+        """
+        Open (and create if needed) the mirror database
+        
+        Args:
+            client: Client used to refresh the mirror
+            path: SQLite database file (':memory:' for a transient mirror)
+            page_size: Records per request when refreshing
+        """
+        self.client = client
+        self.path = path
+        self.page_size = page_size
+        
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._refresh_timer: Optional[threading.Timer] = None
+        
+        self._create_schema()
+    
+    def close(self) -> None:
+        """Stop auto-refresh and close the database"""
+        self.stop_auto_refresh()
+        with self._lock:
+            self._conn.close()
+    
+    def _create_schema(self) -> None:
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "model TEXT PRIMARY KEY, write_date TEXT, last_id INTEGER)"
+            )
+            for spec in MIRROR_MODELS.values():
+                table = spec['table']
+                columns = ''.join(f", {name} {sql_type}" for name, sql_type in spec['columns'].items())
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    f"id INTEGER PRIMARY KEY{columns}, write_date TEXT, data TEXT NOT NULL)"
+                )
+                for index in spec['indexes']:
+                    self._conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(index)} "
+                        f"ON {table} ({', '.join(index)})"
+                    )
+            self._conn.commit()
+    
+    def _fetchall(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    # ==================== Refresh ====================
+    
+    def refresh(self, models: List[str] = None, full: bool = False) -> Dict[str, int]:
+        """
+        Pull changes from Odoo into the mirror
+        
+        Args:
+            models: Models to refresh (default: all mirrored models)
+            full: Ignore the stored watermark and re-pull everything
+        
+        Returns:
+            Number of upserted records per model
+        """
+        counts = {}
+        for model in models or list(MIRROR_MODELS):
+            spec = self._spec(model)
+            fields = list(spec['fields']) + ['write_date']
+            self._buffers[model] = []
+            count = 0
+            
+            for record in self.client.sync_changes(
+                model, fields, domain=spec['domain'], page_size=self.page_size,
+                checkpoints=_MirrorCheckpoints(self), reset=full
+            ):
+                self._buffers[model].append(record)
+                count += 1
+            
+            # sync_changes flushes on each checkpoint; anything left is a partial page
+            self._flush(model)
+            counts[model] = count
+            logger.info(f"Mirror refreshed {count} {model} record(s)")
+        
+        return counts
+    
+    def prune(self, models: List[str] = None) -> Dict[str, int]:
+        """
+        Delete mirrored records that no longer exist in Odoo
+        
+        Fetches the full id list of each model, so run it less often than
+        :meth:`refresh`.
+        
+        Returns:
+            Number of deleted records per model
+        """
+        counts = {}
+        for model in models or list(MIRROR_MODELS):
+            spec = self._spec(model)
+            remote_ids = {
+                record['id']
+                for record in self.client.iter_search_read(model, spec['domain'], ['id'], self.page_size)
+            }
+            with self._lock:
+                local_ids = {row[0] for row in self._conn.execute(f"SELECT id FROM {spec['table']}")}
+                stale = [(record_id,) for record_id in local_ids - remote_ids]
+                self._conn.executemany(f"DELETE FROM {spec['table']} WHERE id = ?", stale)
+                self._conn.commit()
+            counts[model] = len(stale)
+        return counts
+    
+    def start_auto_refresh(self, interval: float = 60.0) -> None:
+        """Refresh every ``interval`` seconds on a background timer"""
+        def run():
+            try:
+                self.refresh()
+            except Exception:
+                # Any failure must not end the timer chain
+                logger.exception("Mirror refresh failed")
+            with self._lock:
+                if self._refresh_timer is not None:
+                    self._schedule(interval, run)
+        
+        with self._lock:
+            self._schedule(interval, run)
+    
+    def stop_auto_refresh(self) -> None:
+        """Stop the background refresh timer"""
+        with self._lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+    
+    def _schedule(self, interval: float, run) -> None:
+        self._refresh_timer = threading.Timer(interval, run)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _flush(self, model: str, watermark: Tuple[str, int] = None) -> None:
+        """Upsert buffered records (and the watermark) in one transaction"""
+        spec = self._spec(model)
+        records = self._buffers.get(model) or []
+        self._buffers[model] = []
+        
+        columns = list(spec['columns'])
+        placeholders = ', '.join('?' for _ in range(len(columns) + 3))
+        sql = (
+            f"INSERT OR REPLACE INTO {spec['table']} "
+            f"(id, {', '.join(columns)}, write_date, data) VALUES ({placeholders})"
+        )
+        rows = [
+            (record['id'], *[self._column_value(record.get(c)) for c in columns],
+             record.get('write_date') or None, json.dumps(record))
+            for record in records
+        ]
+        
+        with self._lock:
+            self._conn.executemany(sql, rows)
+            if watermark:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (model, write_date, last_id) VALUES (?, ?, ?)",
+                    (model, watermark[0], watermark[1])
+                )
+            self._conn.commit()
+    
+    @staticmethod
+    def _column_value(value: Any) -> Any:
+        """Map an Odoo field value to its indexed column value"""
+        if isinstance(value, (list, tuple)):
+            # many2one [id, name] -> id
+            return value[0] if value else None
+        if value is False:
+            return None
+        if value is True:
+            return 1
+        return value
+    
+    # ==================== Queries ====================
+    
+    def query(
+        self,
+        model: str,
+        conditions: List[Condition] = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'id'
+    ) -> List[Dict[str, Any]]:
+        """
+        Query mirrored records on indexed columns
+        
+        Args:
+            model: Mirrored model name
+            conditions: (column, operator, value) triplets combined with AND;
+                many2one columns compare on the id
+            fields: Fields to return (None = all mirrored fields)
+            limit: Maximum records (0 = no limit)
+            offset: Skip records
+            order: Sort order on indexed columns (e.g. 'date_deadline desc, id');
+                many2one columns sort on the id, not on the name as in Odoo
+        
+        Returns:
+            List of record dictionaries shaped like search_read results
+        """
+        spec = self._spec(model)
+        where, params = self._where(spec, conditions or [])
+        sql = f"SELECT data FROM {spec['table']}{where} ORDER BY {self._order(spec, order)}"
+        if limit:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(offset)
+        
+        records = [json.loads(row[0]) for row in self._fetchall(sql, tuple(params))]
+        if fields:
+            keep = ['id'] + [f for f in fields if f != 'id']
+            records = [{f: record.get(f, False) for f in keep} for record in records]
+        return records
+    
+    def count(self, model: str, conditions: List[Condition] = None) -> int:
+        """Count mirrored records matching the conditions"""
+        spec = self._spec(model)
+        where, params = self._where(spec, conditions or [])
+        return self._fetchall(f"SELECT COUNT(*) FROM {spec['table']}{where}", tuple(params))[0][0]
+    
+    def get(self, model: str, record_id: int) -> Optional[Dict[str, Any]]:
+        """Return one mirrored record or None"""
+        rows = self._fetchall(
+            f"SELECT data FROM {self._spec(model)['table']} WHERE id = ?", (record_id,)
+        )
+        return json.loads(rows[0][0]) if rows else None
+    
+    def search_manufacturing_orders(
+        self,
+        state: Union[str, List[str]] = None,
+        user_id: Union[int, List[int]] = None,
+        product_id: Union[int, List[int]] = None,
+        deadline_from: str = None,
+        deadline_to: str = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'date_deadline desc'
+    ) -> List[Dict[str, Any]]:
+        """
+        Search mirrored manufacturing orders
+        
+        Args:
+            state: State or list of states
+            user_id: Responsible user id(s)
+            product_id: Product id(s)
+            deadline_from: Inclusive lower bound on date_deadline (a date
+                means the start of that day)
+            deadline_to: Inclusive upper bound on date_deadline (a date
+                means the end of that day, as in Odoo domains)
+            fields: Fields to return
+            limit: Maximum records
+            offset: Skip records
+            order: Sort order
+        
+        Returns:
+            List of manufacturing order records
+        """
+        conditions = self._match('state', state) + self._match('user_id', user_id) \
+            + self._match('product_id', product_id)
+        if deadline_from: conditions.append(('date_deadline', '>=', datetime_bound('>=', deadline_from)))
+        if deadline_to: conditions.append(('date_deadline', '<=', datetime_bound('<=', deadline_to)))
+        
+        return self.query('mrp.production', conditions, fields, limit, offset, order)
+    
+    def search_products(
+        self,
+        name: str = None,
+        default_code: str = None,
+        categ_id: Union[int, List[int]] = None,
+        active: Optional[bool] = True,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'name'
+    ) -> List[Dict[str, Any]]:
+        """Search mirrored products (name is a case-insensitive substring match)"""
+        conditions = self._match('default_code', default_code) + self._match('categ_id', categ_id)
+        if name: conditions.append(('name', 'like', f"%{name}%"))
+        if active is not None: conditions.append(('active', '=', int(active)))
+        
+        return self.query('product.product', conditions, fields, limit, offset, order)
+    
+    def search_users(
+        self,
+        login: str = None,
+        company_id: Union[int, List[int]] = None,
+        active: Optional[bool] = True,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = 'name'
+    ) -> List[Dict[str, Any]]:
+        """Search mirrored users"""
+        conditions = self._match('login', login) + self._match('company_id', company_id)
+        if active is not None: conditions.append(('active', '=', int(active)))
+        
+        return self.query('res.users', conditions, fields, limit, offset, order)
+    
+    # ==================== Helpers ====================
+    
+    @staticmethod
+    def _spec(model: str) -> Dict[str, Any]:
+        spec = MIRROR_MODELS.get(model)
+        if spec is None:
+            raise OdooAPIError(f"Model {model} is not mirrored. Available: {', '.join(MIRROR_MODELS)}")
+        return spec
+    
+    @staticmethod
+    def _match(column: str, value: Any) -> List[Condition]:
+        if value is None:
+            return []
+        if isinstance(value, (list, tuple, set)):
+            return [(column, 'in', list(value))]
+        return [(column, '=', value)]
+    
+    @staticmethod
+    def _where(spec: Dict[str, Any], conditions: List[Condition]) -> Tuple[str, list]:
+        allowed = set(spec['columns']) | {'id', 'write_date'}
+        clauses, params = [], []
+        
+        for column, operator, value in conditions:
+            operator = operator.lower()
+            if column not in allowed:
+                raise OdooAPIError(f"Column {column} is not indexed in the {spec['table']} mirror")
+            if operator not in SQL_OPERATORS:
+                raise OdooAPIError(f"Unsupported operator in mirror query: {operator}")
+            
+            if operator in ('in', 'not in'):
+                values = list(value)
+                if not values:
+                    clauses.append('0' if operator == 'in' else '1')
+                    continue
+                clauses.append(f"{column} {operator.upper()} ({', '.join('?' for _ in values)})")
+                params.extend(values)
+            elif value is None or value is False:
+                clauses.append(f"{column} IS {'NOT ' if operator == '!=' else ''}NULL")
+            else:
+                clauses.append(f"{column} {operator.upper()} ?")
+                params.append(value)
+        
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ''), params
+    
+    @staticmethod
+    def _order(spec: Dict[str, Any], order: str) -> str:
+        allowed = set(spec['columns']) | {'id', 'write_date'}
+        terms = []
+        
+        for term in (order or 'id').split(','):
+            parts = term.split()
+            if not parts:
+                continue
+            column = parts[0]
+            direction = parts[1].upper() if len(parts) > 1 else 'ASC'
+            if column not in allowed or direction not in ('ASC', 'DESC') or len(parts) > 2:
+                raise OdooAPIError(f"Invalid mirror order clause: {term.strip()}")
+            # Empty values last ascending, first descending, as in PostgreSQL
+            terms.append(f"{column} IS NULL {direction}, {column} {direction}")
+        
+        if 'id' not in [t.split()[0] for t in terms]:
+            terms.append('id ASC')
+        return ', '.join(terms)
@@ -21,11 +21,37 @@ Version: 1.0.0
 
 import os
 import json
+import time
 import logging
 import requests
+import threading
 import xmlrpc.client
-from typing import Dict, List, Any, Optional, Union
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator, Callable, TYPE_CHECKING
+from urllib.parse import urljoin, urlsplit
+
+from .codec import JSONCodec, get_codec, iter_jsonrpc_result, ODOO_DATETIME_FORMAT, ODOO_DATE_FORMAT
+from .columns import ColumnStore, build_columns, DEFAULT_CATEGORICAL_FIELDS
+from .exceptions import OdooAPIError, OdooConnectionError
+from .forksafe import register_fork_reset
+from .domain import (
+    RecordIndex, DomainError, compile_domain, top_level_leaves, DEFAULT_HASH_FIELDS, DEFAULT_SORTED_FIELDS
+)
+from .metrics import MetricsRegistry
+from .schema import (
+    SchemaCache, SCHEMA_ATTRIBUTES, HEAVY_FIELD_TYPES, FIELD_RENAMES, is_invalid_field_error, rename_fields,
+    restore_names
+)
+from .sync import CheckpointStore, iter_change_pages
+from .transport import RequestsTransport
+
+if TYPE_CHECKING:
+    from .cache import RecordCache
+    from .resilience import AdaptiveLimiter, RetryPolicy
+    from .registry import SessionStore
+    from .watch import ChangeEvent, Subscription
 
 # Configure logging
 logging.basicConfig(
@@ -35,10 +61,130 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Page size used by the streaming (keyset-paginated) iterators
+DEFAULT_PAGE_SIZE = 500
+
+# read_group date granularities and aggregate functions accepted by Odoo
+READ_GROUP_GRANULARITIES = frozenset({'day', 'week', 'month', 'quarter', 'year'})
+READ_GROUP_AGGREGATES = frozenset({
+    'sum', 'avg', 'min', 'max', 'count', 'count_distinct',
+    'array_agg', 'bool_and', 'bool_or',
+})
+
+# Records per create/write call in create_many/write_many
+DEFAULT_BATCH_SIZE = 100
+
+# Model methods that never modify data (safe to cache)
+READ_METHODS = frozenset({
+    'search', 'read', 'search_read', 'search_count',
+    'fields_get', 'read_group', 'name_search', 'name_get',
+})
+
+# Write-type methods whose touched records are known (ids argument or result),
+# so local snapshots can be refreshed instead of dropped
+LOCAL_REFRESH_METHODS = frozenset({'create', 'write', 'unlink'})
+
+# Field types resolved by prefetch_related
+RELATIONAL_FIELD_TYPES = frozenset({'many2one', 'one2many', 'many2many'})
+
+# Chunk size used when streaming JSON-RPC response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Default field lists used by the model-specific helpers
+MANUFACTURING_ORDER_FIELDS = [
+    'id', 'name', 'product_id', 'product_qty', 'product_uom_id',
+    'state', 'date_planned_start', 'date_deadline', 'priority',
+    'user_id', 'company_id', 'origin', 'qty_produced', 'qty_producing'
+]
+
+MANUFACTURING_ORDER_DETAIL_FIELDS = MANUFACTURING_ORDER_FIELDS + [
+    'bom_id', 'move_raw_ids', 'move_finished_ids'
+]
+
+PRODUCT_FIELDS = [
+    'id', 'name', 'default_code', 'barcode', 'list_price',
+    'standard_price', 'type', 'categ_id', 'uom_id',
+    'qty_available', 'virtual_available', 'description', 'active'
+]
+
+USER_FIELDS = [
+    'id', 'name', 'login', 'email', 'active',
+    'company_id', 'groups_id', 'lang'
+]
+
+
+def validate_config(url: Optional[str], db: Optional[str], username: Optional[str], api_key: Optional[str]) -> None:
+    """
+    Validate that all required connection settings are present and usable
+    
+    Shared by the synchronous and asyncio clients.
+    
+    Raises:
+        OdooAPIError: If a setting is missing or the URL is malformed
+    """
+    required = {
+        'ODOO_URL': url,
+        'ODOO_DB': db,
+        'ODOO_USERNAME': username,
+        'ODOO_API_KEY': api_key
+    }
+    
+    missing = [key for key, value in required.items() if not value]
+    
+    if missing:
+        raise OdooAPIError(
+            f"Missing required configuration: {', '.join(missing)}\n"
+            "Set environment variables or pass values to constructor."
+        )
+    
+    # Validate URL format
+    if not url.startswith(('http://', 'https://')):
+        raise OdooAPIError(
+            f"Invalid URL format: {url}\n"
+            "URL must start with http:// or https://"
+        )
+    
+    # Security warning for HTTP
+    if url.startswith('http://') and 'localhost' not in url:
+        logger.warning(
+            "WARNING: Using HTTP instead of HTTPS for production is insecure!"
+        )
+
+
+def _related_ids(field_type: str, value: Any) -> List[int]:
+    """Ids referenced by a relational field value ([id, name], id or id list)"""
+    if not value:
+        return []
+    if field_type == 'many2one':
+        return [value[0] if isinstance(value, (list, tuple)) else value]
+    return [related_id for related_id in value if isinstance(related_id, int)]
+
+
+def _requested_names(fields: List[str], renames: Dict[str, str]) -> List[str]:
+    """Field names as the caller requested them (see resolve_fields)"""
+    return [renames.get(field, field) for field in fields]
+
+
+def _iter_restored(records: Iterable[Dict[str, Any]], renames: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    for record in records:
+        yield restore_names([record], renames)[0]
+
+
+def _copy_result(result: Any) -> Any:
+    """Copy of a read result that its receiver can modify (records are copied one level deep)"""
+    if isinstance(result, list):
+        return [dict(item) if isinstance(item, dict) else item for item in result]
+    if isinstance(result, dict):
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in result.items()}
+    return result
 
-class OdooAPIError(Exception):
-    """Custom exception for Odoo API errors"""
-    pass
+
+class _Flight(Future):
+    """Result of a read in flight, with the number of callers waiting on it"""
+    
+    def __init__(self):
+        super().__init__()
+        self.followers = 0
 
 
 class OdooClient:
@@ -58,7 +204,21 @@ class OdooClient:
         db: Optional[str] = None,
         username: Optional[str] = None,
         api_key: Optional[str] = None,
-        protocol: str = 'jsonrpc'
+        protocol: str = 'jsonrpc',
+        cache: Optional['RecordCache'] = None,
+        timeout: float = 30,
+        session_scope: str = 'shared',
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        limiter: Optional['AdaptiveLimiter'] = None,
+        retry: Optional['RetryPolicy'] = None,
+        codec: Union[str, JSONCodec] = 'auto',
+        metrics: Optional[MetricsRegistry] = None,
+        session_store: Optional['SessionStore'] = None,
+        schema_cache: Optional[SchemaCache] = None,
+        single_flight: bool = False
     ):
         """
         Initialize Odoo client with credentials from environment variables or parameters
@@ -69,6 +229,33 @@ class OdooClient:
             username: Username/email (default: from ODOO_USERNAME env var)
             api_key: API key (default: from ODOO_API_KEY env var)
             protocol: 'jsonrpc' or 'xmlrpc' (default: jsonrpc)
+            cache: Optional RecordCache enabling read-through caching of
+                read/search_read for the models it has a TTL for
+            timeout: HTTP timeout per request in seconds
+            session_scope: 'shared' (one pooled HTTP session for all threads)
+                or 'thread' (one session per thread)
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum pooled connections per host
+            pool_block: Block instead of opening extra connections once a
+                host's pool is exhausted (hard per-host connection limit)
+            keep_alive: Reuse connections between requests
+            limiter: Optional AdaptiveLimiter bounding in-flight execute() calls
+            retry: Optional RetryPolicy retrying read-only methods on
+                connection errors
+            codec: JSON codec for JSON-RPC payloads: 'auto' (fastest
+                installed library), 'orjson', 'ujson', 'json' or a JSONCodec
+            metrics: MetricsRegistry collecting per-call latency, payload
+                sizes, errors and cache hits (default: a new registry owned
+                by this client; pass one to share it between clients, or
+                MetricsRegistry(enabled=False) to turn recording off)
+            session_store: Optional SessionStore caching the uid and server
+                version on disk, so new processes skip authenticate/version
+            schema_cache: Optional SchemaCache persisting fields_get results
+                per server version (schemas are always kept in memory)
+            single_flight: Let identical read calls made while the same call
+                is already in flight wait for and share its result instead
+                of sending another request (opt-in: a joined call may return
+                data read slightly before it was made)
         """
         # Load from environment variables or use provided values
         self.url = url or os.getenv('ODOO_URL')
@@ -80,62 +267,206 @@ class OdooClient:
         # User ID (set after authentication)
         self.uid = None
         
+        # Persisted uid/version cache (optional) and in-memory version info
+        self.session_store = session_store
+        self._uid_from_store = False
+        self._version = None
+        
+        # fields_get results per model (persisted by the optional schema cache)
+        self.schema_cache = schema_cache
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        
+        # Indexed in-memory snapshots answering queries locally (see load_local)
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        
+        # Change watchers shared per (model, domain) (see watch)
+        self._watchers: Dict[tuple, Any] = {}
+        self._watchers_lock = threading.Lock()
+        
+        # Opt-in record cache (invalidated on create/write/unlink)
+        self.cache = cache
+        
+        # Deduplication of identical concurrent reads (see execute)
+        self.single_flight = single_flight
+        
+        # Connection settings
+        self.timeout = timeout
+        self.session_scope = session_scope
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        
+        # Overload protection (both optional)
+        self.limiter = limiter
+        self.retry = retry
+        
+        # JSON encoder/decoder for JSON-RPC payloads
+        self.codec = get_codec(codec)
+        
+        # Per-call metrics (see client.metrics.snapshot()/render_prometheus())
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        
         # Validate configuration
         self._validate_config()
         
-        # Setup protocol-specific clients
-        if self.protocol == 'jsonrpc':
-            self.session = requests.Session()
-            self.session.headers.update({'Content-Type': 'application/json'})
-        elif self.protocol == 'xmlrpc':
-            self.common = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/common')
-            self.models = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/object')
-        else:
+        if self.protocol not in ('jsonrpc', 'xmlrpc'):
             raise ValueError(f"Unsupported protocol: {self.protocol}. Use 'jsonrpc' or 'xmlrpc'")
+        if self.session_scope not in ('shared', 'thread'):
+            raise ValueError(f"Unsupported session scope: {self.session_scope}. Use 'shared' or 'thread'")
+        
+        # Setup protocol-specific clients (created lazily, rebuilt after fork)
+        self._init_connections()
+        register_fork_reset(self)
         
         logger.info(f"Odoo client initialized with {self.protocol.upper()} protocol")
         logger.info(f"URL: {self.url}, DB: {self.db}, User: {self.username}")
     
     def _validate_config(self):
         """Validate that all required configuration is present"""
-        required = {
-            'ODOO_URL': self.url,
-            'ODOO_DB': self.db,
-            'ODOO_USERNAME': self.username,
-            'ODOO_API_KEY': self.api_key
-        }
+        validate_config(self.url, self.db, self.username, self.api_key)
         
-        missing = [key for key, value in required.items() if not value]
+    # ==================== Connection Management ====================
         
-        if missing:
-            raise OdooAPIError(
-                f"Missing required configuration: {', '.join(missing)}\n"
-                "Set environment variables or pass values to constructor."
-            )
+    def _init_connections(self):
+        """Reset locks and connection state (at init and in a forked child)"""
+        self._pid = os.getpid()
+        self._auth_lock = threading.Lock()
+        self._connections_lock = threading.Lock()
+        self._local = threading.local()
+        self._shared_session = None
+        # Every per-thread session, so close() reaches other threads' pools
+        self._thread_sessions: List[requests.Session] = []
+        self._xmlrpc_proxies: Dict[str, xmlrpc.client.ServerProxy] = {}
+        # (model, method, arguments) -> Future of the read currently in flight
+        self._flights: Dict[tuple, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._xmlrpc_transport = RequestsTransport(
+            self._get_session, urlsplit(self.url or '').scheme or 'https',
+            timeout=self.timeout, codec=self.codec
+        )
         
-        # Validate URL format
-        if not self.url.startswith(('http://', 'https://')):
-            raise OdooAPIError(
-                f"Invalid URL format: {self.url}\n"
-                "URL must start with http:// or https://"
-            )
+    def _after_fork(self):
+        """Reset locks, connections and watchers in a forked child (see forksafe)"""
+        self._watchers_lock = threading.Lock()
+        # The polling threads of the parent's watchers do not exist in the child
+        self._watchers = {}
+        # Drop (do not close) the parent's sockets; they belong to the parent
+        self._init_connections()
         
-        # Security warning for HTTP
-        if self.url.startswith('http://') and 'localhost' not in self.url:
-            logger.warning(
-                "WARNING: Using HTTP instead of HTTPS for production is insecure!"
-            )
+    def _check_fork(self):
+        """Rebuild connection pools if this client was inherited across fork()"""
+        if self._pid != os.getpid():
+            logger.info("Process fork detected, rebuilding Odoo connection pools")
+            self._after_fork()
+    
+    def _build_session(self) -> requests.Session:
+        """Create a requests session with the configured connection pool"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Content-Type': 'application/json'})
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+    
+    def _get_session(self) -> requests.Session:
+        """Return the HTTP session for the current process (and thread)"""
+        self._check_fork()
+        
+        if self.session_scope == 'thread':
+            session = getattr(self._local, 'session', None)
+            if session is None:
+                session = self._local.session = self._build_session()
+                with self._connections_lock:
+                    self._thread_sessions.append(session)
+            return session
+        
+        if self._shared_session is None:
+            with self._connections_lock:
+                if self._shared_session is None:
+                    self._shared_session = self._build_session()
+        return self._shared_session
+    
+    def _get_xmlrpc_proxy(self, service: str) -> xmlrpc.client.ServerProxy:
+        """
+        Return the XML-RPC proxy of a service
+        
+        Proxies are shared by all threads: their RequestsTransport sends
+        every call through the pooled HTTP session (see _get_session).
+        """
+        self._check_fork()
+        
+        proxy = self._xmlrpc_proxies.get(service)
+        if proxy is None:
+            with self._connections_lock:
+                proxy = self._xmlrpc_proxies.get(service)
+                if proxy is None:
+                    proxy = self._xmlrpc_proxies[service] = xmlrpc.client.ServerProxy(
+                        f'{self.url}/xmlrpc/2/{service}', transport=self._xmlrpc_transport
+                    )
+        return proxy
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session used for JSON-RPC calls"""
+        return self._get_session()
+    
+    @property
+    def common(self) -> xmlrpc.client.ServerProxy:
+        """XML-RPC proxy for the 'common' service"""
+        return self._get_xmlrpc_proxy('common')
+    
+    @property
+    def models(self) -> xmlrpc.client.ServerProxy:
+        """XML-RPC proxy for the 'object' service"""
+        return self._get_xmlrpc_proxy('object')
+    
+    def close(self):
+        """Stop change watchers and close pooled connections owned by this process"""
+        if self._pid != os.getpid():
+            return
+        
+        with self._watchers_lock:
+            watchers = list(self._watchers.values())
+            self._watchers.clear()
+        for watcher in watchers:
+            watcher.stop()
+        
+        with self._connections_lock:
+            sessions = self._thread_sessions
+            if self._shared_session is not None:
+                sessions.append(self._shared_session)
+            self._shared_session = None
+            self._thread_sessions = []
+            # Threads still running get a new session on their next call
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+    
+    def __enter__(self) -> 'OdooClient':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
-    def _jsonrpc_call(self, endpoint: str, params: Dict[str, Any]) -> Any:
+    def _jsonrpc_call(self, endpoint: str, params: Dict[str, Any], stream: bool = False) -> Any:
         """
         Make a JSON-RPC call to Odoo
         
         Args:
             endpoint: API endpoint (e.g., '/jsonrpc')
             params: Request parameters
+            stream: Return an iterator over the elements of the result
+                array, parsed incrementally while the body is downloaded
             
         Returns:
-            API response result
+            API response result (or an iterator over it when streaming)
             
         Raises:
             OdooAPIError: If request fails
@@ -147,13 +478,32 @@ class OdooClient:
             'params': params,
             'id': 1
         }
+        model, method = self._call_labels(params.get('service'), params.get('method'), params.get('args'))
+        start = time.monotonic()
+        request_bytes = None
+        response_bytes = None
+        failed = True
         
         try:
-            logger.debug(f"JSON-RPC call to {endpoint}: {json.dumps(params, indent=2)}")
-            response = self.session.post(url, json=payload, timeout=30)
-            response.raise_for_status()
+            # Payloads can be large: only serialize them when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("JSON-RPC call to %s: %s", endpoint, json.dumps(params, indent=2, default=str))
+            body = self.codec.dumps(payload)
+            request_bytes = len(body)
+            response = self._get_session().post(
+                url, data=body, timeout=self.timeout, stream=stream
+            )
+            if stream:
+                if not response.ok:
+                    response.close()
+                response.raise_for_status()
+                # Metrics are recorded once the stream has been consumed
+                failed = None
+                return self._iter_jsonrpc_response(response, (model, method), start, request_bytes)
             
-            data = response.json()
+            response.raise_for_status()
+            response_bytes = len(response.content)
+            data = self.codec.loads(response.content)
             
             # Check for JSON-RPC error
             if 'error' in data:
@@ -161,13 +511,63 @@ class OdooClient:
                 error_msg = error.get('data', {}).get('message') or error.get('message', 'Unknown error')
                 raise OdooAPIError(f"JSON-RPC Error: {error_msg}")
             
-            logger.debug(f"JSON-RPC call successful")
+            logger.debug("JSON-RPC call successful")
+            failed = False
             return data.get('result')
             
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise OdooConnectionError(f"HTTP Request failed: {str(e)}")
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 0
+            if status >= 500 or status == 429:
+                raise OdooConnectionError(f"HTTP Request failed: {str(e)}")
+            raise OdooAPIError(f"HTTP Request failed: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise OdooAPIError(f"HTTP Request failed: {str(e)}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise OdooAPIError(f"Invalid JSON response: {str(e)}")
+        finally:
+            if failed is not None:
+                self.metrics.observe_call(
+                    model, method, 'jsonrpc', time.monotonic() - start,
+                    request_bytes, response_bytes, failed
+                )
+    
+    def _iter_jsonrpc_response(
+        self,
+        response: requests.Response,
+        labels: tuple,
+        start: float,
+        request_bytes: int
+    ) -> Iterator[Any]:
+        """Yield result elements from a streamed response, then release the connection"""
+        received = 0
+        failed = True
+        
+        def counted_chunks():
+            nonlocal received
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
+        
+        try:
+            yield from iter_jsonrpc_result(counted_chunks(), self.codec)
+            failed = False
+        except requests.exceptions.RequestException as e:
+            raise OdooConnectionError(f"HTTP stream interrupted: {str(e)}")
+        finally:
+            response.close()
+            self.metrics.observe_call(
+                labels[0], labels[1], 'jsonrpc', time.monotonic() - start,
+                request_bytes, received, failed
+            )
+    
+    @staticmethod
+    def _call_labels(service: Optional[str], method: Optional[str], args: Optional[List[Any]]) -> tuple:
+        """(model, method) metric labels of an RPC; model is '' outside execute_kw"""
+        if service == 'object' and method in ('execute_kw', 'execute') and args and len(args) >= 5:
+            return str(args[3]), str(args[4])
+        return '', method or ''
     
     def _xmlrpc_call(self, service: str, method: str, *args) -> Any:
         """
@@ -184,31 +584,81 @@ class OdooClient:
         Raises:
             OdooAPIError: If request fails
         """
+        model, label_method = self._call_labels(service, method, list(args))
+        start = time.monotonic()
+        request_bytes = response_bytes = None
+        failed = True
+        
         try:
-            if service == 'common':
-                result = getattr(self.common, method)(*args)
-            elif service == 'object':
-                result = getattr(self.models, method)(*args)
-            else:
+            if service not in ('common', 'object'):
                 raise ValueError(f"Invalid service: {service}")
             
+            proxy = self._get_xmlrpc_proxy(service)
+            try:
+                result = getattr(proxy, method)(*args)
+            finally:
+                request_bytes, response_bytes = self._xmlrpc_transport.pop_sizes()
+            failed = False
+            
             return result
             
         except xmlrpc.client.Fault as e:
             raise OdooAPIError(f"XML-RPC Fault: {str(e)}")
+        except xmlrpc.client.ProtocolError as e:
+            if e.errcode >= 500 or e.errcode == 429:
+                raise OdooConnectionError(f"XML-RPC Error: {str(e)}")
+            raise OdooAPIError(f"XML-RPC Error: {str(e)}")
+        except OSError as e:
+            raise OdooConnectionError(f"XML-RPC Error: {str(e)}")
         except Exception as e:
             raise OdooAPIError(f"XML-RPC Error: {str(e)}")
+        finally:
+            self.metrics.observe_call(
+                model, label_method, 'xmlrpc', time.monotonic() - start,
+                request_bytes, response_bytes, failed
+            )
     
-    def authenticate(self) -> int:
+    def authenticate(self, refresh: bool = False) -> int:
         """
         Authenticate with Odoo using API key
         
+        Concurrent callers are serialized so only one authentication
+        request is in flight at a time. With a session store, a fresh
+        cached uid is used without contacting the server.
+        
+        Args:
+            refresh: Always authenticate against the server
+        
         Returns:
             User ID (uid)
             
         Raises:
             OdooAPIError: If authentication fails
         """
+        self._check_fork()
+        with self._auth_lock:
+            return self._authenticate(use_store=not refresh)
+    
+    def _ensure_authenticated(self) -> int:
+        """Authenticate once; threads arriving meanwhile reuse the same uid"""
+        if self.uid:
+            return self.uid
+        
+        self._check_fork()
+        with self._auth_lock:
+            if not self.uid:
+                self._authenticate()
+        return self.uid
+    
+    def _authenticate(self, use_store: bool = True) -> int:
+        if use_store and self.session_store is not None:
+            uid = self.session_store.get(self, 'uid')
+            if uid:
+                self.uid = uid
+                self._uid_from_store = True
+                logger.info(f"Using cached session for {self.username}. User ID: {self.uid}")
+                return self.uid
+        
         try:
             logger.info(f"Authenticating user: {self.username}")
             
@@ -232,244 +682,1647 @@ class OdooClient:
                     "- Database name is correct"
                 )
             
-            self.uid = result
-            logger.info(f"Authentication successful. User ID: {self.uid}")
-            return self.uid
+            self.uid = result
+            self._uid_from_store = False
+            if self.session_store is not None:
+                self.session_store.set(self, 'uid', result)
+            logger.info(f"Authentication successful. User ID: {self.uid}")
+            return self.uid
+            
+        except OdooAPIError:
+            raise
+        except Exception as e:
+            raise OdooAPIError(f"Authentication error: {str(e)}")
+    
+    def execute(
+        self,
+        model: str,
+        method: str,
+        args: List[Any] = None,
+        kwargs: Dict[str, Any] = None
+    ) -> Any:
+        """
+        Execute a method on an Odoo model
+        
+        With single_flight enabled, a read-only call identical (same model,
+        method, args and kwargs) to one already in flight from another thread
+        waits for that call and returns a copy of its result (or raises its
+        error) instead of sending its own request. Collapsed calls are
+        counted as ``collapsed_calls`` in the metrics.
+        
+        Args:
+            model: Model name (e.g., 'mrp.production')
+            method: Method name (e.g., 'search_read')
+            args: Positional arguments
+            kwargs: Keyword arguments
+            
+        Returns:
+            Method result
+            
+        Raises:
+            OdooAPIError: If execution fails
+        """
+        # Ensure authenticated
+        if not self.uid:
+            self._ensure_authenticated()
+        
+        args = args or []
+        kwargs = kwargs or {}
+        
+        if self.single_flight and method in READ_METHODS:
+            return self._execute_shared(model, method, args, kwargs)
+        return self._execute_call(model, method, args, kwargs)
+    
+    def _execute_shared(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """Run a read, or join the identical read already in flight"""
+        try:
+            key = (model, method, json.dumps([args, kwargs], sort_keys=True, default=str))
+        except (TypeError, ValueError):
+            # Arguments that cannot be compared are never shared
+            return self._execute_call(model, method, args, kwargs)
+        
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.followers += 1
+        
+        if not leader:
+            self.metrics.increment(model, 'collapsed_calls')
+            logger.debug(f"Joining in-flight {model}.{method}")
+            return _copy_result(flight.result())
+        
+        try:
+            result = self._execute_call(model, method, args, kwargs)
+        except BaseException as e:
+            self._land(key, flight)
+            flight.set_exception(e)
+            raise
+        
+        # Followers get copies: callers may modify the records they receive
+        if self._land(key, flight):
+            flight.set_result(_copy_result(result))
+        return result
+    
+    def _land(self, key: tuple, flight: '_Flight') -> int:
+        """Stop new callers from joining a finished flight; returns its follower count"""
+        with self._flights_lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            return flight.followers
+    
+    def _forget_flights(self, model: str) -> None:
+        """Stop sharing reads of a model that started before a write to it"""
+        with self._flights_lock:
+            for key in [key for key in self._flights if key[0] == model]:
+                del self._flights[key]
+    
+    def _execute_call(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        """Send one call (with retries) and keep local snapshots and the cache in step"""
+        try:
+            logger.debug(f"Executing {model}.{method}")
+            
+            if self.retry is not None:
+                self.retry.budget.record_request()
+            
+            attempt = 0
+            # {server name: requested name} once renamed fields were substituted
+            renames = None
+            while True:
+                try:
+                    result = self._execute_kw(model, method, args, kwargs)
+                    break
+                except OdooConnectionError as e:
+                    attempt += 1
+                    if not self._should_retry(method, attempt):
+                        raise
+                    self.metrics.record_retry(model, method, self.protocol)
+                    delay = self.retry.backoff(attempt - 1)
+                    logger.warning(
+                        f"{model}.{method} failed ({str(e)}), retrying in {delay:.2f}s "
+                        f"(attempt {attempt + 1}/{self.retry.max_attempts})"
+                    )
+                    time.sleep(delay)
+                except OdooAPIError as e:
+                    if renames is None and method in READ_METHODS and is_invalid_field_error(e):
+                        adapted = self._rename_for_server(model, method, args, kwargs)
+                        if adapted is None:
+                            raise
+                        args, kwargs, renames = adapted
+                        logger.info(f"Retrying {model}.{method} with renamed field(s): {', '.join(renames)}")
+                        continue
+                    if not self._session_rejected(e):
+                        raise
+                    # The cached uid is no longer accepted: log in again once
+                    logger.warning(f"Cached session rejected ({str(e)}), re-authenticating")
+                    self._reauthenticate()
+            
+            logger.debug(f"{model}.{method} executed successfully")
+            if renames and method in ('read', 'search_read'):
+                restore_names(result, renames)
+            if model in self._snapshots and method not in READ_METHODS:
+                self._refresh_local(model, method, args, result)
+            return result
+        
+        except OdooAPIError:
+            if method not in READ_METHODS:
+                # The call may or may not have been applied
+                self.drop_local(model)
+            raise
+        except Exception as e:
+            if method not in READ_METHODS:
+                self.drop_local(model)
+            raise OdooAPIError(f"Execution error on {model}.{method}: {str(e)}")
+        finally:
+            # Anything but a read may have changed the model's records
+            if method not in READ_METHODS:
+                if self.cache is not None:
+                    self.cache.invalidate(model)
+                # Reads issued after this call must not join older ones
+                self._forget_flights(model)
+    
+    def _rename_for_server(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Arguments of a call rejected for an unknown field, with known renames applied (None if none apply)"""
+        if model not in FIELD_RENAMES:
+            return None
+        try:
+            schema = self.fields_get(model)
+        except OdooAPIError as e:
+            logger.warning(f"Cannot check {model} fields ({str(e)})")
+            return None
+        return rename_fields(model, method, args, kwargs, schema)
+    
+    def execute_stream(
+        self,
+        model: str,
+        method: str,
+        args: List[Any] = None,
+        kwargs: Dict[str, Any] = None
+    ) -> Iterator[Any]:
+        """
+        Execute a method and stream the elements of its list result
+        
+        With JSON-RPC the response body is parsed incrementally, so each
+        element is yielded as soon as it has been downloaded and the full
+        body is never held in memory. Streaming calls bypass the record
+        cache, the concurrency limiter and retries. Renamed fields
+        (FIELD_RENAMES) are substituted before sending when the schema is
+        already known, otherwise the call is sent again with them if the
+        server rejects a field before the first element. With XML-RPC the
+        result is fetched with execute() and then iterated.
+        
+        Args:
+            model: Model name (e.g., 'mrp.production')
+            method: Method name (e.g., 'search_read')
+            args: Positional arguments
+            kwargs: Keyword arguments
+        
+        Yields:
+            Result elements
+        
+        Raises:
+            OdooAPIError: If execution fails
+        """
+        if self.protocol != 'jsonrpc':
+            result = self.execute(model, method, args, kwargs)
+            return iter(result if isinstance(result, list) else [result])
+        
+        args, kwargs, renames = list(args or []), dict(kwargs or {}), {}
+        if method in READ_METHODS and model in self._schemas:
+            adapted = rename_fields(model, method, args, kwargs, self._schemas[model])
+            if adapted is not None:
+                args, kwargs, renames = adapted
+        
+        self._ensure_authenticated()
+        logger.debug(f"Streaming {model}.{method}")
+        
+        # The request is sent now; server errors are only seen while iterating
+        stream = self._stream_kw(model, method, args, kwargs)
+        return self._iter_stream(stream, model, method, args, kwargs, renames)
+    
+    def _stream_kw(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Iterator[Any]:
+        """Send one streamed execute_kw request"""
+        return self._jsonrpc_call('/jsonrpc', {
+            'service': 'object',
+            'method': 'execute_kw',
+            'args': [self.db, self.uid, self.api_key, model, method, args, kwargs]
+        }, stream=True)
+    
+    def _iter_stream(
+        self,
+        stream: Iterator[Any],
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+        renames: Dict[str, str]
+    ) -> Iterator[Any]:
+        """Yield streamed elements, retrying once with renamed fields if the server rejects one"""
+        restore = renames and method in ('read', 'search_read')
+        started = False
+        try:
+            for element in stream:
+                started = True
+                yield restore_names([element], renames)[0] if restore else element
+            return
+        except OdooAPIError as e:
+            if started or renames or method not in READ_METHODS or not is_invalid_field_error(e):
+                raise
+            adapted = self._rename_for_server(model, method, args, kwargs)
+            if adapted is None:
+                raise
+        
+        args, kwargs, renames = adapted
+        logger.info(f"Retrying {model}.{method} with renamed field(s): {', '.join(renames)}")
+        stream = self._stream_kw(model, method, args, kwargs)
+        yield from self._iter_stream(stream, model, method, args, kwargs, renames)
+    
+    def _execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List[Any],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Send one execute_kw request, holding a limiter slot if configured"""
+        if self.limiter is not None:
+            self.limiter.acquire(self.timeout)
+        
+        start = time.monotonic()
+        overloaded = False
+        try:
+            if self.protocol == 'jsonrpc':
+                return self._jsonrpc_call('/jsonrpc', {
+                    'service': 'object',
+                    'method': 'execute_kw',
+                    'args': [self.db, self.uid, self.api_key, model, method, args, kwargs]
+                })
+            else:  # xmlrpc
+                return self._xmlrpc_call('object', 'execute_kw',
+                                         self.db, self.uid, self.api_key,
+                                         model, method, args, kwargs)
+        except OdooConnectionError:
+            overloaded = True
+            raise
+        finally:
+            if self.limiter is not None:
+                self.limiter.release(time.monotonic() - start, overloaded)
+            
+    def _session_rejected(self, error: OdooAPIError) -> bool:
+        """Whether a call failed because a uid taken from the session store is stale"""
+        message = str(error).lower()
+        return self._uid_from_store and ('access denied' in message or 'accessdenied' in message)
+            
+    def _reauthenticate(self) -> None:
+        """Drop the cached session and authenticate against the server"""
+        with self._auth_lock:
+            if self._uid_from_store:
+                self.session_store.invalidate(self)
+                self._authenticate(use_store=False)
+    
+    def _should_retry(self, method: str, attempt: int) -> bool:
+        """Whether a failed call may be attempted again (policy, method and budget)"""
+        return (
+            self.retry is not None
+            and attempt < self.retry.max_attempts
+            and self.retry.is_retryable(method, READ_METHODS)
+            and self.retry.budget.try_withdraw()
+        )
+    
+    # ==================== Generic CRUD Operations ====================
+    
+    def search(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = ''
+    ) -> List[int]:
+        """
+        Search for record IDs
+        
+        Args:
+            model: Model name
+            domain: Search domain (filters)
+            limit: Maximum records
+            offset: Skip records
+            order: Sort order
+            
+        Returns:
+            List of record IDs
+        """
+        domain = domain or []
+        kwargs = {}
+        if limit: kwargs['limit'] = limit
+        if offset: kwargs['offset'] = offset
+        if order: kwargs['order'] = order
+        
+        if model in self._snapshots:
+            local = self._local_search(model, domain, ['id'], limit, offset, order)
+            if local is not None:
+                return [record['id'] for record in local]
+        
+        return self.execute(model, 'search', [domain], kwargs)
+    
+    def read(
+        self,
+        model: str,
+        ids: List[int],
+        fields: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read records by IDs
+        
+        Args:
+            model: Model name
+            ids: Record IDs
+            fields: Fields to retrieve (None = all)
+            
+        Returns:
+            List of record dictionaries
+        """
+        if self.cache is not None and self.cache.is_cached(model):
+            return self._cached_read(model, ids, fields)
+        
+        kwargs = {}
+        if fields: kwargs['fields'] = fields
+        
+        return self.execute(model, 'read', [ids], kwargs)
+    
+    def _cached_read(
+        self,
+        model: str,
+        ids: List[int],
+        fields: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Serve read() from the record cache, fetching only the missing ids"""
+        ids = list(dict.fromkeys(ids))
+        found = {}
+        missing = []
+        
+        for record_id in ids:
+            record = self.cache.get_record(model, record_id, fields)
+            if record is None:
+                missing.append(record_id)
+            else:
+                found[record_id] = record
+        
+        self.metrics.record_cache(model, hits=len(found), misses=len(missing))
+        
+        if missing:
+            kwargs = {}
+            if fields: kwargs['fields'] = fields
+            
+            for record in self.execute(model, 'read', [missing], kwargs):
+                self.cache.set_record(model, record['id'], fields, record)
+                found[record['id']] = record
+        
+        # Hand out copies so callers cannot mutate cached entries
+        return [dict(found[record_id]) for record_id in ids if record_id in found]
+    
+    def search_read(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = '',
+        prefetch: Optional[Dict[str, Optional[List[str]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search and read records in one call
+        
+        Args:
+            model: Model name
+            domain: Search domain
+            fields: Fields to retrieve
+            limit: Maximum records
+            offset: Skip records
+            order: Sort order
+            prefetch: Relational fields to resolve, mapped to the fields to
+                read on the related records (None = all), e.g.
+                {'product_id': ['name', 'default_code']}; see prefetch_related
+            
+        Returns:
+            List of record dictionaries
+        """
+        domain = domain or []
+        if prefetch and fields:
+            fields = list(fields) + [field for field in prefetch if field not in fields]
+        kwargs = {}
+        if fields: kwargs['fields'] = fields
+        if limit: kwargs['limit'] = limit
+        if offset: kwargs['offset'] = offset
+        if order: kwargs['order'] = order
+        
+        if model in self._snapshots:
+            local = self._local_search(model, domain, fields, limit, offset, order)
+            if local is not None:
+                return self.prefetch_related(model, local, prefetch) if prefetch else local
+        
+        if self.cache is None or not self.cache.is_cached(model):
+            result = self.execute(model, 'search_read', [domain], kwargs)
+        else:
+            query_key = json.dumps([domain, kwargs], sort_keys=True, default=str)
+            cached = self.cache.get_query(model, query_key)
+            self.metrics.record_cache(model, hits=int(cached is not None), misses=int(cached is None))
+            
+            if cached is None:
+                cached = self.execute(model, 'search_read', [domain], kwargs)
+                self.cache.set_query(model, query_key, cached)
+                for record in cached:
+                    if 'id' in record:
+                        self.cache.set_record(model, record['id'], fields, record)
+            
+            result = [dict(record) for record in cached]
+        
+        if prefetch:
+            self.prefetch_related(model, result, prefetch)
+        return result
+    
+    def prefetch_related(
+        self,
+        model: str,
+        records: List[Dict[str, Any]],
+        prefetch: Dict[str, Optional[List[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve relational fields of already fetched records in batched reads
+        
+        All ids referenced by the given fields across ``records`` are
+        gathered and each related model is fetched with a single ``read``
+        (fields pointing to the same model share it). The related records
+        are attached in place:
+        - many2one: ``[id, name]`` (or a bare id) becomes the related dict
+        - one2many/many2many: the id list becomes a list of dicts, in the
+          original order (ids that could not be read are dropped)
+        
+        Records referencing the same related id share one dict.
+        
+        Args:
+            model: Model of ``records``
+            records: Record dictionaries (modified in place)
+            prefetch: {relational field: fields to read on the related
+                model, or None for all fields}
+        
+        Returns:
+            The same ``records`` list
+        
+        Raises:
+            ValueError: If a field is not a relational field of ``model``
+        """
+        if not records or not prefetch:
+            return records
+        
+        relations = self._field_relations(model)
+        # comodel -> [fields to read (None = all), ordered set of ids]
+        wanted: Dict[str, list] = {}
+        for field, related_fields in prefetch.items():
+            if field not in relations:
+                raise ValueError(f"'{field}' is not a relational field of {model}")
+            field_type, comodel = relations[field]
+            entry = wanted.setdefault(comodel, [[], {}])
+            if related_fields is None or entry[0] is None:
+                entry[0] = None
+            else:
+                entry[0].extend(f for f in related_fields if f not in entry[0])
+            for record in records:
+                for related_id in _related_ids(field_type, record.get(field)):
+                    entry[1][related_id] = None
+        
+        fetched = {}
+        for comodel, (related_fields, ids) in wanted.items():
+            rows = self._read_existing(comodel, list(ids), related_fields or None) if ids else []
+            fetched[comodel] = {row['id']: row for row in rows}
+            logger.info(f"Prefetched {len(rows)} {comodel} record(s) for {model}")
+        
+        for field in prefetch:
+            field_type, comodel = relations[field]
+            rows = fetched[comodel]
+            for record in records:
+                value = record.get(field)
+                if field_type == 'many2one':
+                    ids = _related_ids(field_type, value)
+                    if ids and ids[0] in rows:
+                        record[field] = rows[ids[0]]
+                elif isinstance(value, list):
+                    record[field] = [rows[related_id] for related_id in value if related_id in rows]
+        return records
+    
+    def _read_existing(self, model: str, ids: List[int], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """read() leaving out ids that cannot be read (deleted or forbidden)"""
+        try:
+            return self.read(model, ids, fields)
+        except OdooConnectionError:
+            raise
+        except OdooAPIError as e:
+            if len(ids) == 1:
+                logger.warning(f"Cannot read {model} record {ids[0]}: {str(e)}")
+                return []
+            # One bad id fails the whole read: isolate it
+            middle = len(ids) // 2
+            return self._read_existing(model, ids[:middle], fields) + self._read_existing(model, ids[middle:], fields)
+    
+    def _field_relations(self, model: str) -> Dict[str, tuple]:
+        """{field: (type, comodel)} of a model's relational fields"""
+        return {
+            field: (definition['type'], definition['relation'])
+            for field, definition in self.fields_get(model).items()
+            if definition.get('type') in RELATIONAL_FIELD_TYPES and definition.get('relation')
+        }
+    
+    def read_group(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        groupby: Union[str, List[str]] = None,
+        aggregates: List[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        orderby: str = '',
+        lazy: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate records on the server (counts, sums, ... per group)
+        
+        Args:
+            model: Model name
+            domain: Search domain
+            groupby: Field or fields to group by; date fields accept a
+                granularity ('date_deadline:week', ':day', ':month',
+                ':quarter', ':year')
+            aggregates: Aggregated fields such as 'product_qty:sum',
+                'qty_produced:avg' or 'total:sum(product_qty)'
+            limit: Maximum groups
+            offset: Skip groups
+            orderby: Group order (e.g. 'product_qty desc')
+            lazy: Group by the first groupby field only (Odoo's default);
+                False groups by all of them at once
+        
+        Returns:
+            One dict per group with the groupby values (many2one as
+            [id, name], dates as period labels), the aggregates and the
+            number of records in '__count'
+        
+        Raises:
+            ValueError: On an unknown granularity or aggregate function
+        """
+        groupby = [groupby] if isinstance(groupby, str) else list(groupby or [])
+        aggregates = list(aggregates or [])
+        
+        for spec in groupby:
+            _, _, granularity = spec.partition(':')
+            if granularity and granularity not in READ_GROUP_GRANULARITIES:
+                raise ValueError(
+                    f"Unknown granularity '{granularity}' in '{spec}'. "
+                    f"Use one of: {', '.join(sorted(READ_GROUP_GRANULARITIES))}"
+                )
+        for spec in aggregates:
+            _, _, function = spec.partition(':')
+            function = function.split('(', 1)[0]
+            if function and function not in READ_GROUP_AGGREGATES:
+                raise ValueError(
+                    f"Unknown aggregate '{function}' in '{spec}'. "
+                    f"Use one of: {', '.join(sorted(READ_GROUP_AGGREGATES))}"
+                )
+        
+        kwargs = {'lazy': lazy}
+        if limit: kwargs['limit'] = limit
+        if offset: kwargs['offset'] = offset
+        if orderby: kwargs['orderby'] = orderby
+        
+        groups = self.execute(model, 'read_group', [domain or [], aggregates, groupby], kwargs)
+        
+        # Lazy grouping reports the count as '<first groupby>_count'
+        count_key = f"{groupby[0].split(':')[0]}_count" if lazy and groupby else None
+        for group in groups:
+            if '__count' not in group:
+                group['__count'] = group.get(count_key, 0) if count_key else 0
+        return groups
+    
+    def search_read_stream(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 0,
+        offset: int = 0,
+        order: str = ''
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Search and read records, parsing the response incrementally
+        
+        Use for very large single requests; records are yielded while the
+        body is still downloading (see execute_stream).
+        
+        Args:
+            model: Model name
+            domain: Search domain
+            fields: Fields to retrieve
+            limit: Maximum records (0 = no limit)
+            offset: Skip records
+            order: Sort order
+        
+        Yields:
+            Record dictionaries
+        """
+        kwargs = {}
+        if fields: kwargs['fields'] = fields
+        if limit: kwargs['limit'] = limit
+        if offset: kwargs['offset'] = offset
+        if order: kwargs['order'] = order
+        
+        return self.execute_stream(model, 'search_read', [domain or []], kwargs)
+    
+    def search_read_columns(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 0,
+        offset: int = 0,
+        order: str = '',
+        categorical: Iterable[str] = DEFAULT_CATEGORICAL_FIELDS,
+        use_numpy: Optional[bool] = None
+    ) -> ColumnStore:
+        """
+        Search and read records into typed columns instead of dicts
+        
+        Records are streamed straight into the column buffers, so the full
+        list of dicts is never built.
+        
+        Args:
+            model: Model name
+            domain: Search domain
+            fields: Fields to retrieve
+            limit: Maximum records (0 = no limit)
+            offset: Skip records
+            order: Sort order
+            categorical: Fields stored as categorical codes (default: state)
+            use_numpy: Return NumPy arrays (default: if NumPy is installed)
+        
+        Returns:
+            ColumnStore (see python_client.columns)
+        """
+        records = self.search_read_stream(model, domain, fields, limit, offset, order)
+        return build_columns(records, fields, categorical, use_numpy)
+    
+    def search_count(self, model: str, domain: List[tuple] = None) -> int:
+        """
+        Count records matching a domain
+        
+        Args:
+            model: Model name
+            domain: Search domain
+        
+        Returns:
+            Number of matching records
+        """
+        if model in self._snapshots:
+            local = self._local_search(model, domain or [], ['id'], count=True)
+            if local is not None:
+                return local
+        
+        return self.execute(model, 'search_count', [domain or []])
+    
+    def iter_search_read(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        after_id: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching records using keyset (id) pagination
+        
+        Each page is fetched with ``id > last_id`` ordered by id, so the
+        server never has to skip over an offset and only one page is held
+        in memory at a time, regardless of how large the table is.
+        
+        Args:
+            model: Model name
+            domain: Search domain
+            fields: Fields to retrieve ('id' is always included)
+            page_size: Records per request
+            after_id: Only return records with an id greater than this
+        
+        Yields:
+            Record dictionaries in ascending id order
+        """
+        domain = list(domain or [])
+        if fields and 'id' not in fields:
+            fields = list(fields) + ['id']
+        
+        last_id = after_id
+        while True:
+            page = self._search_read_remote(
+                model, domain + [('id', '>', last_id)], fields,
+                limit=page_size, order='id asc'
+            )
+            if not page:
+                return
+            
+            last_id = page[-1]['id']
+            yield from page
+            
+            if len(page) < page_size:
+                return
+    
+    def _search_read_remote(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        limit: int = 0,
+        order: str = ''
+    ) -> List[Dict[str, Any]]:
+        """
+        search_read sent to the server, bypassing local snapshots and the cache
+        
+        Keyset iteration and sync must see changes made by other clients: a
+        snapshot or cached page would hide them while the watermark moves on.
+        """
+        kwargs = {}
+        if fields: kwargs['fields'] = fields
+        if limit: kwargs['limit'] = limit
+        if order: kwargs['order'] = order
+        return self.execute(model, 'search_read', [domain], kwargs)
+    
+    def search_read_parallel(
+        self,
+        model: str,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        shard_field: str = 'id',
+        shards: int = None,
+        max_workers: int = 4,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all matching records by splitting the result set into shards
+        and reading them concurrently on a bounded thread pool
+        
+        The value range of ``shard_field`` (the id space, or a date/datetime
+        field such as 'date_deadline') is discovered first, split into
+        contiguous shards, and each shard is streamed with keyset pagination.
+        Shards are merged in range order, so the result is deterministic:
+        ascending id for id shards, ascending windows (then records with an
+        empty date) for date shards, ascending id within each window.
+        
+        Args:
+            model: Model name
+            domain: Search domain
+            fields: Fields to retrieve
+            shard_field: 'id' or a date/datetime field to split on
+            shards: Number of shards (default: derived from the record count)
+            max_workers: Maximum concurrent requests sent to Odoo
+            page_size: Records per request within a shard
+        
+        Returns:
+            List of record dictionaries
+        """
+        domain = list(domain or [])
+        
+        # Authenticate once up front instead of inside every worker
+        self._ensure_authenticated()
+        
+        total = self.search_count(model, domain)
+        if not total:
+            return []
+        
+        if shards is None:
+            shards = max(1, min(-(-total // page_size), max_workers * 4))
+        
+        shard_domains = self._plan_shards(model, domain, shard_field, shards)
+        logger.info(
+            f"Fetching {total} {model} record(s) in {len(shard_domains)} shard(s) "
+            f"with {max_workers} worker(s)"
+        )
+        
+        def fetch_shard(shard_domain):
+            return list(self.iter_search_read(model, shard_domain, fields, page_size))
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(fetch_shard, shard_domains))
+        
+        records = [record for shard in results for record in shard]
+        logger.info(f"Fetched {len(records)} {model} record(s)")
+        return records
+    
+    def _plan_shards(
+        self,
+        model: str,
+        domain: List[Any],
+        shard_field: str,
+        shards: int
+    ) -> List[List[Any]]:
+        """Split the value range of shard_field into per-shard domains"""
+        bound_domain = domain + [(shard_field, '!=', False)]
+        first = self.search_read(model, bound_domain, [shard_field], limit=1, order=f'{shard_field} asc')
+        last = self.search_read(model, bound_domain, [shard_field], limit=1, order=f'{shard_field} desc')
+        
+        if shard_field == 'id':
+            low, high = first[0]['id'], last[0]['id']
+            step = max(1, -(-(high - low + 1) // shards))
+            return [
+                domain + [('id', '>=', start), ('id', '<', start + step)]
+                for start in range(low, high + 1, step)
+            ]
+        
+        # Records without a value are fetched as their own trailing shard
+        null_shard = domain + [(shard_field, '=', False)]
+        if not first:
+            return [null_shard]
+        
+        raw_low, raw_high = first[0][shard_field], last[0][shard_field]
+        fmt = ODOO_DATETIME_FORMAT if len(raw_low) > 10 else ODOO_DATE_FORMAT
+        low = datetime.strptime(raw_low, fmt)
+        high = datetime.strptime(raw_high, fmt)
+        step = (high - low) / shards
+        
+        if not step:
+            return [domain + [(shard_field, '=', raw_low)], null_shard]
+        
+        bounds = [(low + step * i).strftime(fmt) for i in range(shards)]
+        windows = []
+        for i, start in enumerate(bounds):
+            window = domain + [(shard_field, '>=', start)]
+            if i + 1 < len(bounds):
+                window.append((shard_field, '<', bounds[i + 1]))
+            windows.append(window)
+        
+        return windows + [null_shard]
+    
+    def sync_changes(
+        self,
+        model: str,
+        fields: List[str] = None,
+        domain: List[tuple] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        checkpoints: Optional[CheckpointStore] = None,
+        reset: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records changed since the last sync (write_date watermark)
+        
+        Records are read in ``(write_date, id)`` order strictly after the
+        stored watermark; the id breaks ties between records written in the
+        same second, which is read on its own when it does not fit in a page
+        (see sync.iter_change_pages). The watermark is persisted per (url, db,
+        model) after each fully consumed page, so delivery is at-least-once:
+        records of a page that was interrupted are yielded again on the next
+        run.
+        
+        Args:
+            model: Model name
+            fields: Fields to retrieve ('id' and 'write_date' are always included)
+            domain: Additional filters
+            page_size: Records per request
+            checkpoints: Checkpoint store (default: CheckpointStore())
+            reset: Ignore the stored watermark and start a full sync
+        
+        Yields:
+            Changed record dictionaries, oldest change first
+        """
+        checkpoints = checkpoints or CheckpointStore()
+        domain = list(domain or [])
+        if fields:
+            fields = list(fields) + [f for f in ('id', 'write_date') if f not in fields]
+        
+        if reset:
+            checkpoints.reset(self.url, self.db, model)
+        write_date, last_id = checkpoints.load(self.url, self.db, model)
+        
+        logger.info(f"Syncing {model} changes since {write_date or 'the beginning'}")
+        synced = 0
+        
+        def fetch(page_domain: List[Any], order: str) -> List[Dict[str, Any]]:
+            return self._search_read_remote(model, page_domain, fields, limit=page_size, order=order)
+        
+        for page, write_date, last_id in iter_change_pages(fetch, domain, write_date, last_id, page_size):
+            yield from page
+            synced += len(page)
+            checkpoints.save(self.url, self.db, model, write_date, last_id)
+        
+        logger.info(f"Synced {synced} changed {model} record(s)")
+    
+    def create(self, model: str, values: Dict[str, Any]) -> int:
+        """
+        Create a new record
+        
+        Args:
+            model: Model name
+            values: Record values
+            
+        Returns:
+            New record ID
+        """
+        return self.execute(model, 'create', [values])
+    
+    def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
+        """
+        Update existing records
+        
+        Args:
+            model: Model name
+            ids: Record IDs to update
+            values: Values to update
+            
+        Returns:
+            True if successful
+        """
+        return self.execute(model, 'write', [ids, values])
+    
+    def unlink(self, model: str, ids: List[int]) -> bool:
+        """
+        Delete records
+        
+        Args:
+            model: Model name
+            ids: Record IDs to delete
+            
+        Returns:
+            True if successful
+        """
+        return self.execute(model, 'unlink', [ids])
+    
+    def create_many(
+        self,
+        model: str,
+        vals_list: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_BATCH_SIZE,
+        isolate_errors: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many records with Odoo's list-of-values create, in chunks
+        
+        Each chunk is one ``create`` call and runs in its own server-side
+        transaction, so a failing chunk leaves the other chunks created.
+        With isolate_errors, a chunk rejected by Odoo is split in halves and
+        retried until the offending records are pinpointed; chunks that fail
+        with a connection error are not retried (they may have been committed).
+        
+        Args:
+            model: Model name
+            vals_list: Values of the records to create
+            chunk_size: Records per create call
+            isolate_errors: Bisect rejected chunks down to the failing records
+        
+        Returns:
+            One result per input record, in order:
+            {'id': new id or None, 'ok': bool, 'error': message or None}
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(vals_list)
+        
+        def run(indexes: List[int]):
+            try:
+                ids = self.execute(model, 'create', [[vals_list[i] for i in indexes]])
+            except OdooConnectionError as e:
+                for i in indexes:
+                    results[i] = {'id': None, 'ok': False, 'error': str(e)}
+                return
+            except OdooAPIError as e:
+                if isolate_errors and len(indexes) > 1:
+                    middle = len(indexes) // 2
+                    run(indexes[:middle])
+                    run(indexes[middle:])
+                    return
+                for i in indexes:
+                    results[i] = {'id': None, 'ok': False, 'error': str(e)}
+                return
+            
+            ids = ids if isinstance(ids, list) else [ids]
+            for i, record_id in zip(indexes, ids):
+                results[i] = {'id': record_id, 'ok': True, 'error': None}
+            if len(ids) != len(indexes):
+                error = f"create returned {len(ids)} id(s) for {len(indexes)} record(s)"
+                logger.warning(f"{model}: {error}")
+                for i in indexes[len(ids):]:
+                    results[i] = {'id': None, 'ok': False, 'error': error}
+        
+        for start in range(0, len(vals_list), chunk_size):
+            run(list(range(start, min(start + chunk_size, len(vals_list)))))
+        
+        failed = sum(1 for result in results if not result['ok'])
+        logger.info(f"Created {len(results) - failed}/{len(results)} {model} record(s)")
+        return results
+    
+    def write_many(
+        self,
+        model: str,
+        updates: Union[Dict[int, Dict[str, Any]], List[tuple]],
+        chunk_size: int = DEFAULT_BATCH_SIZE,
+        isolate_errors: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply per-record updates with as few write calls as possible
+        
+        Ids sharing an identical values dict are grouped into one ``write``
+        call (chunked to chunk_size ids). Failing chunks are isolated as in
+        create_many.
+        
+        Args:
+            model: Model name
+            updates: {id: values} or a list of (id, values) pairs
+            chunk_size: Ids per write call
+            isolate_errors: Bisect rejected chunks down to the failing ids
+        
+        Returns:
+            One result per updated id, in input order:
+            {'id': id, 'ok': bool, 'error': message or None}
+        
+        Raises:
+            ValueError: If an id appears more than once
+        """
+        pairs = list(updates.items()) if isinstance(updates, dict) else list(updates)
+        
+        groups: Dict[str, tuple] = {}
+        seen = set()
+        for record_id, values in pairs:
+            if record_id in seen:
+                raise ValueError(f"Duplicate id {record_id} in write_many updates")
+            seen.add(record_id)
+            key = json.dumps(values, sort_keys=True, default=str)
+            groups.setdefault(key, (values, []))[1].append(record_id)
+        
+        outcome: Dict[int, Dict[str, Any]] = {}
+        
+        def run(ids: List[int], values: Dict[str, Any]):
+            try:
+                self.execute(model, 'write', [ids, values])
+            except OdooConnectionError as e:
+                for record_id in ids:
+                    outcome[record_id] = {'id': record_id, 'ok': False, 'error': str(e)}
+                return
+            except OdooAPIError as e:
+                if isolate_errors and len(ids) > 1:
+                    middle = len(ids) // 2
+                    run(ids[:middle], values)
+                    run(ids[middle:], values)
+                    return
+                for record_id in ids:
+                    outcome[record_id] = {'id': record_id, 'ok': False, 'error': str(e)}
+                return
+            
+            for record_id in ids:
+                outcome[record_id] = {'id': record_id, 'ok': True, 'error': None}
+        
+        for values, ids in groups.values():
+            for start in range(0, len(ids), chunk_size):
+                run(ids[start:start + chunk_size], values)
+        
+        results = [outcome[record_id] for record_id, _ in pairs]
+        failed = sum(1 for result in results if not result['ok'])
+        logger.info(
+            f"Updated {len(results) - failed}/{len(results)} {model} record(s) "
+            f"in {len(groups)} value group(s)"
+        )
+        return results
+    
+    # ==================== Schema ====================
+    
+    def fields_get(self, model: str, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Field definitions of a model (type, relation, store, required, readonly)
+        
+        Fetched once per client, and from the schema cache (keyed by server
+        version) when one is configured.
+        
+        Args:
+            model: Model name
+            refresh: Always ask the server (and update the schema cache)
+        
+        Returns:
+            {field: attributes}
+        """
+        schema = None if refresh else self._schemas.get(model)
+        if schema is not None:
+            return schema
+        
+        version = None
+        if self.schema_cache is not None:
+            version = self.get_version().get('server_version', '')
+            if not refresh:
+                schema = self.schema_cache.load(self.url, self.db, version, model)
+        
+        if schema is None:
+            schema = self.execute(model, 'fields_get', [], {'attributes': SCHEMA_ATTRIBUTES})
+            if self.schema_cache is not None:
+                self.schema_cache.save(self.url, self.db, version, model, schema)
+        
+        self._schemas[model] = schema
+        return schema
+    
+    def resolve_fields(
+        self,
+        model: str,
+        fields: List[str],
+        lean: bool = False,
+        strict: bool = False
+    ) -> List[str]:
+        """
+        Validate a field list against the model's schema
+        
+        Fields missing on the server are replaced by their name on other Odoo
+        versions when known (e.g. date_planned_start -> date_start), dropped
+        otherwise.
+        
+        Args:
+            model: Model name
+            fields: Requested fields
+            lean: Also drop heavy (text, html, binary, x2many) and non-stored
+                computed fields
+            strict: Raise instead of dropping unknown fields
+        
+        Returns:
+            Field names to send to the server
+        
+        Raises:
+            ValueError: With strict, if a field does not exist
+        """
+        return self._resolve_fields(model, fields, lean, strict)[0]
+    
+    def _resolve_fields(
+        self,
+        model: str,
+        fields: List[str],
+        lean: bool = False,
+        strict: bool = False
+    ) -> tuple:
+        """resolve_fields returning (server field names, {server name: requested name})"""
+        schema = self.fields_get(model)
+        alternatives = FIELD_RENAMES.get(model, {})
+        resolved = []
+        renames = {}
+        unknown = []
+        
+        for field in fields:
+            name = field
+            if name not in schema and name != 'id':
+                name = alternatives.get(field)
+                if name not in schema:
+                    unknown.append(field)
+                    continue
+                renames[name] = field
+            
+            definition = schema.get(name, {})
+            if lean and name != 'id' and (
+                    definition.get('type') in HEAVY_FIELD_TYPES or definition.get('store') is False):
+                continue
+            if name not in resolved:
+                resolved.append(name)
+        
+        if unknown:
+            if strict:
+                raise ValueError(f"Unknown field(s) on {model}: {', '.join(unknown)}")
+            logger.warning(f"Ignoring field(s) missing on {model}: {', '.join(unknown)}")
+        return resolved, renames
+    
+    def _helper_fields(self, model: str, fields: Optional[List[str]], defaults: List[str], lean: bool) -> tuple:
+        """
+        Fields of a model helper (its default list if none were given)
+        
+        They are only checked against the schema for a lean projection, with
+        a schema cache, or once the schema was fetched anyway; otherwise
+        renamed fields are substituted by execute() if the server rejects them.
+        """
+        fields = list(defaults) if fields is None else list(fields)
+        if lean or self.schema_cache is not None or model in self._schemas:
+            return self._resolve_fields(model, fields, lean)
+        return fields, {}
+    
+    # ==================== Local Queries ====================
+    
+    def load_local(
+        self,
+        model: str,
+        fields: List[str] = None,
+        domain: List[tuple] = None,
+        hash_fields: Iterable[str] = DEFAULT_HASH_FIELDS,
+        sorted_fields: Iterable[str] = DEFAULT_SORTED_FIELDS,
+        max_age: Optional[float] = None,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> RecordIndex:
+        """
+        Load a model's records into an indexed in-memory snapshot
+        
+        While the snapshot is fresh, search_read and search_count calls on
+        the model are answered from it without an RPC when possible: the
+        requested fields were loaded, the domain can be evaluated locally,
+        and, for a snapshot loaded with a ``domain`` of AND-ed leaves, the
+        query ANDs all of those leaves at its top level. create/write/unlink
+        through this client refresh the affected records; any other
+        write-type method (or a failed refresh) drops the snapshot.
+        
+        Args:
+            model: Model name
+            fields: Fields to load (None = all)
+            domain: Only load matching records
+            hash_fields: Fields indexed for '=' / 'in' lookups
+            sorted_fields: Fields indexed for range comparisons
+            max_age: Seconds after which the snapshot is no longer used
+                (None = until dropped); changes made by other clients are
+                not seen before that
+            page_size: Records per request while loading
+        
+        Returns:
+            RecordIndex holding the records
+        """
+        index = RecordIndex(
+            self.iter_search_read(model, domain, fields, page_size),
+            hash_fields=hash_fields, sorted_fields=sorted_fields
+        )
+        self._snapshots[model] = {
+            'index': index,
+            'fields': set(fields) if fields else None,
+            'domain': list(domain or []),
+            'loaded_at': time.monotonic(),
+            'max_age': max_age,
+        }
+        logger.info(f"Loaded {len(index)} {model} record(s) for local queries")
+        return index
+    
+    def drop_local(self, model: Optional[str] = None) -> None:
+        """Forget the local snapshot of a model (None = all models)"""
+        if model is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(model, None)
+    
+    def _local_snapshot(self, model: str, domain: List[Any], fields: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """The model's snapshot if it can answer this query, else None"""
+        snapshot = self._snapshots.get(model)
+        if snapshot is None:
+            return None
+        if snapshot['max_age'] is not None and time.monotonic() - snapshot['loaded_at'] > snapshot['max_age']:
+            return None
+        if snapshot['fields'] is not None and (not fields or not set(fields) <= snapshot['fields'] | {'id'}):
+            return None
+        if snapshot['domain']:
+            # Only a query AND-ing every leaf of the snapshot's own domain
+            # (itself a plain list of leaves) is sure to match loaded records only
+            required = top_level_leaves(snapshot['domain'])
+            if len(required) != len(snapshot['domain']):
+                return None
+            present = top_level_leaves(domain)
+            if not all(term in present for term in required):
+                return None
+        return snapshot
+    
+    def _local_search(
+        self,
+        model: str,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        limit: int = 0,
+        offset: int = 0,
+        order: str = '',
+        count: bool = False
+    ) -> Any:
+        """Answer a search_read/search_count from the snapshot (None = ask the server)"""
+        snapshot = self._local_snapshot(model, domain, fields)
+        if snapshot is None:
+            return None
+        try:
+            if count:
+                result = snapshot['index'].count(domain)
+            else:
+                records = snapshot['index'].search(domain, order or None, offset, limit)
+                if fields:
+                    result = [{'id': r['id'], **{f: r.get(f, False) for f in fields}} for r in records]
+                else:
+                    result = [dict(record) for record in records]
+        except DomainError as e:
+            logger.debug(f"Local query on {model} not possible ({str(e)}), asking the server")
+            return None
+        
+        self.metrics.increment(model, 'local_queries')
+        return result
+    
+    def _refresh_local(self, model: str, method: str, args: List[Any], result: Any) -> None:
+        """
+        Bring the snapshot of a model in line after a successful write-type call
+        
+        Never raises: the call itself is already committed, so a refresh
+        that cannot be done drops the snapshot instead.
+        """
+        snapshot = self._snapshots.get(model)
+        if snapshot is None:
+            return
+        if method not in LOCAL_REFRESH_METHODS:
+            # copy, action_* and other methods may touch records other than
+            # their ids (or create new ones)
+            self.drop_local(model)
+            return
+        
+        try:
+            if method == 'unlink':
+                snapshot['index'].remove(args[0] if args else [])
+                return
+            
+            if method == 'create':
+                ids = result if isinstance(result, list) else [result]
+            elif args and isinstance(args[0], list) and all(isinstance(i, int) for i in args[0]):
+                ids = args[0]
+            else:
+                # Cannot tell which records changed
+                self.drop_local(model)
+                return
             
-        except OdooAPIError:
-            raise
+            if not ids:
+                return
+            kwargs = {'fields': sorted(snapshot['fields'])} if snapshot['fields'] else {}
+            # Not through execute(): the read must not join one issued before the write
+            records = self._execute_call(model, 'read', [ids], kwargs)
+            match = compile_domain(snapshot['domain'])
+            snapshot['index'].remove(ids)
+            snapshot['index'].upsert(record for record in records if match(record))
         except Exception as e:
-            raise OdooAPIError(f"Authentication error: {str(e)}")
+            logger.warning(f"Refreshing the local snapshot of {model} after {method} failed ({str(e)}), dropping it")
+            self.drop_local(model)
     
-    def execute(
+    # ==================== Change Watching ====================
+    
+    def watch(
         self,
         model: str,
-        method: str,
-        args: List[Any] = None,
-        kwargs: Dict[str, Any] = None
-    ) -> Any:
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        callback: 'Callable[[ChangeEvent], Any]' = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        coalesce: float = 0.5
+    ) -> 'Subscription':
         """
-        Execute a method on an Odoo model
+        Subscribe to changes of the records matching a domain
+        
+        Subscribers of the same (model, domain) share one background poller:
+        each cycle probes ``search_count`` and the latest ``write_date`` and
+        only fetches the changed records when one of them moved. The polling
+        interval shrinks to ``min_interval`` while records change and grows
+        towards ``max_interval`` while idle. The first cycle records the
+        current state; query it with search_read if needed. Interval
+        settings only apply when the first subscriber creates the poller.
         
         Args:
-            model: Model name (e.g., 'mrp.production')
-            method: Method name (e.g., 'search_read')
-            args: Positional arguments
-            kwargs: Keyword arguments
-            
+            model: Model name
+            domain: Records to watch
+            fields: Fields of the delivered records (None = all fields)
+            callback: Called from the polling thread with a ChangeEvent
+                (created, updated and removed records)
+            min_interval: Seconds between polls while records keep changing
+            max_interval: Upper bound of the interval while idle
+            coalesce: Seconds to wait after a detected change so a burst of
+                writes is delivered as one event
+        
         Returns:
-            Method result
-            
-        Raises:
-            OdooAPIError: If execution fails
+            Subscription (call ``cancel()`` to stop receiving events)
         """
-        # Ensure authenticated
-        if not self.uid:
-            self.authenticate()
+        from .watch import ChangeWatcher
         
-        args = args or []
-        kwargs = kwargs or {}
+        if callback is None:
+            raise ValueError("watch() requires a callback")
         
-        try:
-            logger.debug(f"Executing {model}.{method}")
-            
-            if self.protocol == 'jsonrpc':
-                result = self._jsonrpc_call('/jsonrpc', {
-                    'service': 'object',
-                    'method': 'execute_kw',
-                    'args': [self.db, self.uid, self.api_key, model, method, args, kwargs]
-                })
-            else:  # xmlrpc
-                result = self._xmlrpc_call('object', 'execute_kw',
-                                          self.db, self.uid, self.api_key,
-                                          model, method, args, kwargs)
-            
-            logger.debug(f"{model}.{method} executed successfully")
-            return result
-            
-        except OdooAPIError:
-            raise
-        except Exception as e:
-            raise OdooAPIError(f"Execution error on {model}.{method}: {str(e)}")
+        key = (model, repr(list(domain or [])))
+        with self._watchers_lock:
+            watcher = self._watchers.get(key)
+            if watcher is None:
+                watcher = ChangeWatcher(
+                    self, model, domain, min_interval=min_interval,
+                    max_interval=max_interval, coalesce=coalesce
+                )
+                self._watchers[key] = watcher
+            return watcher.subscribe(callback, fields)
     
-    # ==================== Generic CRUD Operations ====================
+    # ==================== Manufacturing Orders (mrp.production) ====================
     
-    def search(
+    def search_manufacturing_orders(
         self,
-        model: str,
         domain: List[tuple] = None,
+        fields: List[str] = None,
         limit: int = 100,
         offset: int = 0,
-        order: str = ''
-    ) -> List[int]:
+        order: str = 'date_deadline desc',
+        as_records: bool = False,
+        prefetch: Optional[Dict[str, Optional[List[str]]]] = None,
+        lean: bool = False
+    ) -> List[Any]:
         """
-        Search for record IDs
+        Search manufacturing orders
         
         Args:
-            model: Model name
-            domain: Search domain (filters)
+            domain: Filters (e.g., [('state', '=', 'confirmed')])
+            fields: Fields to retrieve
             limit: Maximum records
             offset: Skip records
             order: Sort order
-            
+            as_records: Return compact slotted records (see records.py)
+                instead of dicts
+            prefetch: Relational fields to resolve in batched reads, e.g.
+                {'product_id': ['default_code'], 'move_raw_ids': ['product_id',
+                'product_uom_qty']} (see prefetch_related)
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
+        
         Returns:
-            List of record IDs
+            List of manufacturing order records (dicts, or ManufacturingOrder
+            instances with as_records)
         """
-        domain = domain or []
-        kwargs = {}
-        if limit: kwargs['limit'] = limit
-        if offset: kwargs['offset'] = offset
-        if order: kwargs['order'] = order
+        if as_records and prefetch:
+            raise ValueError("prefetch cannot be combined with as_records")
+        fields, renames = self._helper_fields('mrp.production', fields, MANUFACTURING_ORDER_FIELDS, lean)
         
-        return self.execute(model, 'search', [domain], kwargs)
+        record_class = self._record_class('mrp.production', _requested_names(fields, renames)) if as_records else None
+        
+        logger.info(f"Searching manufacturing orders with domain: {domain}")
+        result = self.search_read('mrp.production', domain, fields, limit, offset, order, prefetch=prefetch)
+        restore_names(result, renames)
+        logger.info(f"Found {len(result)} manufacturing order(s)")
+        if record_class is not None:
+            return record_class.from_dicts(result)
+        return result
     
-    def read(
+    def iter_manufacturing_orders(
         self,
-        model: str,
-        ids: List[int],
-        fields: List[str] = None
-    ) -> List[Dict[str, Any]]:
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lean: bool = False
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Read records by IDs
+        Stream all matching manufacturing orders in ascending id order
         
         Args:
-            model: Model name
-            ids: Record IDs
-            fields: Fields to retrieve (None = all)
-            
-        Returns:
-            List of record dictionaries
+            domain: Filters (e.g., [('state', '=', 'confirmed')])
+            fields: Fields to retrieve
+            page_size: Records per request
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
+        
+        Yields:
+            Manufacturing order records
         """
-        kwargs = {}
-        if fields: kwargs['fields'] = fields
+        fields, renames = self._helper_fields('mrp.production', fields, MANUFACTURING_ORDER_FIELDS, lean)
         
-        return self.execute(model, 'read', [ids], kwargs)
+        logger.info(f"Streaming manufacturing orders with domain: {domain}")
+        records = self.iter_search_read('mrp.production', domain, fields, page_size)
+        return _iter_restored(records, renames) if renames else records
     
-    def search_read(
+    def fetch_all_manufacturing_orders(
         self,
-        model: str,
         domain: List[tuple] = None,
         fields: List[str] = None,
-        limit: int = 100,
-        offset: int = 0,
-        order: str = ''
+        shard_field: str = 'id',
+        max_workers: int = 4,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lean: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Search and read records in one call
+        Fetch all matching manufacturing orders with parallel sharded reads
         
         Args:
-            model: Model name
-            domain: Search domain
+            domain: Filters (e.g., [('state', '=', 'confirmed')])
             fields: Fields to retrieve
-            limit: Maximum records
-            offset: Skip records
-            order: Sort order
+            shard_field: 'id' or a date field such as 'date_deadline'
+            max_workers: Maximum concurrent requests sent to Odoo
+            page_size: Records per request within a shard
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
             
         Returns:
-            List of record dictionaries
+            List of manufacturing order records
         """
-        domain = domain or []
-        kwargs = {}
-        if fields: kwargs['fields'] = fields
-        if limit: kwargs['limit'] = limit
-        if offset: kwargs['offset'] = offset
-        if order: kwargs['order'] = order
+        fields, renames = self._helper_fields('mrp.production', fields, MANUFACTURING_ORDER_FIELDS, lean)
         
-        return self.execute(model, 'search_read', [domain], kwargs)
+        result = self.search_read_parallel(
+            'mrp.production', domain, fields,
+            shard_field=shard_field, max_workers=max_workers, page_size=page_size
+        )
+        return restore_names(result, renames)
     
-    def create(self, model: str, values: Dict[str, Any]) -> int:
+    def fetch_manufacturing_order_columns(
+        self,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        limit: int = 0,
+        use_numpy: Optional[bool] = None,
+        lean: bool = False
+    ) -> ColumnStore:
         """
-        Create a new record
+        Fetch manufacturing orders as typed columns for vectorized KPIs
         
         Args:
-            model: Model name
-            values: Record values
-            
+            domain: Filters (e.g., [('state', '=', 'confirmed')])
+            fields: Fields to retrieve
+            limit: Maximum records (0 = no limit)
+            use_numpy: Return NumPy arrays (default: if NumPy is installed)
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
+        
         Returns:
-            New record ID
+            ColumnStore with id-ordered columns
         """
-        return self.execute(model, 'create', [values])
+        fields, renames = self._helper_fields('mrp.production', fields, MANUFACTURING_ORDER_FIELDS, lean)
+        
+        store = self.search_read_columns(
+            'mrp.production', domain, fields, limit=limit, order='id asc', use_numpy=use_numpy
+        )
+        return store.rename(renames) if renames else store
     
-    def write(self, model: str, ids: List[int], values: Dict[str, Any]) -> bool:
+    def get_manufacturing_order_status_counts(self, domain: List[tuple] = None) -> Dict[str, int]:
         """
-        Update existing records
+        Count manufacturing orders per state (server-side)
         
         Args:
-            model: Model name
-            ids: Record IDs to update
-            values: Values to update
-            
+            domain: Filters (e.g., [('date_deadline', '>=', '2024-01-01')])
+        
         Returns:
-            True if successful
+            {state: number of orders}
         """
-        return self.execute(model, 'write', [ids, values])
+        groups = self.read_group('mrp.production', domain, 'state', ['state'])
+        return {group['state']: group['__count'] for group in groups}
     
-    def unlink(self, model: str, ids: List[int]) -> bool:
+    def get_manufacturing_order_volume(
+        self,
+        interval: str = 'week',
+        date_field: str = 'date_deadline',
+        domain: List[tuple] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Delete records
+        Manufacturing order volume per period (server-side)
         
         Args:
-            model: Model name
-            ids: Record IDs to delete
-            
+            interval: 'day', 'week', 'month', 'quarter' or 'year'
+            date_field: Date field to bucket on
+            domain: Filters
+        
         Returns:
-            True if successful
+            [{'period': label, 'count', 'product_qty', 'qty_produced'}]
+            in chronological order (orders without a date are skipped)
         """
-        return self.execute(model, 'unlink', [ids])
+        groupby = f"{date_field}:{interval}"
+        groups = self.read_group(
+            'mrp.production', domain, groupby,
+            ['product_qty:sum', 'qty_produced:sum'], orderby=date_field
+        )
+        return [
+            {
+                'period': group[groupby],
+                'count': group['__count'],
+                'product_qty': group.get('product_qty') or 0.0,
+                'qty_produced': group.get('qty_produced') or 0.0,
+            }
+            for group in groups if group.get(groupby)
+        ]
     
-    # ==================== Manufacturing Orders (mrp.production) ====================
-    
-    def search_manufacturing_orders(
-        self,
-        domain: List[tuple] = None,
-        fields: List[str] = None,
-        limit: int = 100,
-        offset: int = 0,
-        order: str = 'date_deadline desc'
-    ) -> List[Dict[str, Any]]:
+    def get_manufacturing_order_output_by_user(self, domain: List[tuple] = None) -> List[Dict[str, Any]]:
         """
-        Search manufacturing orders
+        Manufacturing order output per responsible user (server-side)
         
         Args:
-            domain: Filters (e.g., [('state', '=', 'confirmed')])
-            fields: Fields to retrieve
-            limit: Maximum records
-            offset: Skip records
-            order: Sort order
-            
+            domain: Filters (e.g., [('state', '=', 'done')])
+        
         Returns:
-            List of manufacturing order records
+            [{'user_id', 'user_name', 'count', 'product_qty', 'qty_produced'}]
+            sorted by produced quantity, highest first (user_id None for
+            unassigned orders)
         """
-        if fields is None:
-            fields = [
-                'id', 'name', 'product_id', 'product_qty', 'product_uom_id',
-                'state', 'date_planned_start', 'date_deadline', 'priority',
-                'user_id', 'company_id', 'origin', 'qty_produced', 'qty_producing'
-            ]
-        
-        logger.info(f"Searching manufacturing orders with domain: {domain}")
-        result = self.search_read('mrp.production', domain, fields, limit, offset, order)
-        logger.info(f"Found {len(result)} manufacturing order(s)")
-        return result
+        groups = self.read_group(
+            'mrp.production', domain, 'user_id',
+            ['product_qty:sum', 'qty_produced:sum']
+        )
+        output = [
+            {
+                'user_id': group['user_id'][0] if group.get('user_id') else None,
+                'user_name': group['user_id'][1] if group.get('user_id') else None,
+                'count': group['__count'],
+                'product_qty': group.get('product_qty') or 0.0,
+                'qty_produced': group.get('qty_produced') or 0.0,
+            }
+            for group in groups
+        ]
+        output.sort(key=lambda row: row['qty_produced'], reverse=True)
+        return output
     
-    def get_manufacturing_order(self, mo_id: int, fields: List[str] = None) -> Dict[str, Any]:
+    def get_manufacturing_order(self, mo_id: int, fields: List[str] = None, lean: bool = False) -> Dict[str, Any]:
         """
         Get a specific manufacturing order
         
         Args:
             mo_id: Manufacturing order ID
             fields: Fields to retrieve
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
             
         Returns:
             Manufacturing order record
         """
-        if fields is None:
-            fields = [
-                'id', 'name', 'product_id', 'product_qty', 'product_uom_id',
-                'state', 'date_planned_start', 'date_deadline', 'priority',
-                'user_id', 'company_id', 'origin', 'qty_produced', 'qty_producing',
-                'bom_id', 'move_raw_ids', 'move_finished_ids'
-            ]
+        fields, renames = self._helper_fields('mrp.production', fields, MANUFACTURING_ORDER_DETAIL_FIELDS, lean)
         
         logger.info(f"Getting manufacturing order ID: {mo_id}")
         result = self.read('mrp.production', [mo_id], fields)
@@ -477,7 +2330,7 @@ class OdooClient:
         if not result:
             raise OdooAPIError(f"Manufacturing order {mo_id} not found")
         
-        return result[0]
+        return restore_names(result, renames)[0]
     
     def create_manufacturing_order(
         self,
@@ -541,6 +2394,55 @@ class OdooClient:
         
         return result
     
+    def create_manufacturing_orders(
+        self,
+        vals_list: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many manufacturing orders (e.g. a production plan import)
+        
+        Args:
+            vals_list: Values per order (product_id, product_qty, ...)
+            chunk_size: Orders per create call
+        
+        Returns:
+            Per-order results (see create_many)
+        """
+        logger.info(f"Creating {len(vals_list)} manufacturing order(s)")
+        return self.create_many('mrp.production', vals_list, chunk_size)
+    
+    def update_manufacturing_orders(
+        self,
+        updates: Union[Dict[int, Dict[str, Any]], List[tuple]],
+        chunk_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Update many manufacturing orders, grouping identical updates
+        
+        Args:
+            updates: {mo_id: values} or a list of (mo_id, values) pairs
+            chunk_size: Orders per write call
+        
+        Returns:
+            Per-order results (see write_many)
+        """
+        logger.info(f"Updating {len(updates)} manufacturing order(s)")
+        return self.write_many('mrp.production', updates, chunk_size)
+    
+    def _record_class(self, model: str, fields: List[str]) -> type:
+        """Return the slotted record class of a model, checking it has a slot per field"""
+        # Imported here: records builds its classes from this module's field lists
+        from .records import RECORD_CLASSES
+        
+        record_class = RECORD_CLASSES[model]
+        unknown = set(fields) - set(record_class._fields)
+        if unknown:
+            raise ValueError(
+                f"{record_class.__name__} records have no slot for: {', '.join(sorted(unknown))}"
+            )
+        return record_class
+    
     # ==================== Products (product.product) ====================
     
     def search_products(
@@ -549,8 +2451,10 @@ class OdooClient:
         fields: List[str] = None,
         limit: int = 100,
         offset: int = 0,
-        order: str = 'name'
-    ) -> List[Dict[str, Any]]:
+        order: str = 'name',
+        as_records: bool = False,
+        lean: bool = False
+    ) -> List[Any]:
         """
         Search products
         
@@ -560,39 +2464,66 @@ class OdooClient:
             limit: Maximum records
             offset: Skip records
             order: Sort order
+            as_records: Return compact slotted records (see records.py)
+                instead of dicts
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
             
         Returns:
             List of product records
         """
-        if fields is None:
-            fields = [
-                'id', 'name', 'default_code', 'barcode', 'list_price',
-                'standard_price', 'type', 'categ_id', 'uom_id',
-                'qty_available', 'virtual_available', 'description', 'active'
-            ]
+        fields, renames = self._helper_fields('product.product', fields, PRODUCT_FIELDS, lean)
+        
+        record_class = self._record_class('product.product', _requested_names(fields, renames)) if as_records else None
         
         logger.info(f"Searching products with domain: {domain}")
         result = self.search_read('product.product', domain, fields, limit, offset, order)
+        restore_names(result, renames)
         logger.info(f"Found {len(result)} product(s)")
+        if record_class is not None:
+            return record_class.from_dicts(result)
         return result
     
-    def get_product(self, product_id: int, fields: List[str] = None) -> Dict[str, Any]:
+    def iter_products(
+        self,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lean: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching products in ascending id order
+        
+        Args:
+            domain: Filters (e.g., [('active', '=', True)])
+            fields: Fields to retrieve
+            page_size: Records per request
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
+        
+        Yields:
+            Product records
+        """
+        fields, renames = self._helper_fields('product.product', fields, PRODUCT_FIELDS, lean)
+        
+        logger.info(f"Streaming products with domain: {domain}")
+        records = self.iter_search_read('product.product', domain, fields, page_size)
+        return _iter_restored(records, renames) if renames else records
+    
+    def get_product(self, product_id: int, fields: List[str] = None, lean: bool = False) -> Dict[str, Any]:
         """
         Get a specific product
         
         Args:
             product_id: Product ID
             fields: Fields to retrieve
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
             
         Returns:
             Product record
         """
-        if fields is None:
-            fields = [
-                'id', 'name', 'default_code', 'barcode', 'list_price',
-                'standard_price', 'type', 'categ_id', 'uom_id',
-                'qty_available', 'virtual_available', 'description', 'active'
-            ]
+        fields, renames = self._helper_fields('product.product', fields, PRODUCT_FIELDS, lean)
         
         logger.info(f"Getting product ID: {product_id}")
         result = self.read('product.product', [product_id], fields)
@@ -600,7 +2531,7 @@ class OdooClient:
         if not result:
             raise OdooAPIError(f"Product {product_id} not found")
         
-        return result[0]
+        return restore_names(result, renames)[0]
     
     def create_product(
         self,
@@ -639,6 +2570,42 @@ class OdooClient:
         
         return product_id
     
+    def create_products(
+        self,
+        vals_list: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many products
+        
+        Args:
+            vals_list: Values per product (name, type, list_price, ...)
+            chunk_size: Products per create call
+        
+        Returns:
+            Per-product results (see create_many)
+        """
+        logger.info(f"Creating {len(vals_list)} product(s)")
+        return self.create_many('product.product', vals_list, chunk_size)
+    
+    def update_products(
+        self,
+        updates: Union[Dict[int, Dict[str, Any]], List[tuple]],
+        chunk_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Update many products, grouping identical updates
+        
+        Args:
+            updates: {product_id: values} or a list of (product_id, values) pairs
+            chunk_size: Products per write call
+        
+        Returns:
+            Per-product results (see write_many)
+        """
+        logger.info(f"Updating {len(updates)} product(s)")
+        return self.write_many('product.product', updates, chunk_size)
+    
     # ==================== Users (res.users) ====================
     
     def search_users(
@@ -647,8 +2614,10 @@ class OdooClient:
         fields: List[str] = None,
         limit: int = 100,
         offset: int = 0,
-        order: str = 'name'
-    ) -> List[Dict[str, Any]]:
+        order: str = 'name',
+        as_records: bool = False,
+        lean: bool = False
+    ) -> List[Any]:
         """
         Search users
         
@@ -658,37 +2627,66 @@ class OdooClient:
             limit: Maximum records
             offset: Skip records
             order: Sort order
+            as_records: Return compact slotted records (see records.py)
+                instead of dicts
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
             
         Returns:
             List of user records
         """
-        if fields is None:
-            fields = [
-                'id', 'name', 'login', 'email', 'active',
-                'company_id', 'groups_id', 'lang'
-            ]
+        fields, renames = self._helper_fields('res.users', fields, USER_FIELDS, lean)
+        
+        record_class = self._record_class('res.users', _requested_names(fields, renames)) if as_records else None
         
         logger.info(f"Searching users with domain: {domain}")
         result = self.search_read('res.users', domain, fields, limit, offset, order)
+        restore_names(result, renames)
         logger.info(f"Found {len(result)} user(s)")
+        if record_class is not None:
+            return record_class.from_dicts(result)
         return result
     
-    def get_user(self, user_id: int, fields: List[str] = None) -> Dict[str, Any]:
+    def iter_users(
+        self,
+        domain: List[tuple] = None,
+        fields: List[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        lean: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching users in ascending id order
+        
+        Args:
+            domain: Filters (e.g., [('active', '=', True)])
+            fields: Fields to retrieve
+            page_size: Records per request
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
+        
+        Yields:
+            User records
+        """
+        fields, renames = self._helper_fields('res.users', fields, USER_FIELDS, lean)
+        
+        logger.info(f"Streaming users with domain: {domain}")
+        records = self.iter_search_read('res.users', domain, fields, page_size)
+        return _iter_restored(records, renames) if renames else records
+    
+    def get_user(self, user_id: int, fields: List[str] = None, lean: bool = False) -> Dict[str, Any]:
         """
         Get a specific user
         
         Args:
             user_id: User ID
             fields: Fields to retrieve
+            lean: Leave out heavy (text, html, binary, x2many) and
+                non-stored computed fields
             
         Returns:
             User record
         """
-        if fields is None:
-            fields = [
-                'id', 'name', 'login', 'email', 'active',
-                'company_id', 'groups_id', 'lang'
-            ]
+        fields, renames = self._helper_fields('res.users', fields, USER_FIELDS, lean)
         
         logger.info(f"Getting user ID: {user_id}")
         result = self.read('res.users', [user_id], fields)
@@ -696,7 +2694,7 @@ class OdooClient:
         if not result:
             raise OdooAPIError(f"User {user_id} not found")
         
-        return result[0]
+        return restore_names(result, renames)[0]
     
     def create_user(
         self,
@@ -735,13 +2733,28 @@ class OdooClient:
     
     # ==================== Utility Methods ====================
     
-    def get_version(self) -> Dict[str, Any]:
+    def get_version(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get Odoo version information
         
+        The result is kept for the lifetime of the client (and in the
+        session store, if configured).
+        
+        Args:
+            refresh: Always ask the server
+        
         Returns:
             Version information dictionary
         """
+        if not refresh:
+            if self._version is not None:
+                return self._version
+            if self.session_store is not None:
+                cached = self.session_store.get(self, 'version')
+                if cached:
+                    self._version = cached
+                    return cached
+        
         try:
             if self.protocol == 'jsonrpc':
                 result = self._jsonrpc_call('/jsonrpc', {
@@ -753,6 +2766,9 @@ class OdooClient:
                 result = self._xmlrpc_call('common', 'version')
             
             logger.info(f"Odoo version: {result.get('server_version', 'Unknown')}")
+            self._version = result
+            if self.session_store is not None:
+                self.session_store.set(self, 'version', result)
             return result
             
         except Exception as e:
@@ -769,11 +2785,11 @@ class OdooClient:
             logger.info("Testing Odoo connection...")
             
             # Get version
-            version = self.get_version()
+            version = self.get_version(refresh=True)
             logger.info(f"Connected to Odoo {version.get('server_version', 'Unknown')}")
             
             # Authenticate
-            self.authenticate()
+            self.authenticate(refresh=True)
             
             logger.info("✓ Connection test successful!")
             return True
@@ -784,17 +2800,29 @@ class OdooClient:
 
 
 # Convenience function for quick client creation
-def create_client(protocol: str = 'jsonrpc') -> OdooClient:
+def create_client(
+    protocol: str = 'jsonrpc',
+    shared: bool = False,
+    session_store: Optional['SessionStore'] = None
+) -> OdooClient:
     """
     Create and authenticate an Odoo client using environment variables
     
     Args:
         protocol: 'jsonrpc' or 'xmlrpc'
+        shared: Return the process-wide client for these credentials from
+            the default ClientRegistry instead of a new instance
+        session_store: Optional SessionStore caching uid/version on disk
         
     Returns:
         Authenticated OdooClient instance
     """
-    client = OdooClient(protocol=protocol)
+    if shared:
+        # Imported here: the registry module builds on OdooClient
+        from .registry import default_registry
+        return default_registry.get(protocol=protocol, session_store=session_store)
+    
+    client = OdooClient(protocol=protocol, session_store=session_store)
     client.authenticate()
     return client
 
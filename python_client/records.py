@@ -0,0 +1,178 @@
+"""
+Compact typed records
+=====================
+
+Slotted record classes for the models the client has helpers for. A slotted
+instance stores its values in fixed slots instead of a per-record dict,
+which cuts memory several-fold when holding hundreds of thousands of records.
+
+Values are kept exactly as returned by Odoo and parsed on access:
+- date/datetime fields return ``datetime`` (None when empty)
+- many2one fields return ``Many2one(id, name)`` (None when empty)
+
+Example usage:
+    >>> mos = client.search_manufacturing_orders(limit=1000, as_records=True)
+    >>> mos[0].product_id.name
+    'Table'
+    >>> mos[0].date_deadline
+    datetime.datetime(2024, 5, 1, 10, 0)
+    >>> mos[0].to_dict()   # original Odoo representation
+"""
+
+from collections import namedtuple
+from typing import Dict, List, Any, Iterable, Sequence, Type
+
+from .columns import parse_odoo_datetime
+from .odoo_client import MANUFACTURING_ORDER_FIELDS, PRODUCT_FIELDS, USER_FIELDS
+
+Many2one = namedtuple('Many2one', ['id', 'name'])
+
+
+class Record:
+    """
+    Base class of the generated record types
+    
+    Subclasses define ``_model``, ``_fields`` and one slot per field; fields
+    not present in the source dict are left unset (AttributeError on access).
+    """
+    
+    __slots__ = ()
+    _model = None
+    _fields = ()
+    # (field, slot) pairs; the slot is '_raw_<field>' for parsed fields
+    _slot_map = ()
+    _setters = ()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Record':
+        """Build a record from an Odoo result dict"""
+        record = cls.__new__(cls)
+        for field, setter in cls._setters:
+            if field in data:
+                setter(record, data[field])
+        return record
+    
+    @classmethod
+    def from_dicts(cls, records: Iterable[Dict[str, Any]]) -> List['Record']:
+        """Build records from Odoo result dicts"""
+        return [cls.from_dict(data) for data in records]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the loaded fields in Odoo's original representation"""
+        result = {}
+        for field, slot in self._slot_map:
+            try:
+                result[field] = getattr(self, slot)
+            except AttributeError:
+                pass
+        return result
+    
+    def raw(self, field: str) -> Any:
+        """Unparsed value of a field (e.g. the [id, name] list of a many2one)"""
+        return getattr(self, dict(self._slot_map)[field])
+    
+    def get(self, field: str, default: Any = None) -> Any:
+        """Parsed value of a field, or ``default`` if it was not loaded"""
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            return default
+    
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    def __hash__(self):
+        return hash((self._model, self.get('id')))
+    
+    def __getstate__(self):
+        return self.to_dict()
+    
+    def __setstate__(self, state):
+        for field, setter in self._setters:
+            if field in state:
+                setter(self, state[field])
+    
+    def __repr__(self) -> str:
+        name = self.get('name')
+        label = f" {name!r}" if name is not None else ''
+        return f"<{type(self).__name__} id={self.get('id')}{label}>"
+
+
+def _date_property(slot: str) -> property:
+    def getter(self):
+        return parse_odoo_datetime(getattr(self, slot))
+    return property(getter)
+
+
+def _many2one_property(slot: str) -> property:
+    def getter(self):
+        value = getattr(self, slot)
+        return Many2one(value[0], value[1]) if value else None
+    return property(getter)
+
+
+def make_record_class(
+    name: str,
+    model: str,
+    fields: Sequence[str],
+    date_fields: Iterable[str] = (),
+    many2one_fields: Iterable[str] = ()
+) -> Type[Record]:
+    """
+    Generate a slotted record class
+    
+    Args:
+        name: Class name
+        model: Odoo model name
+        fields: Field names (one slot each)
+        date_fields: Fields parsed to datetime on access
+        many2one_fields: Fields parsed to Many2one on access
+    
+    Returns:
+        Record subclass
+    """
+    date_fields = set(date_fields)
+    many2one_fields = set(many2one_fields)
+    
+    namespace = {'_model': model, '_fields': tuple(fields), '__module__': __name__}
+    slot_map = []
+    for field in fields:
+        if field in date_fields:
+            slot = f"_raw_{field}"
+            namespace[field] = _date_property(slot)
+        elif field in many2one_fields:
+            slot = f"_raw_{field}"
+            namespace[field] = _many2one_property(slot)
+        else:
+            slot = field
+        slot_map.append((field, slot))
+    
+    namespace['__slots__'] = tuple(slot for _, slot in slot_map)
+    namespace['_slot_map'] = tuple(slot_map)
+    cls = type(name, (Record,), namespace)
+    # Slot descriptors' setters, resolved once
+    cls._setters = tuple((field, getattr(cls, slot).__set__) for field, slot in slot_map)
+    return cls
+
+
+ManufacturingOrder = make_record_class(
+    'ManufacturingOrder', 'mrp.production', MANUFACTURING_ORDER_FIELDS,
+    date_fields=('date_planned_start', 'date_deadline'),
+    many2one_fields=('product_id', 'product_uom_id', 'user_id', 'company_id')
+)
+
+Product = make_record_class(
+    'Product', 'product.product', PRODUCT_FIELDS,
+    many2one_fields=('categ_id', 'uom_id')
+)
+
+User = make_record_class(
+    'User', 'res.users', USER_FIELDS,
+    many2one_fields=('company_id',)
+)
+
+RECORD_CLASSES = {
+    cls._model: cls for cls in (ManufacturingOrder, Product, User)
+}
@@ -0,0 +1,195 @@
+"""
+Shared client registry and persisted sessions
+=============================================
+
+- ClientRegistry: hands out one authenticated :class:`OdooClient` per
+  (url, db, username, protocol) within a process, so repeated
+  ``create_client()`` calls reuse the same instance and connection pool.
+- SessionStore: small JSON file caching the uid and server version per
+  (url, db, username, protocol) with a TTL, so short-lived processes (cron
+  scripts, workers) skip the ``authenticate`` and ``version`` round-trips.
+
+Only the uid, the version info and a fingerprint of the API key are stored;
+a different key for the same user never reuses the cached entry.
+
+Example usage:
+    >>> from python_client.registry import ClientRegistry, SessionStore
+    >>> registry = ClientRegistry(session_store=SessionStore(ttl=3600))
+    >>> client = registry.get()            # credentials from ODOO_* env vars
+    >>> registry.get() is client
+    True
+"""
+
+import os
+import time
+import hashlib
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from .odoo_client import OdooClient, logger
+from .jsonstore import JSONFileStore
+from .forksafe import register_fork_reset
+
+# Default session file (overridable with ODOO_SESSION_CACHE)
+DEFAULT_SESSION_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'odoo_client', 'sessions.json'
+)
+
+RegistryKey = Tuple[str, str, str, str]
+
+
+def _fingerprint(api_key: str) -> str:
+    return hashlib.sha256((api_key or '').encode('utf-8')).hexdigest()[:16]
+
+
+class SessionStore:
+    """
+    JSON file holding uid and server version per (url, db, username, protocol)
+    
+    Entries expire after ``ttl`` seconds. Updates are locked across threads
+    and processes and go through an atomically renamed temporary file (mode
+    0600), so concurrent processes never see a partial file or lose entries.
+    """
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = 3600.0):
+        """
+        Initialize the store
+        
+        Args:
+            path: Session file path (default: ODOO_SESSION_CACHE env var or
+                ~/.cache/odoo_client/sessions.json)
+            ttl: Seconds a cached uid/version stays valid
+        """
+        self.path = path or os.getenv('ODOO_SESSION_CACHE') or DEFAULT_SESSION_PATH
+        self.ttl = ttl
+        self._store = JSONFileStore(self.path, indent=2)
+    
+    @staticmethod
+    def key(url: str, db: str, username: str, protocol: str) -> str:
+        """Build the session key for a user on a given server and database"""
+        return f"{url.rstrip('/')}|{db}|{username}|{protocol}"
+    
+    def get(self, client: OdooClient, field: str) -> Any:
+        """
+        Return a cached value ('uid' or 'version') for a client's credentials
+        
+        Returns:
+            The value, or None if missing, expired or cached for another API key
+        """
+        entry = self._store.read().get(self._client_key(client))
+        
+        if not entry or entry.get('key') != _fingerprint(client.api_key):
+            return None
+        value = entry.get(field)
+        saved_at = entry.get(f"{field}_at", 0)
+        if value is None or time.time() - saved_at > self.ttl:
+            return None
+        return value
+    
+    def set(self, client: OdooClient, field: str, value: Any) -> None:
+        """Cache a value ('uid' or 'version') for a client's credentials"""
+        with self._store.update() as data:
+            key = self._client_key(client)
+            entry = data.get(key) or {}
+            if entry.get('key') != _fingerprint(client.api_key):
+                entry = {'key': _fingerprint(client.api_key)}
+            entry[field] = value
+            entry[f"{field}_at"] = time.time()
+            data[key] = entry
+    
+    def invalidate(self, client: OdooClient) -> None:
+        """Forget the cached session of a client's credentials"""
+        with self._store.update() as data:
+            data.pop(self._client_key(client), None)
+    
+    def _client_key(self, client: OdooClient) -> str:
+        return self.key(client.url, client.db, client.username, client.protocol)
+
+
+class ClientRegistry:
+    """
+    Process-wide cache of authenticated clients
+    """
+    
+    def __init__(self, session_store: Optional[SessionStore] = None):
+        """
+        Initialize the registry
+        
+        Args:
+            session_store: Optional SessionStore given to every client the
+                registry creates
+        """
+        self.session_store = session_store
+        self._clients: Dict[RegistryKey, OdooClient] = {}
+        self._lock = threading.Lock()
+        register_fork_reset(self)
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock in a forked child (see forksafe)"""
+        self._lock = threading.Lock()
+    
+    def get(
+        self,
+        url: Optional[str] = None,
+        db: Optional[str] = None,
+        username: Optional[str] = None,
+        api_key: Optional[str] = None,
+        protocol: str = 'jsonrpc',
+        **options
+    ) -> OdooClient:
+        """
+        Return the authenticated client for these credentials, creating it once
+        
+        Missing credentials are read from the ODOO_* environment variables.
+        ``options`` (cache, timeout, limiter, ...) only apply when the client
+        is created; later calls return the existing instance as is.
+        
+        Raises:
+            OdooAPIError: If authentication fails
+        """
+        url = url or os.getenv('ODOO_URL')
+        db = db or os.getenv('ODOO_DB')
+        username = username or os.getenv('ODOO_USERNAME')
+        api_key = api_key or os.getenv('ODOO_API_KEY')
+        key = ((url or '').rstrip('/'), db or '', username or '', protocol.lower())
+        
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None and client.api_key == api_key:
+                return client
+            
+            if options.get('session_store') is None:
+                options['session_store'] = self.session_store
+            client = OdooClient(url, db, username, api_key, protocol=protocol, **options)
+            client.authenticate()
+            previous = self._clients.get(key)
+            self._clients[key] = client
+        
+        if previous is not None:
+            # API key changed: the old client is no longer handed out
+            previous.close()
+        logger.info(f"Registered client for {username} on {url} ({protocol})")
+        return client
+    
+    def remove(self, client: OdooClient) -> None:
+        """Drop a client from the registry and close it"""
+        with self._lock:
+            for key, registered in list(self._clients.items()):
+                if registered is client:
+                    del self._clients[key]
+        client.close()
+    
+    def clear(self) -> None:
+        """Close and forget all registered clients"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+    
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+# Registry used by create_client(shared=True)
+default_registry = ClientRegistry()
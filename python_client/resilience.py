@@ -0,0 +1,266 @@
+"""
+Overload protection for OdooClient
+==================================
+
+- AdaptiveLimiter: AIMD concurrency limit on in-flight ``execute`` calls.
+  The limit grows by ~1 per round of successful calls and is cut
+  multiplicatively when latency exceeds a target or calls fail with
+  connection errors, so callers back off when Odoo slows down.
+- RetryBudget: caps retries to a fraction of regular traffic so retries
+  cannot amplify an overload.
+- RetryPolicy: bounded retries with full-jitter exponential backoff for
+  idempotent (read-only) methods.
+
+Example usage:
+    >>> from python_client.resilience import AdaptiveLimiter, RetryPolicy
+    >>> client = OdooClient(
+    ...     limiter=AdaptiveLimiter(initial_limit=8, max_limit=64, latency_target=2.0),
+    ...     retry=RetryPolicy(max_attempts=4),
+    ... )
+"""
+
+import time
+import random
+import threading
+from typing import Dict, Any, Optional, Iterable, Callable
+
+from .odoo_client import OdooAPIError
+from .forksafe import register_fork_reset
+
+
+class LimiterTimeout(OdooAPIError):
+    """Raised when a concurrency slot could not be acquired in time"""
+    pass
+
+
+class AdaptiveLimiter:
+    """
+    Additive-increase / multiplicative-decrease concurrency limiter
+    """
+    
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        latency_target: float = 5.0,
+        backoff_ratio: float = 0.5,
+        cooldown: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter
+        
+        Args:
+            initial_limit: Starting number of concurrent calls
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            latency_target: Calls slower than this (seconds) count as overload
+            backoff_ratio: Factor applied to the limit on overload
+            cooldown: Minimum seconds between two decreases
+                (default: latency_target), so one slow burst only cuts once
+            clock: Monotonic time source
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.cooldown = latency_target if cooldown is None else cooldown
+        self._clock = clock
+        
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._last_decrease = float('-inf')
+        self._condition = threading.Condition()
+        register_fork_reset(self)
+        
+        self.successes = 0
+        self.overloads = 0
+        self.rejections = 0
+    
+    def _after_fork(self) -> None:
+        """Recreate the condition and free all slots in a forked child (see forksafe)"""
+        self._condition = threading.Condition()
+        # Slots held by parent threads are never released in the child
+        self._in_flight = 0
+    
+    @property
+    def limit(self) -> int:
+        """Current number of allowed in-flight calls"""
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot"""
+        return self._in_flight
+    
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a free slot
+        
+        Args:
+            timeout: Maximum seconds to wait (None = wait forever)
+        
+        Raises:
+            LimiterTimeout: If no slot became free in time
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    self.rejections += 1
+                    raise LimiterTimeout(
+                        f"No concurrency slot available within {timeout}s "
+                        f"(limit {self.limit}, in flight {self._in_flight})"
+                    )
+                self._condition.wait(remaining)
+            self._in_flight += 1
+    
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Free a slot and feed the observed outcome back into the limit
+        
+        Args:
+            latency: Duration of the call in seconds
+            overloaded: True if the call failed with an overload-type error
+                (timeout, connection refused, HTTP 5xx/429)
+        """
+        with self._condition:
+            self._in_flight -= 1
+            
+            if overloaded or latency > self.latency_target:
+                self.overloads += 1
+                now = self._clock()
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                    self._last_decrease = now
+            else:
+                self.successes += 1
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            
+            self._condition.notify_all()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limit and counters"""
+        with self._condition:
+            return {
+                'limit': self.limit,
+                'in_flight': self._in_flight,
+                'successes': self.successes,
+                'overloads': self.overloads,
+                'rejections': self.rejections,
+            }
+
+
+class RetryBudget:
+    """
+    Token bucket allowing retries for a fraction of regular requests
+    
+    Every request deposits ``ratio`` tokens; every retry withdraws one.
+    A small time-based allowance (``min_per_second``) keeps retries possible
+    at low traffic.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 10.0,
+        max_tokens: float = 100.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the budget
+        
+        Args:
+            ratio: Retries allowed per regular request (0.2 = 20%)
+            min_per_second: Retries always allowed per second
+            max_tokens: Cap on accumulated tokens
+            clock: Monotonic time source
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        
+        self._tokens = min_per_second
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+        register_fork_reset(self)
+        
+        self.retries = 0
+        self.exhausted = 0
+    
+    def _after_fork(self) -> None:
+        """Recreate the lock in a forked child (see forksafe)"""
+        self._lock = threading.Lock()
+    
+    def record_request(self) -> None:
+        """Deposit tokens for one regular (non-retry) request"""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def try_withdraw(self) -> bool:
+        """Take one retry token; False if the budget is exhausted"""
+        with self._lock:
+            # The time-based allowance only tops the bucket up to min_per_second
+            now = self._clock()
+            refilled = self._tokens + (now - self._last_refill) * self.min_per_second
+            self._tokens = max(self._tokens, min(self.min_per_second, refilled))
+            self._last_refill = now
+            
+            if self._tokens < 1.0:
+                self.exhausted += 1
+                return False
+            
+            self._tokens -= 1.0
+            self.retries += 1
+            return True
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the available tokens and counters"""
+        with self._lock:
+            return {
+                'tokens': round(self._tokens, 3),
+                'retries': self.retries,
+                'exhausted': self.exhausted,
+            }
+
+
+class RetryPolicy:
+    """
+    Bounded retries with full-jitter exponential backoff
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0,
+        budget: Optional[RetryBudget] = None,
+        methods: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize the policy
+        
+        Args:
+            max_attempts: Total attempts per call, including the first one
+            base_delay: Backoff base in seconds
+            max_delay: Upper bound of a single backoff in seconds
+            budget: Shared retry budget (default: RetryBudget())
+            methods: Retryable methods (default: the client's read-only
+                methods such as search, read, search_read, search_count)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self.methods = frozenset(methods) if methods is not None else None
+    
+    def is_retryable(self, method: str, default_methods: Iterable[str]) -> bool:
+        """Whether calls to this model method may be retried"""
+        return method in (self.methods if self.methods is not None else default_methods)
+    
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (0-based), with full jitter"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
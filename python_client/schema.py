@@ -0,0 +1,182 @@
+"""
+Model schema cache
+==================
+
+Caches ``fields_get`` per model so field lists can be validated locally
+before a request is sent:
+
+- fields missing on the server are dropped (or replaced by their renamed
+  counterpart, e.g. ``date_planned_start`` -> ``date_start`` on Odoo 17)
+- calls the server rejected for an unknown field can be retried with those
+  renames applied to their domain and field list (:func:`rename_fields`)
+- a "lean" projection also drops heavy fields (text, html, binary, x2many)
+  and non-stored computed fields, which Odoo computes record by record
+
+Definitions are persisted in a JSON file per (url, db, server version), so a
+server upgrade never reuses a stale schema.
+
+Example usage:
+    >>> from python_client.schema import SchemaCache
+    >>> client = OdooClient(..., schema_cache=SchemaCache())
+    >>> client.resolve_fields('product.product', ['name', 'description', 'qty_available'], lean=True)
+    ['name']
+"""
+
+import os
+import time
+from typing import Dict, List, Any, Optional
+
+from .jsonstore import JSONFileStore
+
+# Default schema file (overridable with ODOO_SCHEMA_CACHE)
+DEFAULT_SCHEMA_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'odoo_client', 'schemas.json'
+)
+
+# fields_get attributes kept per field
+SCHEMA_ATTRIBUTES = ['type', 'relation', 'store', 'required', 'readonly']
+
+# Field types left out of lean projections
+HEAVY_FIELD_TYPES = frozenset({'text', 'html', 'binary', 'one2many', 'many2many'})
+
+# Fields renamed across Odoo versions: {model: {requested name: name on other versions}}.
+# Only used when the requested name does not exist on the server.
+FIELD_RENAMES = {
+    'mrp.production': {
+        'date_planned_start': 'date_start',
+        'date_planned_finished': 'date_finished',
+    },
+}
+
+
+def is_invalid_field_error(error: Exception) -> bool:
+    """Whether the server rejected a call because of a field it does not know"""
+    return 'invalid field' in str(error).lower()
+
+
+def rename_fields(
+    model: str,
+    method: str,
+    args: List[Any],
+    kwargs: Dict[str, Any],
+    schema: Dict[str, Any]
+) -> Optional[tuple]:
+    """
+    Substitute the renamed counterpart (FIELD_RENAMES) of fields missing on the server
+    
+    Covers the domain of search/search_read/search_count and the field
+    list of read/search_read.
+    
+    Args:
+        model: Model name
+        method: Method name
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        schema: fields_get result of the model on the server
+    
+    Returns:
+        (args, kwargs, {server name: requested name}), or None if no known
+        rename applies
+    """
+    alternatives = FIELD_RENAMES.get(model)
+    if not alternatives:
+        return None
+    renames = {}
+    
+    def rename(field: Any) -> Any:
+        if not isinstance(field, str):
+            return field
+        root, dot, path = field.partition('.')
+        name = alternatives.get(root)
+        if root in schema or name is None or name not in schema:
+            return field
+        renames[name] = root
+        return name + dot + path
+    
+    def rename_domain(domain: List[Any]) -> List[Any]:
+        return [
+            (rename(item[0]),) + tuple(item[1:]) if isinstance(item, (list, tuple)) and len(item) == 3 else item
+            for item in domain or []
+        ]
+    
+    args = list(args)
+    kwargs = dict(kwargs)
+    if method in ('search', 'search_read', 'search_count'):
+        if args:
+            args[0] = rename_domain(args[0])
+        if 'domain' in kwargs:
+            kwargs['domain'] = rename_domain(kwargs['domain'])
+    if method in ('read', 'search_read'):
+        if len(args) > 1 and args[1]:
+            args[1] = [rename(field) for field in args[1]]
+        if kwargs.get('fields'):
+            kwargs['fields'] = [rename(field) for field in kwargs['fields']]
+    return (args, kwargs, renames) if renames else None
+
+
+def restore_names(records: List[Dict[str, Any]], renames: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Rename substituted fields of fetched records back to the requested names, in place"""
+    if renames:
+        for record in records:
+            for name, requested in renames.items():
+                if name in record:
+                    record[requested] = record.pop(name)
+    return records
+
+
+class SchemaCache:
+    """
+    JSON file holding ``fields_get`` results per (url, db, server version, model)
+    
+    Entries expire after ``ttl`` seconds, since installing or upgrading a
+    module changes a schema without changing the server version. Updates are
+    process-safe (see :class:`JSONFileStore`).
+    """
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400.0):
+        """
+        Initialize the cache
+        
+        Args:
+            path: Schema file path (default: ODOO_SCHEMA_CACHE env var or
+                ~/.cache/odoo_client/schemas.json)
+            ttl: Seconds a cached schema stays valid
+        """
+        self.path = path or os.getenv('ODOO_SCHEMA_CACHE') or DEFAULT_SCHEMA_PATH
+        self.ttl = ttl
+        self._store = JSONFileStore(self.path)
+    
+    @staticmethod
+    def key(url: str, db: str, version: str) -> str:
+        """Build the schema key of a database on a given server version"""
+        return f"{url.rstrip('/')}|{db}|{version}"
+    
+    def load(self, url: str, db: str, version: str, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached field definitions of a model
+        
+        Returns:
+            {field: attributes}, or None if missing or expired
+        """
+        entry = self._store.read().get(self.key(url, db, version), {}).get(model)
+        
+        if not entry or time.time() - entry.get('at', 0) > self.ttl:
+            return None
+        return entry['fields']
+    
+    def save(self, url: str, db: str, version: str, model: str, fields: Dict[str, Any]) -> None:
+        """Persist the field definitions of a model"""
+        with self._store.update() as data:
+            data.setdefault(self.key(url, db, version), {})[model] = {
+                'fields': fields,
+                'at': time.time(),
+            }
+    
+    def invalidate(self, url: str, db: str, version: str, model: Optional[str] = None) -> None:
+        """Forget one model's schema, or every schema of the database"""
+        with self._store.update() as data:
+            key = self.key(url, db, version)
+            if model is None:
+                data.pop(key, None)
+            else:
+                data.get(key, {}).pop(model, None)
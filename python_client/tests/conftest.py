@@ -0,0 +1,29 @@
+"""
+Shared fixtures: a fake Odoo server with a small generated dataset and a
+client authenticated against it
+"""
+
+import logging
+
+import pytest
+
+from python_client import OdooClient
+from python_client.datagen import generate_dataset
+from python_client.fakeserver import FakeOdooServer
+from python_client.odoo_client import logger
+
+logger.setLevel(logging.WARNING)
+
+
+@pytest.fixture
+def server():
+    with FakeOdooServer(generate_dataset(2000, products=50, users=10)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = OdooClient(server.url, server.db, 'admin', 'secret')
+    client.authenticate()
+    yield client
+    client.close()
@@ -0,0 +1,70 @@
+"""Server-side aggregation (read_group) on a small fixed dataset"""
+
+import pytest
+
+from python_client import OdooClient
+from python_client.fakeserver import FakeOdooServer
+
+MODEL = 'mrp.production'
+
+
+def order(record_id, state, qty, produced, user, deadline):
+    return {'id': record_id, 'name': f"MO/{record_id:03d}", 'state': state, 'product_qty': qty,
+            'qty_produced': produced, 'user_id': user, 'date_deadline': deadline}
+
+
+DATA = {
+    'res.users': {1: {'id': 1, 'name': 'Ana', 'login': 'admin'}, 2: {'id': 2, 'name': 'Ben', 'login': 'ben'}},
+    MODEL: {
+        1: order(1, 'done', 10.0, 10.0, [1, 'Ana'], '2024-01-05 10:00:00'),
+        2: order(2, 'done', 5.0, 4.0, [1, 'Ana'], '2024-01-20 00:00:00'),
+        3: order(3, 'progress', 4.0, 1.0, [2, 'Ben'], '2024-02-01 00:00:00'),
+        4: order(4, 'confirmed', 6.0, 0.0, False, False),
+    },
+}
+
+
+@pytest.fixture
+def client():
+    with FakeOdooServer({model: {k: dict(v) for k, v in records.items()} for model, records in DATA.items()}) as server:
+        client = OdooClient(server.url, server.db, 'admin', 'secret')
+        yield client
+        client.close()
+
+
+def test_read_group_by_state(client):
+    groups = client.read_group(MODEL, [], 'state', ['product_qty:sum', 'avg_done:avg(qty_produced)'], orderby='state')
+    assert [(g['state'], g['__count'], g['product_qty'], g['avg_done']) for g in groups] == [
+        ('confirmed', 1, 6.0, 0.0), ('done', 2, 15.0, 7.0), ('progress', 1, 4.0, 1.0)
+    ]
+
+
+def test_read_group_by_several_fields(client):
+    groups = client.read_group(MODEL, [('state', '!=', 'confirmed')], ['user_id', 'state'], ['qty_produced:max'])
+    assert [(g['user_id'], g['state'], g['__count'], g['qty_produced']) for g in groups] == [
+        ([1, 'Ana'], 'done', 2, 10.0), ([2, 'Ben'], 'progress', 1, 1.0)
+    ]
+    
+    lazy = client.read_group(MODEL, [], ['user_id', 'state'], ['product_qty:sum'], lazy=True)
+    # Lazy grouping only uses the first field; unassigned orders come last
+    assert [(g['user_id'], g['__count']) for g in lazy] == [([1, 'Ana'], 2), ([2, 'Ben'], 1), (False, 1)]
+
+
+def test_dashboard_aggregates(client):
+    assert client.get_manufacturing_order_status_counts() == {'done': 2, 'progress': 1, 'confirmed': 1}
+    assert client.get_manufacturing_order_volume('month') == [
+        {'period': 'January 2024', 'count': 2, 'product_qty': 15.0, 'qty_produced': 14.0},
+        {'period': 'February 2024', 'count': 1, 'product_qty': 4.0, 'qty_produced': 1.0},
+    ]
+    assert client.get_manufacturing_order_output_by_user() == [
+        {'user_id': 1, 'user_name': 'Ana', 'count': 2, 'product_qty': 15.0, 'qty_produced': 14.0},
+        {'user_id': 2, 'user_name': 'Ben', 'count': 1, 'product_qty': 4.0, 'qty_produced': 1.0},
+        {'user_id': None, 'user_name': None, 'count': 1, 'product_qty': 6.0, 'qty_produced': 0.0},
+    ]
+
+
+def test_unknown_granularity_and_aggregate_are_rejected(client):
+    with pytest.raises(ValueError):
+        client.read_group(MODEL, [], 'date_deadline:hour')
+    with pytest.raises(ValueError):
+        client.read_group(MODEL, [], 'state', ['product_qty:median'])
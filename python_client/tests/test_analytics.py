@@ -0,0 +1,76 @@
+"""Production analytics on a small dataset with hand-computed KPIs"""
+
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from python_client.analytics import ProductionAnalytics
+
+NOW = datetime(2024, 6, 1)
+
+ORDERS = [
+    # On time, 10 hours
+    {'id': 1, 'state': 'done', 'product_qty': 10.0, 'qty_produced': 10.0, 'user_id': [1, 'Ana'],
+     'date_planned_start': '2024-01-01 08:00:00', 'date_deadline': '2024-01-05 00:00:00',
+     'date_finished': '2024-01-01 18:00:00'},
+    # Late, 48 hours
+    {'id': 2, 'state': 'done', 'product_qty': 5.0, 'qty_produced': 4.0, 'user_id': [1, 'Ana'],
+     'date_planned_start': '2024-01-02 00:00:00', 'date_deadline': '2024-01-03 00:00:00',
+     'date_finished': '2024-01-04 00:00:00'},
+    # Open and past its deadline
+    {'id': 3, 'state': 'progress', 'product_qty': 4.0, 'qty_produced': 1.0, 'user_id': [2, 'Ben'],
+     'date_planned_start': False, 'date_deadline': '2024-05-01 00:00:00', 'date_finished': False},
+    {'id': 4, 'state': 'confirmed', 'product_qty': 6.0, 'qty_produced': 0.0, 'user_id': False,
+     'date_planned_start': False, 'date_deadline': '2024-12-01 00:00:00', 'date_finished': False},
+    # Cancelled: neither delayed nor counted in quantities
+    {'id': 5, 'state': 'cancel', 'product_qty': 100.0, 'qty_produced': 0.0, 'user_id': [2, 'Ben'],
+     'date_planned_start': False, 'date_deadline': '2024-01-01 00:00:00', 'date_finished': False},
+    # Done without a deadline, 2 hours
+    {'id': 6, 'state': 'done', 'product_qty': 2.0, 'qty_produced': 2.0, 'user_id': [3, 'Cy'],
+     'date_planned_start': '2024-02-01 00:00:00', 'date_deadline': False,
+     'date_finished': '2024-02-01 02:00:00'},
+    {'id': 7, 'state': 'draft', 'product_qty': 1.0, 'qty_produced': 0.0, 'user_id': [1, 'Ana'],
+     'date_planned_start': False, 'date_deadline': False, 'date_finished': False},
+]
+
+
+@pytest.fixture
+def analytics():
+    return ProductionAnalytics(ORDERS, now=NOW)
+
+
+def test_kpis(analytics):
+    kpis = analytics.kpis()
+    assert kpis['total_orders'] == 7
+    assert kpis['completed_orders'] == 3
+    assert kpis['completion_rate'] == 42.86  # 3 / 7
+    assert kpis['on_time_rate'] == 50.0  # 1 of orders 1 and 2
+    assert kpis['delayed_orders'] == 1  # order 3
+    assert kpis['avg_production_time'] == 20.0  # (10 + 48 + 2) / 3
+    assert kpis['qty_completion_rate'] == 60.71  # 17 / 28
+    assert kpis['avg_completion_ratio'] == 0.5083  # (1 + 0.8 + 0.25 + 0 + 1 + 0) / 6
+    assert kpis['status_breakdown'][0] == {'status': 'done', 'count': 3, 'percentage': 42.86}
+
+
+def test_worker_orderings_follow_the_dashboard_endpoints(analytics):
+    by_completed = analytics.worker_productivity()
+    assert [row['user_id'] for row in by_completed] == [1, 3, None, 2]
+    assert [row['user_id'] for row in analytics.kpis()['worker_stats']] == [3, 1, None, 2]
+    
+    ana = by_completed[0]
+    assert ana['user_name'] == 'Ana'
+    assert (ana['total_orders'], ana['completed_orders'], ana['pending_orders']) == (3, 2, 1)
+    assert ana['completion_rate'] == 66.67
+    assert (ana['product_qty'], ana['qty_produced'], ana['on_time_rate']) == (16.0, 14.0, 50.0)
+    assert by_completed[2]['user_name'] == 'Unassigned'
+
+
+def test_order_volume_by_month(analytics):
+    volume = analytics.order_volume('month', date_field='date_deadline')
+    assert [(row['date'], row['total_orders']) for row in volume] == [
+        ('Jan 2024', 3), ('May 2024', 1), ('Dec 2024', 1)
+    ]
+    assert (volume[0]['completed_orders'], volume[0]['cancelled_orders']) == (2, 1)
+    assert volume[1]['in_progress_orders'] == 1 and volume[2]['pending_orders'] == 1
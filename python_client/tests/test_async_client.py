@@ -0,0 +1,66 @@
+"""AsyncOdooClient event-loop binding and error mapping"""
+
+import asyncio
+import socket
+import threading
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from python_client import AsyncOdooClient, OdooAPIError, OdooConnectionError
+
+MODEL = 'product.product'
+
+
+def test_client_survives_successive_event_loops(server):
+    client = AsyncOdooClient(server.url, server.db, 'admin', 'secret')
+    
+    async def count():
+        return await client.search_count(MODEL, [])
+    
+    first = asyncio.run(count())
+    second = asyncio.run(count())
+    asyncio.run(client.close())
+    
+    assert first == second == len(server.data[MODEL])
+
+
+def test_session_of_a_running_loop_is_closed_by_that_loop(server):
+    client = AsyncOdooClient(server.url, server.db, 'admin', 'secret')
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(client.search_count(MODEL, []), loop).result(10)
+        first = client._session
+        
+        async def count_and_close():
+            count = await client.search_count(MODEL, [])
+            await client.close()
+            return count
+        
+        assert asyncio.run(count_and_close()) == len(server.data[MODEL])
+        assert first.closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+
+def test_unreachable_server_raises_connection_error():
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        port = sock.getsockname()[1]
+    
+    async def run():
+        async with AsyncOdooClient(f"http://localhost:{port}", 'db', 'admin', 'secret') as client:
+            await client.authenticate()
+    
+    with pytest.raises(OdooConnectionError):
+        asyncio.run(run())
+
+
+def test_invalid_config_raises_api_error():
+    with pytest.raises(OdooAPIError, match='Invalid URL format'):
+        AsyncOdooClient('localhost:8069', 'db', 'admin', 'secret')
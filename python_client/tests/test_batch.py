@@ -0,0 +1,68 @@
+"""Chunked create_many/write_many with per-record results"""
+
+from python_client.fakeserver import FakeOdooError
+
+MODEL = 'product.product'
+
+
+def reject_names(server, bad_names):
+    create = server._rpc_create
+    
+    def _rpc_create(model, vals_list):
+        if any(values.get('name') in bad_names for values in vals_list):
+            raise FakeOdooError('ValidationError: invalid name')
+        return create(model, vals_list)
+    server._rpc_create = _rpc_create
+
+
+def test_create_many_isolates_rejected_records(client, server):
+    reject_names(server, {'bad-3', 'bad-11'})
+    vals_list = [{'name': f"bad-{i}" if i in (3, 11) else f"ok-{i}"} for i in range(16)]
+    
+    results = client.create_many(MODEL, vals_list, chunk_size=8)
+    
+    assert [i for i, r in enumerate(results) if not r['ok']] == [3, 11]
+    assert all('invalid name' in results[i]['error'] for i in (3, 11))
+    for values, result in zip(vals_list, results):
+        if result['ok']:
+            assert server.data[MODEL][result['id']]['name'] == values['name']
+
+
+def test_create_many_without_isolation_fails_whole_chunk(client, server):
+    reject_names(server, {'bad'})
+    vals_list = [{'name': 'ok'}, {'name': 'bad'}, {'name': 'ok'}, {'name': 'ok'}]
+    
+    results = client.create_many(MODEL, vals_list, chunk_size=2, isolate_errors=False)
+    
+    assert [r['ok'] for r in results] == [False, False, True, True]
+
+
+def test_create_many_marks_records_without_returned_id_failed(client, server):
+    create = server._rpc_create
+    server._rpc_create = lambda model, vals_list: create(model, vals_list)[:-1]
+    
+    results = client.create_many(MODEL, [{'name': f"p{i}"} for i in range(5)], chunk_size=5)
+    
+    assert [r['ok'] for r in results] == [True, True, True, True, False]
+    assert results[4] == {'id': None, 'ok': False, 'error': 'create returned 4 id(s) for 5 record(s)'}
+
+
+def test_write_many_isolates_deleted_ids(client, server):
+    ids = sorted(server.data[MODEL])[:10]
+    client.unlink(MODEL, [ids[2], ids[7]])
+    
+    results = client.write_many(MODEL, {record_id: {'list_price': 9.5} for record_id in ids})
+    
+    assert [r['id'] for r in results] == ids
+    assert [r['id'] for r in results if not r['ok']] == [ids[2], ids[7]]
+    assert all(server.data[MODEL][i]['list_price'] == 9.5 for i in ids if i not in (ids[2], ids[7]))
+
+
+def test_write_many_groups_identical_values(client, server):
+    ids = sorted(server.data[MODEL])[:6]
+    before = server.request_count
+    
+    results = client.write_many(MODEL, [(i, {'active': i % 2 == 0}) for i in ids])
+    
+    assert all(r['ok'] for r in results)
+    assert server.request_count - before == 2
@@ -0,0 +1,79 @@
+"""Read-through record cache (RecordCache) against the fake server"""
+
+import pytest
+
+from python_client import OdooClient
+from python_client.cache import RecordCache
+
+MODEL = 'product.product'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cached(server, clock):
+    cache = RecordCache(ttls={MODEL: 60}, max_entries=50, clock=clock)
+    client = OdooClient(server.url, server.db, 'admin', 'secret', cache=cache)
+    client.authenticate()
+    yield client
+    client.close()
+
+
+def test_reads_are_served_from_the_cache(cached, server):
+    ids = sorted(server.data[MODEL])[:5]
+    cached.read(MODEL, ids[:3], ['name'])
+    before = server.request_count
+    
+    records = cached.read(MODEL, ids, ['name'])
+    assert [r['id'] for r in records] == ids
+    # Only the two missing ids were fetched, in one request
+    assert server.request_count - before == 1
+    assert cached.cache.stats()['hits'] == 3
+    
+    records[0]['name'] = 'changed by the caller'
+    assert cached.read(MODEL, ids[:1], ['name'])[0]['name'] == server.data[MODEL][ids[0]]['name']
+
+
+def test_write_invalidates_the_model(cached, server):
+    record_id = sorted(server.data[MODEL])[0]
+    assert cached.search_read(MODEL, [('id', '=', record_id)], ['name'])[0]['name'] != 'Renamed'
+    cached.read(MODEL, [record_id], ['name'])
+    
+    cached.write(MODEL, [record_id], {'name': 'Renamed'})
+    assert cached.read(MODEL, [record_id], ['name'])[0]['name'] == 'Renamed'
+    assert cached.search_read(MODEL, [('id', '=', record_id)], ['name'])[0]['name'] == 'Renamed'
+    assert cached.cache.stats()['invalidations'] == 1
+
+
+def test_entries_expire_after_their_ttl(cached, server, clock):
+    record_id = sorted(server.data[MODEL])[0]
+    cached.read(MODEL, [record_id], ['name'])
+    server.data[MODEL][record_id]['name'] = 'Changed on the server'
+    
+    clock.now = 59
+    assert cached.read(MODEL, [record_id], ['name'])[0]['name'] != 'Changed on the server'
+    clock.now = 60
+    assert cached.read(MODEL, [record_id], ['name'])[0]['name'] == 'Changed on the server'
+
+
+def test_uncached_models_and_lru_eviction(cached, server):
+    before = server.request_count
+    cached.read('res.users', [1], ['name'])
+    cached.read('res.users', [1], ['name'])
+    assert server.request_count - before == 2
+    
+    cached.read(MODEL, sorted(server.data[MODEL])[:50], ['name'])
+    cached.read(MODEL, sorted(server.data[MODEL])[:1], ['id'])
+    stats = cached.cache.stats()
+    assert stats['size'] == 50 and stats['evictions'] == 1
@@ -0,0 +1,84 @@
+"""JSON codecs and the streaming JSON-RPC result parser"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from python_client import OdooAPIError, OdooClient
+from python_client.codec import _CODECS, get_codec, iter_jsonrpc_result
+
+MODEL = 'mrp.production'
+
+CODECS = [name for name, (_, available) in _CODECS.items() if available()]
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize('name', CODECS)
+def test_dates_are_encoded_in_odoo_format(name):
+    codec = get_codec(name)
+    aware = datetime(2024, 5, 1, 14, 30, 0, tzinfo=timezone(timedelta(hours=2)))
+    
+    payload = codec.dumps({'naive': datetime(2024, 5, 1, 12, 30, 0, 123), 'aware': aware, 'day': date(2024, 5, 1)})
+    
+    assert json.loads(payload) == {'naive': '2024-05-01 12:30:00', 'aware': '2024-05-01 12:30:00', 'day': '2024-05-01'}
+
+
+@pytest.mark.parametrize('name', CODECS)
+def test_unknown_types_raise_type_error(name):
+    with pytest.raises(TypeError):
+        get_codec(name).dumps({'value': object()})
+
+
+@pytest.mark.parametrize('name', CODECS)
+def test_datetime_domain_matches_string_domain(server, name):
+    client = OdooClient(server.url, server.db, 'admin', 'secret', codec=name)
+    try:
+        since = datetime(2024, 6, 1)
+        assert client.search_count(MODEL, [('date_deadline', '>=', since)]) == \
+            client.search_count(MODEL, [('date_deadline', '>=', '2024-06-01 00:00:00')])
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 65536])
+def test_stream_parser_splits_result_across_chunks(chunk_size):
+    records = [
+        {'id': 1, 'name': 'a "quoted" [bracket] {brace}', 'tags': [1, [2, 3]]},
+        {'id': 2, 'name': 'back\\slash\\', 'value': -1.5e3, 'flag': True, 'none': None},
+        {'id': 3, 'name': 'unicode é中', 'nested': {'a': {'b': []}}},
+    ]
+    body = json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': records}, indent=1).encode()
+    
+    assert list(iter_jsonrpc_result(chunked(body, chunk_size))) == records
+
+
+def test_stream_parser_scalar_and_empty_results():
+    assert list(iter_jsonrpc_result([b'{"id": 1, "result": []}'])) == []
+    assert list(iter_jsonrpc_result([b'{"id": 1, "result": 42}'])) == [42]
+    assert list(iter_jsonrpc_result([b'{"id": 1, "result": null}'])) == []
+
+
+def test_stream_parser_raises_json_rpc_error():
+    body = b'{"jsonrpc": "2.0", "id": 1, "error": {"message": "Odoo Server Error", "data": {"message": "Access denied"}}}'
+    with pytest.raises(OdooAPIError, match='Access denied'):
+        list(iter_jsonrpc_result(chunked(body, 5)))
+
+
+def test_stream_parser_rejects_truncated_body():
+    body = b'{"id": 1, "result": [{"id": 1}, {"id": 2, "name": "tru'
+    parsed = iter_jsonrpc_result(chunked(body, 4))
+    assert next(parsed) == {'id': 1}
+    with pytest.raises(OdooAPIError, match='truncated'):
+        next(parsed)
+
+
+def test_search_read_stream_matches_search_read(client):
+    domain = [('state', 'in', ['confirmed', 'progress'])]
+    fields = ['name', 'state', 'date_deadline']
+    
+    assert list(client.search_read_stream(MODEL, domain, fields, limit=500, order='id')) == \
+        client.search_read(MODEL, domain, fields, limit=500, order='id')
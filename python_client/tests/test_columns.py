@@ -0,0 +1,55 @@
+"""Columnar search_read results (search_read_columns, build_columns)"""
+
+import pytest
+
+from python_client.columns import build_columns
+
+MODEL = 'mrp.production'
+FIELDS = ['name', 'state', 'product_id', 'product_qty', 'date_deadline']
+
+RECORDS = [
+    {'id': 1, 'state': 'done', 'product_qty': 2, 'user_id': False, 'date_deadline': False},
+    {'id': 2, 'state': 'draft', 'product_qty': 1.5, 'user_id': [7, 'Ana'], 'date_deadline': '1970-01-02 00:00:00'},
+    {'id': 3, 'state': False, 'product_qty': False, 'user_id': [7, 'Ana'], 'date_deadline': '1970-01-01 00:01:00'},
+]
+
+
+def test_types_are_inferred_from_the_values():
+    store = build_columns(RECORDS, use_numpy=False)
+    assert store.kinds == {
+        'id': 'int', 'state': 'category', 'product_qty': 'float', 'user_id': 'many2one', 'date_deadline': 'datetime'
+    }
+    # The int column became a float column at 1.5; empty floats are NaN
+    assert list(store['product_qty'][:2]) == [2.0, 1.5] and store['product_qty'][2] != store['product_qty'][2]
+    assert list(store['state']) == [0, 1, -1] and store.categories['state'] == ['done', 'draft']
+    assert list(store['user_id']) == [0, 7, 7] and store['user_id.name'] == [None, 'Ana', 'Ana']
+    assert list(store['date_deadline'][1:]) == [86400.0, 60.0]
+    assert [r['product_qty'] for r in store.to_records()] == [2.0, 1.5, False]
+    assert [r['user_id'] for r in store.to_records()] == [False, [7, 'Ana'], [7, 'Ana']]
+
+
+def test_numpy_columns():
+    np = pytest.importorskip('numpy')
+    store = build_columns(RECORDS, use_numpy=True)
+    assert store['id'].dtype == np.int64 and store['product_qty'].dtype == np.float64
+    assert np.isnat(store['date_deadline'][0])
+    assert store['date_deadline'][2] == np.datetime64('1970-01-01T00:01:00')
+    assert store.decode('date_deadline') == [r['date_deadline'] for r in RECORDS]
+
+
+def test_search_read_columns_match_search_read(client):
+    domain = [('state', '!=', 'cancel')]
+    records = client.search_read(MODEL, domain, FIELDS, limit=0, order='id')
+    store = client.search_read_columns(MODEL, domain, FIELDS, order='id', use_numpy=False)
+    
+    assert len(store) == len(records)
+    assert store.keys() == ['id', 'name', 'state', 'product_id', 'product_id.name', 'product_qty', 'date_deadline']
+    assert store.to_records() == records
+
+
+def test_fetch_manufacturing_order_columns(client, server):
+    store = client.fetch_manufacturing_order_columns([('state', '=', 'done')], ['state', 'product_qty'])
+    done = [r for r in server.data[MODEL].values() if r['state'] == 'done']
+    assert len(store) == len(done)
+    assert store.categories['state'] == ['done']
+    assert float(sum(store['product_qty'])) == pytest.approx(sum(r['product_qty'] for r in done))
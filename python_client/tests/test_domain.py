@@ -0,0 +1,213 @@
+"""Local domain evaluation and snapshot queries (load_local)"""
+
+import pytest
+
+from python_client.domain import RecordIndex, DomainError, compile_domain, top_level_leaves
+
+RECORDS = [
+    {'id': 1, 'state': 'done', 'product_qty': 5.0, 'user_id': [7, 'Sara Kim'], 'name': 'MO/001'},
+    {'id': 2, 'state': 'draft', 'product_qty': 1.0, 'user_id': False, 'name': 'MO/002'},
+    {'id': 3, 'state': 'progress', 'product_qty': 9.0, 'user_id': [8, 'Ali Noor'], 'name': 'WO/003'},
+    {'id': 4, 'state': 'done', 'product_qty': 2.0, 'user_id': [8, 'Ali Noor'], 'name': 'MO/004'},
+]
+
+FIELDS = ['name', 'state', 'priority', 'product_qty']
+
+
+def ids(domain):
+    match = compile_domain(domain)
+    return [record['id'] for record in RECORDS if match(record)]
+
+
+@pytest.mark.parametrize('domain, expected', [
+    ([], [1, 2, 3, 4]),
+    ([('state', '=', 'done'), ('product_qty', '>', 3)], [1]),
+    (['|', ('state', '=', 'draft'), ('product_qty', '>=', 9)], [2, 3]),
+    (['!', ('state', 'in', ['done', 'draft'])], [3]),
+    (['&', ('state', '=', 'done'), '|', ('product_qty', '<', 3), ('name', '=', 'MO/001')], [1, 4]),
+    ([('user_id', '=', 8)], [3, 4]),
+    ([('user_id', '=', False)], [2]),
+    ([('user_id', 'ilike', 'sara')], [1]),
+    ([('name', 'not like', 'MO/')], [3]),
+    ([('name', '=like', 'MO/00_')], [1, 2, 4]),
+])
+def test_compile_domain(domain, expected):
+    assert ids(domain) == expected
+
+
+@pytest.mark.parametrize('domain', [
+    [('product_id.categ_id', '=', 1)],
+    [('id', 'child_of', 1)],
+    ['|', ('state', '=', 'done')],
+])
+def test_unsupported_domains_raise(domain):
+    with pytest.raises(DomainError):
+        compile_domain(domain)
+
+
+def test_top_level_leaves():
+    a, b, c = ('state', '=', 'done'), ('state', '=', 'cancel'), ('priority', '=', '1')
+    assert top_level_leaves([a, b]) == [a, b]
+    assert top_level_leaves(['|', a, b, c]) == [c]
+    assert top_level_leaves([a, '!', b, '|', b, '|', a, c]) == [a]
+    assert top_level_leaves([['state', '=', 'done']]) == [a]
+
+
+def test_record_index_matches_predicate():
+    index = RecordIndex(RECORDS, hash_fields=['state', 'user_id'], sorted_fields=['product_qty'])
+    for domain in (
+        [('state', 'in', ['done', 'progress']), ('product_qty', '>', 2)],
+        [('user_id', '=', 8), ('product_qty', '<=', 9)],
+        ['|', ('state', '=', 'draft'), ('product_qty', '>', 4)],
+    ):
+        assert sorted(r['id'] for r in index.search(domain)) == ids(domain)
+    
+    index.upsert([{'id': 5, 'state': 'done', 'product_qty': 3.0, 'user_id': False, 'name': 'MO/005'}])
+    index.remove([1])
+    assert [r['id'] for r in index.search([('product_qty', '>=', 2)], 'product_qty asc')] == [4, 5, 3]
+    assert index.count([('state', '=', 'done')]) == 2
+
+
+def test_snapshot_answers_and_ed_queries_locally(client, server):
+    done = ('state', '=', 'done')
+    client.load_local('mrp.production', FIELDS, [done])
+    before = server.request_count
+    
+    domain = [done, ('product_qty', '>', 10)]
+    local = client.search_read('mrp.production', domain, FIELDS, limit=0, order='id')
+    assert server.request_count == before
+    assert client.metrics.snapshot()['mrp.production']['local_queries'] == 1
+    
+    client.drop_local('mrp.production')
+    assert client.search_read('mrp.production', domain, FIELDS, limit=0, order='id') == local
+
+
+@pytest.mark.parametrize('snapshot_domain, domain', [
+    # The snapshot holds A or B, the query also wants C
+    (['|', ('state', '=', 'done'), ('state', '=', 'cancel')],
+     ['|', ('state', '=', 'done'), '|', ('state', '=', 'cancel'), ('priority', '=', '1')]),
+    # A appears in the query, but only inside an OR
+    ([('state', '=', 'done')],
+     ['|', ('state', '=', 'done'), ('priority', '=', '1')]),
+    ([('state', '=', 'done')],
+     ['!', ('state', '=', 'done')]),
+])
+def test_snapshot_not_used_unless_query_ands_its_domain(client, server, snapshot_domain, domain):
+    expected = client.search_count('mrp.production', domain)
+    client.load_local('mrp.production', FIELDS, snapshot_domain)
+    before = server.request_count
+    
+    assert client.search_count('mrp.production', domain) == expected
+    assert server.request_count == before + 1
+    assert 'local_queries' not in client.metrics.snapshot().get('mrp.production', {})
+
+
+def test_write_refreshes_snapshot(client, server):
+    client.load_local('mrp.production', FIELDS, [('state', '=', 'done')])
+    record_id = client.search('mrp.production', [('state', '=', 'done')], limit=1)[0]
+    
+    client.write('mrp.production', [record_id], {'product_qty': 12345.0})
+    found = client.search_read('mrp.production', [('state', '=', 'done'), ('product_qty', '=', 12345.0)], FIELDS)
+    assert [r['id'] for r in found] == [record_id]
+    
+    client.write('mrp.production', [record_id], {'state': 'cancel'})
+    assert client.search_count('mrp.production', [('state', '=', 'done'), ('id', '=', record_id)]) == 0
+    assert client.metrics.snapshot()['mrp.production']['local_queries'] == 3
+
+
+def test_failed_refresh_drops_snapshot_but_keeps_the_write(client, server, monkeypatch):
+    client.load_local('mrp.production', FIELDS)
+    record_id = sorted(server.data['mrp.production'])[0]
+    execute_call = client._execute_call
+    
+    def failing_read(model, method, args, kwargs):
+        if method == 'read':
+            raise RuntimeError("connection reset")
+        return execute_call(model, method, args, kwargs)
+    
+    monkeypatch.setattr(client, '_execute_call', failing_read)
+    assert client.write('mrp.production', [record_id], {'product_qty': 7.0}) is True
+    assert 'mrp.production' not in client._snapshots
+
+
+def test_other_write_methods_drop_snapshot(client, server):
+    client.load_local('mrp.production', FIELDS)
+    client._refresh_local('mrp.production', 'copy', [[1]], 9999)
+    assert 'mrp.production' not in client._snapshots
+    # Dropped concurrently: nothing to refresh
+    client._refresh_local('mrp.production', 'write', [[1], {}], True)
+
+
+# Expected values below follow Odoo on PostgreSQL: a date operand on a
+# datetime field means 00:00:00 of that day, except for '<=' and '>' where
+# it means 23:59:59; NULL sorts last ascending and first descending.
+
+DEADLINES = [
+    {'id': 1, 'date_deadline': False},
+    {'id': 2, 'date_deadline': '2024-01-01 00:00:00'},
+    {'id': 3, 'date_deadline': '2024-02-01 00:00:00'},
+    {'id': 4, 'date_deadline': '2024-03-01 10:00:00'},
+]
+
+
+@pytest.mark.parametrize('domain, expected', [
+    ([('date_deadline', '<=', '2024-03-01')], [2, 3, 4]),
+    ([('date_deadline', '<', '2024-03-01')], [2, 3]),
+    ([('date_deadline', '>', '2024-02-01')], [4]),
+    ([('date_deadline', '>=', '2024-02-01')], [3, 4]),
+    ([('date_deadline', '=', '2024-01-01')], [2]),
+    ([('date_deadline', '!=', '2024-01-01')], [1, 3, 4]),
+])
+def test_date_operand_on_datetime_field(domain, expected):
+    match = compile_domain(domain)
+    assert [r['id'] for r in DEADLINES if match(r)] == expected
+    index = RecordIndex(DEADLINES, sorted_fields=['date_deadline'])
+    assert sorted(r['id'] for r in index.search(domain)) == expected
+
+
+@pytest.mark.parametrize('order, expected', [
+    ('date_deadline desc', [1, 4, 3, 2]),
+    ('date_deadline asc', [2, 3, 4, 1]),
+    ('date_deadline', [2, 3, 4, 1]),
+])
+def test_empty_values_sort_like_postgresql(order, expected):
+    assert [r['id'] for r in RecordIndex(DEADLINES).search([], order)] == expected
+
+
+def test_null_ordering_repro():
+    records = [
+        {'id': 1, 'date_deadline': False},
+        {'id': 2, 'date_deadline': '2024-01-01 00:00:00'},
+        {'id': 3, 'date_deadline': '2024-02-01 00:00:00'},
+    ]
+    assert [r['id'] for r in RecordIndex(records).search([], 'date_deadline desc')] == [1, 3, 2]
+
+
+def test_many2one_ordering_raises():
+    # Odoo orders on the related model's _order, unknown locally
+    with pytest.raises(DomainError):
+        RecordIndex(RECORDS).search([], 'user_id asc')
+
+
+@pytest.mark.parametrize('domain', [
+    [('user_id', '=', 'Ali Noor')],
+    [('user_id', '!=', 'Ali Noor')],
+    [('user_id', 'in', ['Sara Kim', 'Ali Noor'])],
+    [('user_id', 'not in', ['Sara Kim'])],
+])
+def test_many2one_name_operands_raise(domain):
+    with pytest.raises(DomainError):
+        ids(domain)
+    with pytest.raises(DomainError):
+        RecordIndex(RECORDS, hash_fields=['user_id']).search(domain)
+
+
+def test_snapshot_falls_back_to_server_for_name_operands(client, server):
+    client.load_local('mrp.production', FIELDS + ['user_id'])
+    user = server.data['res.users'][sorted(server.data['res.users'])[0]]
+    domain = [('user_id', '=', user['name'])]
+    before = server.request_count
+    
+    found = client.search_read('mrp.production', domain, ['user_id'], limit=0)
+    assert server.request_count == before + 1
+    assert found and all(r['user_id'][0] == user['id'] for r in found)
@@ -0,0 +1,85 @@
+"""Bulk export: formats, resume and records deleted during the export"""
+
+import csv
+import json
+
+import pytest
+
+from python_client.export import export_model, STATE_SUFFIX
+
+MODEL = 'mrp.production'
+FIELDS = ['name', 'state', 'product_id', 'product_qty']
+
+
+def jsonl_ids(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line)['id'] for line in f]
+
+
+def test_jsonl_export(client, server, tmp_path):
+    path = str(tmp_path / 'mos.jsonl')
+    stats = export_model(client, MODEL, path, fields=FIELDS, page_size=150, workers=3)
+    
+    assert stats['records'] == len(server.data[MODEL])
+    assert jsonl_ids(path) == sorted(server.data[MODEL])
+    with open(path + STATE_SUFFIX, encoding='utf-8') as f:
+        assert json.load(f)['complete'] is True
+
+
+def test_csv_export_with_domain(client, server, tmp_path):
+    path = str(tmp_path / 'done.csv')
+    domain = [('state', '=', 'done')]
+    export_model(client, MODEL, path, 'csv', domain, FIELDS, page_size=100)
+    
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row['id']) for row in rows] == sorted(client.search(MODEL, domain, limit=0))
+    assert {row['state'] for row in rows} == {'done'}
+
+
+def test_interrupted_export_resumes(client, server, tmp_path):
+    path = str(tmp_path / 'mos.jsonl')
+    
+    def interrupt(stats):
+        if stats['records'] >= 600:
+            raise KeyboardInterrupt
+    
+    with pytest.raises(KeyboardInterrupt):
+        export_model(client, MODEL, path, fields=FIELDS, page_size=100, workers=2, progress=interrupt)
+    
+    stats = export_model(client, MODEL, path, fields=FIELDS, page_size=100, workers=2, resume=True)
+    assert stats['resumed_from'] > 0
+    assert jsonl_ids(path) == sorted(server.data[MODEL])
+    
+    with pytest.raises(ValueError):
+        export_model(client, MODEL, path, fields=['name'], resume=True)
+
+
+def test_records_deleted_during_export_are_skipped(client, server, tmp_path, monkeypatch):
+    search = client.search
+    deleted = []
+    
+    def search_then_delete(*args, **kwargs):
+        ids = search(*args, **kwargs)
+        # Deleted by someone else before the page is read
+        for record_id in ids[10:13]:
+            del server.data[MODEL][record_id]
+            deleted.append(record_id)
+        return ids
+    
+    monkeypatch.setattr(client, 'search', search_then_delete)
+    path = str(tmp_path / 'mos.jsonl')
+    export_model(client, MODEL, path, fields=FIELDS, page_size=200)
+    
+    assert deleted
+    assert jsonl_ids(path) == sorted(server.data[MODEL])
+
+
+def test_parquet_export(client, server, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'mos.parquet')
+    export_model(client, MODEL, path, 'parquet', fields=FIELDS, page_size=300, row_group_size=700)
+    
+    table = pq.read_table(path)
+    assert table.num_rows == len(server.data[MODEL])
+    assert sorted(table.column('id').to_pylist()) == sorted(server.data[MODEL])
@@ -0,0 +1,79 @@
+"""Fork safety of client locks and closing of per-thread sessions"""
+
+import multiprocessing
+import threading
+
+from python_client import OdooClient
+from python_client.resilience import AdaptiveLimiter
+
+MODEL = 'product.product'
+
+
+def run_in_child(target):
+    process = multiprocessing.get_context('fork').Process(target=target)
+    process.start()
+    process.join(10)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    return process.exitcode
+
+
+def hold(lock, forked):
+    """Hold a lock from another thread until the fork is done"""
+    acquired = threading.Event()
+    
+    def run():
+        with lock:
+            acquired.set()
+            forked.wait()
+    thread = threading.Thread(target=run)
+    thread.start()
+    acquired.wait()
+    return thread
+
+
+def test_child_does_not_inherit_held_locks(client):
+    client.search_count(MODEL, [])
+    forked = threading.Event()
+    threads = [hold(client.metrics._lock, forked), hold(client._watchers_lock, forked)]
+    
+    try:
+        exitcode = run_in_child(lambda: client.search_count(MODEL, []))
+    finally:
+        forked.set()
+        for thread in threads:
+            thread.join()
+    assert exitcode == 0
+
+
+def test_child_gets_free_limiter_slots(server):
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+    client = OdooClient(server.url, server.db, 'admin', 'secret', limiter=limiter)
+    client.authenticate()
+    limiter.acquire()
+    
+    try:
+        exitcode = run_in_child(lambda: client.search_count(MODEL, []))
+    finally:
+        limiter.release(0.0)
+        client.close()
+    assert exitcode == 0
+
+
+def test_close_closes_every_thread_session(server):
+    client = OdooClient(server.url, server.db, 'admin', 'secret', session_scope='thread')
+    client.authenticate()
+    threads = [threading.Thread(target=client.search_count, args=(MODEL, [('id', '>', i)])) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sessions = list(client._thread_sessions)
+    assert len(sessions) == 4
+    
+    client.close()
+    
+    assert all(not s.get_adapter(server.url).poolmanager.pools for s in sessions)
+    assert client.search_count(MODEL, []) == len(server.data[MODEL])
+    client.close()
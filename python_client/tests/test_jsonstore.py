@@ -0,0 +1,58 @@
+"""Process-safe JSON file store shared by checkpoints, sessions and schemas"""
+
+import os
+import multiprocessing
+
+from python_client.jsonstore import JSONFileStore
+from python_client.sync import CheckpointStore
+
+
+def save_checkpoints(path, worker, count):
+    store = CheckpointStore(path)
+    for i in range(count):
+        store.save('http://odoo', 'db', f"model.{worker}.{i}", '2024-01-01 00:00:00', i)
+
+
+def test_concurrent_processes_keep_every_key(tmp_path):
+    path = str(tmp_path / 'checkpoints.json')
+    ctx = multiprocessing.get_context('fork')
+    workers = [ctx.Process(target=save_checkpoints, args=(path, w, 25)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+    
+    assert all(p.exitcode == 0 for p in workers)
+    assert len(JSONFileStore(path).read()) == 4 * 25
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_unchanged_update_does_not_write(tmp_path):
+    store = JSONFileStore(str(tmp_path / 'state.json'))
+    with store.update() as data:
+        data['a'] = 1
+    mtime = os.stat(store.path).st_mtime_ns
+    
+    with store.update() as data:
+        data.pop('missing', None)
+    assert os.stat(store.path).st_mtime_ns == mtime
+
+
+def test_failed_update_keeps_previous_contents(tmp_path):
+    store = JSONFileStore(str(tmp_path / 'state.json'))
+    with store.update() as data:
+        data['a'] = 1
+    
+    try:
+        with store.update() as data:
+            data['a'] = 2
+            raise RuntimeError('boom')
+    except RuntimeError:
+        pass
+    assert store.read() == {'a': 1}
+
+
+def test_unreadable_file_reads_empty(tmp_path):
+    path = tmp_path / 'state.json'
+    path.write_text('{not json')
+    assert JSONFileStore(str(path)).read() == {}
@@ -0,0 +1,46 @@
+"""Batched record loading (RecordLoader)"""
+
+import pytest
+
+from python_client import RecordLoader
+from python_client.exceptions import OdooAPIError
+
+MODEL = 'product.product'
+
+
+def test_batch_sends_one_read_per_model(client, server):
+    loader = RecordLoader(client)
+    product_ids = sorted(server.data[MODEL])[:5]
+    before = server.request_count
+    
+    with loader.batch():
+        products = [loader.get_product(product_id, ['name']) for product_id in product_ids]
+        user = loader.get_user(sorted(server.data['res.users'])[0], ['login'])
+    
+    assert server.request_count - before == 2
+    assert [p.result()['id'] for p in products] == product_ids
+    assert set(products[0].result()) == {'id', 'name'}
+    assert 'login' in user.result()
+
+
+def test_missing_id_only_fails_its_own_caller(client, server):
+    loader = RecordLoader(client)
+    product_ids = sorted(server.data[MODEL])[:9]
+    del server.data[MODEL][product_ids[4]]
+    
+    with loader.batch():
+        futures = [loader.get_product(product_id, ['name']) for product_id in product_ids]
+    
+    with pytest.raises(OdooAPIError):
+        futures[4].result()
+    for product_id, future in zip(product_ids, futures):
+        if product_id != product_ids[4]:
+            assert future.result()['id'] == product_id
+
+
+def test_time_window_batches_concurrent_requests(client, server):
+    loader = RecordLoader(client, window=0.05)
+    before = server.request_count
+    futures = loader.load_many(MODEL, sorted(server.data[MODEL])[:20], ['name'])
+    assert len({f.result(timeout=5)['id'] for f in futures}) == 20
+    assert server.request_count - before == 1
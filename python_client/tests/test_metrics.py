@@ -0,0 +1,69 @@
+"""Per-call metrics (MetricsRegistry) and their Prometheus export"""
+
+from python_client.metrics import MetricsRegistry
+
+
+def test_render_prometheus():
+    metrics = MetricsRegistry(prefix='odoo')
+    metrics.observe_call('res.users', 'read', 'jsonrpc', 0.25, request_bytes=300, response_bytes=2000)
+    metrics.observe_call('res.users', 'read', 'jsonrpc', 0.5, error=True)
+    metrics.record_retry('res.users', 'read', 'jsonrpc')
+    metrics.record_cache('res.users', hits=2, misses=1)
+    
+    lines = metrics.render_prometheus().splitlines()
+    labels = 'model="res.users",method="read",protocol="jsonrpc"'
+    for line in (
+        '# TYPE odoo_request_duration_seconds histogram',
+        f'odoo_request_duration_seconds_bucket{{{labels},le="0.1"}} 0',
+        f'odoo_request_duration_seconds_bucket{{{labels},le="0.25"}} 1',
+        f'odoo_request_duration_seconds_bucket{{{labels},le="0.5"}} 2',
+        f'odoo_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+        f'odoo_request_duration_seconds_sum{{{labels}}} 0.75',
+        f'odoo_request_duration_seconds_count{{{labels}}} 2',
+        # Sizes are only known for the first call
+        f'odoo_request_size_bytes_bucket{{{labels},le="256"}} 0',
+        f'odoo_request_size_bytes_bucket{{{labels},le="1024"}} 1',
+        f'odoo_request_size_bytes_count{{{labels}}} 1',
+        f'odoo_response_size_bytes_bucket{{{labels},le="4096"}} 1',
+        f'odoo_response_size_bytes_sum{{{labels}}} 2000',
+        f'odoo_errors_total{{{labels}}} 1',
+        f'odoo_retries_total{{{labels}}} 1',
+        '# TYPE odoo_cache_hits_total counter',
+        'odoo_cache_hits_total{model="res.users"} 2',
+        'odoo_cache_misses_total{model="res.users"} 1',
+    ):
+        assert line in lines
+
+
+def test_snapshot_quantiles():
+    metrics = MetricsRegistry()
+    metrics.observe_call('res.users', 'read', 'jsonrpc', 0.25)
+    metrics.observe_call('res.users', 'read', 'jsonrpc', 0.5)
+    
+    stats = metrics.snapshot()['res.users.read/jsonrpc']
+    assert (stats['calls'], stats['latency_total'], stats['latency_avg']) == (2, 0.75, 0.375)
+    # The median falls at the top of the 0.1-0.25 bucket
+    assert stats['p50'] == 0.25
+    assert stats['p99'] == 0.25 + (0.5 - 0.25) * 0.98
+
+
+def test_labels_are_escaped_and_disabled_registries_record_nothing():
+    metrics = MetricsRegistry()
+    metrics.increment('x"y', 'watch_events')
+    assert 'odoo_client_watch_events_total{model="x\\"y"} 1' in metrics.render_prometheus()
+    
+    disabled = MetricsRegistry(enabled=False)
+    disabled.observe_call('res.users', 'read', 'jsonrpc', 0.1)
+    disabled.increment('res.users', 'watch_events')
+    assert disabled.snapshot() == {}
+
+
+def test_client_records_its_calls(client, server):
+    client.metrics.reset()
+    client.search_read('res.users', [], ['name'], limit=5)
+    
+    stats = client.metrics.snapshot()['res.users.search_read/jsonrpc']
+    assert stats['calls'] == 1 and stats['errors'] == 0
+    assert stats['request_bytes'] > 0 and stats['response_bytes'] > 0
+    assert 'odoo_client_request_duration_seconds_count{model="res.users",method="search_read",' \
+        'protocol="jsonrpc"} 1' in client.metrics.render_prometheus()
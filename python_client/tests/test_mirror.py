@@ -0,0 +1,87 @@
+"""SQLite mirror: refresh, prune and queries against the fake server"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from python_client.mirror import OdooMirror
+
+MODEL = 'mrp.production'
+
+
+@pytest.fixture
+def mirror(client):
+    mirror = OdooMirror(client, ':memory:', page_size=500)
+    mirror.refresh()
+    yield mirror
+    mirror.close()
+
+
+def test_refresh_mirrors_every_model(mirror, server):
+    for model in ('mrp.production', 'product.product', 'res.users'):
+        assert mirror.count(model) == len(server.data[model])
+    
+    record_id = sorted(server.data[MODEL])[0]
+    assert mirror.get(MODEL, record_id)['name'] == server.data[MODEL][record_id]['name']
+
+
+def test_incremental_refresh_pulls_changes_only(mirror, client):
+    record_id = client.search(MODEL, [], limit=1, order='id desc')[0]
+    client.write(MODEL, [record_id], {'state': 'cancel'})
+    
+    counts = mirror.refresh([MODEL])
+    assert 1 <= counts[MODEL] < 10
+    assert mirror.get(MODEL, record_id)['state'] == 'cancel'
+
+
+def test_prune_removes_deleted_records(mirror, client):
+    record_ids = client.search(MODEL, [], limit=3)
+    client.unlink(MODEL, record_ids)
+    
+    assert mirror.prune([MODEL]) == {MODEL: 3}
+    assert all(mirror.get(MODEL, record_id) is None for record_id in record_ids)
+    assert mirror.prune([MODEL]) == {MODEL: 0}
+
+
+def test_queries_match_the_server(mirror, client):
+    user_id = client.search('res.users', [], limit=1)[0]
+    local = mirror.search_manufacturing_orders(state=['confirmed', 'progress'], user_id=user_id, limit=0, order='id')
+    remote = client.search_read(
+        MODEL, [('state', 'in', ['confirmed', 'progress']), ('user_id', '=', user_id)],
+        ['name'], limit=0, order='id'
+    )
+    assert [r['id'] for r in local] == [r['id'] for r in remote]
+
+
+def test_date_bounds_cover_the_whole_day(mirror, client):
+    record_id = client.search(MODEL, [], limit=1)[0]
+    client.write(MODEL, [record_id], {'date_deadline': '2031-06-15 18:00:00'})
+    mirror.refresh([MODEL])
+    
+    found = mirror.search_manufacturing_orders(deadline_from='2031-06-15', deadline_to='2031-06-15')
+    assert [r['id'] for r in found] == [record_id]
+    assert mirror.search_manufacturing_orders(deadline_from='2031-06-16') == []
+
+
+def test_empty_deadlines_sort_like_odoo(mirror, client):
+    local = mirror.search_manufacturing_orders(order='date_deadline desc', limit=200)
+    remote = client.search_read(MODEL, [], ['date_deadline'], limit=200, order='date_deadline desc, id')
+    assert [r['id'] for r in local] == [r['id'] for r in remote]
+    assert local[0]['date_deadline'] is False
+
+
+def test_auto_refresh_survives_unexpected_errors(mirror, monkeypatch):
+    calls = []
+    refreshed = threading.Event()
+    
+    def refresh():
+        calls.append(1)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError('database is locked')
+        refreshed.set()
+    
+    monkeypatch.setattr(mirror, 'refresh', refresh)
+    mirror.start_auto_refresh(0.01)
+    assert refreshed.wait(5)
+    mirror.stop_auto_refresh()
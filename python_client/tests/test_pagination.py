@@ -0,0 +1,36 @@
+"""Keyset pagination (iter_search_read) against the fake server"""
+
+MODEL = 'mrp.production'
+
+
+def test_iter_search_read_streams_every_record_in_id_order(client, server):
+    domain = [('state', 'in', ['done', 'cancel'])]
+    expected = sorted(r['id'] for r in server.data[MODEL].values() if r['state'] in ('done', 'cancel'))
+    before = server.request_count
+    
+    records = list(client.iter_search_read(MODEL, domain, ['name'], page_size=50))
+    assert [r['id'] for r in records] == expected
+    assert set(records[0]) == {'id', 'name'}
+    # One request per page, the last one short (or empty)
+    assert server.request_count - before == len(expected) // 50 + 1
+
+
+def test_iter_search_read_resumes_after_an_id(client, server):
+    ids = sorted(server.data[MODEL])
+    records = client.iter_search_read(MODEL, [], ['id'], page_size=100, after_id=ids[-10])
+    assert [r['id'] for r in records] == ids[-9:]
+
+
+def test_records_created_while_iterating_are_reached(client, server):
+    records = client.iter_search_read(MODEL, [], ['id'], page_size=500)
+    first = next(records)
+    new_id = client.create(MODEL, {'product_id': 1, 'product_qty': 1.0})
+    
+    ids = [first['id']] + [r['id'] for r in records]
+    assert ids == sorted(server.data[MODEL]) and ids[-1] == new_id
+
+
+def test_iter_manufacturing_orders(client, server):
+    orders = list(client.iter_manufacturing_orders([('state', '=', 'draft')], page_size=30))
+    assert len(orders) == sum(r['state'] == 'draft' for r in server.data[MODEL].values())
+    assert 'date_planned_start' in orders[0]
@@ -0,0 +1,49 @@
+"""Sharded parallel reads (search_read_parallel) against the fake server"""
+
+MODEL = 'mrp.production'
+DOMAIN = [('state', '!=', 'cancel')]
+
+
+def test_id_shards_match_a_single_read(client):
+    expected = client.search_read(MODEL, DOMAIN, ['name', 'state'], limit=0, order='id')
+    records = client.search_read_parallel(MODEL, DOMAIN, ['name', 'state'], shards=7, max_workers=3, page_size=100)
+    assert records == expected
+
+
+def test_date_shards_cover_every_record_once(client, server):
+    records = client.search_read_parallel(
+        MODEL, DOMAIN, ['date_deadline'], shard_field='date_deadline', shards=5, page_size=200
+    )
+    expected = sorted(r['id'] for r in server.data[MODEL].values() if r['state'] != 'cancel')
+    assert sorted(r['id'] for r in records) == expected
+    
+    # Windows in ascending order (ids ascending within each), then the
+    # records without a deadline
+    starts = [shard[1][2] for shard in client._plan_shards(MODEL, DOMAIN, 'date_deadline', 5)[:-1]]
+    windows = [
+        sum(start <= r['date_deadline'] for start in starts) if r['date_deadline'] else len(starts) + 1
+        for r in records
+    ]
+    assert windows == sorted(windows) and windows[-1] == len(starts) + 1
+    for window in set(windows):
+        ids = [r['id'] for r, w in zip(records, windows) if w == window]
+        assert ids == sorted(ids)
+
+
+def test_plan_shards_for_ids(client, server):
+    ids = sorted(server.data[MODEL])
+    shards = client._plan_shards(MODEL, [], 'id', 4)
+    step = -(-(ids[-1] - ids[0] + 1) // 4)
+    assert shards[0] == [('id', '>=', ids[0]), ('id', '<', ids[0] + step)]
+    assert len(shards) == 4 and shards[-1][1][2] > ids[-1]
+
+
+def test_plan_shards_for_a_single_date(client, server):
+    for record_id in client.search(MODEL, [('date_deadline', '!=', False)], limit=0):
+        server.data[MODEL][record_id]['date_deadline'] = '2024-05-01 12:00:00'
+    shards = client._plan_shards(MODEL, [], 'date_deadline', 4)
+    assert shards == [[('date_deadline', '=', '2024-05-01 12:00:00')], [('date_deadline', '=', False)]]
+
+
+def test_empty_result(client):
+    assert client.search_read_parallel(MODEL, [('id', '<', 0)], ['name']) == []
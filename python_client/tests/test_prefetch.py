@@ -0,0 +1,45 @@
+"""Relation prefetching (prefetch_related) against the fake server"""
+
+import pytest
+
+MODEL = 'mrp.production'
+
+
+def test_many2one_fields_are_resolved_in_one_read_per_model(client, server):
+    client.fields_get(MODEL)
+    before = server.request_count
+    
+    orders = client.search_read(
+        MODEL, [], ['name'], limit=200, order='id',
+        prefetch={'product_id': ['default_code'], 'user_id': ['login']}
+    )
+    # search_read, then one read each for products and users
+    assert server.request_count - before == 3
+    
+    first = orders[0]
+    product = server.data['product.product'][first['product_id']['id']]
+    assert first['product_id'] == {'id': product['id'], 'default_code': product['default_code']}
+    assert set(first['user_id']) == {'id', 'login'}
+    
+    same_product = [o for o in orders if o['product_id']['id'] == first['product_id']['id']]
+    assert len(same_product) > 1 and all(o['product_id'] is first['product_id'] for o in same_product)
+
+
+def test_x2many_fields_keep_their_order(client, server):
+    server.data['stock.move'] = {
+        11: {'id': 11, 'name': 'Wood', 'product_uom_qty': 2.0},
+        12: {'id': 12, 'name': 'Screws', 'product_uom_qty': 40.0},
+    }
+    record_id = sorted(server.data[MODEL])[0]
+    # 99 no longer exists: it is dropped
+    server.data[MODEL][record_id]['move_raw_ids'] = [12, 99, 11]
+    
+    order, = client.search_read(MODEL, [('id', '=', record_id)], ['name'], prefetch={'move_raw_ids': ['name']})
+    assert order['move_raw_ids'] == [{'id': 12, 'name': 'Screws'}, {'id': 11, 'name': 'Wood'}]
+
+
+def test_empty_values_and_unknown_fields(client):
+    orders = [{'id': 1, 'user_id': False}]
+    assert client.prefetch_related(MODEL, orders, {'user_id': None}) == [{'id': 1, 'user_id': False}]
+    with pytest.raises(ValueError):
+        client.prefetch_related(MODEL, orders, {'name': None})
@@ -0,0 +1,57 @@
+"""Compact slotted records (records.py)"""
+
+import pickle
+from datetime import datetime
+
+import pytest
+
+from python_client.records import ManufacturingOrder, Many2one, Product, make_record_class
+
+ORDER = {
+    'id': 4, 'name': 'MO/004', 'state': 'done',
+    'product_id': [9, 'Table'], 'user_id': False,
+    'date_deadline': '2024-05-01 10:00:00', 'date_planned_start': False,
+}
+
+
+def test_values_are_parsed_on_access():
+    order = ManufacturingOrder.from_dict(ORDER)
+    assert order.product_id == Many2one(9, 'Table') and order.product_id.name == 'Table'
+    assert order.user_id is None
+    assert order.date_deadline == datetime(2024, 5, 1, 10, 0)
+    assert order.date_planned_start is None
+    assert order.raw('product_id') == [9, 'Table']
+    assert not hasattr(order, '__dict__')
+
+
+def test_round_trip_and_missing_fields():
+    order = ManufacturingOrder.from_dict(ORDER)
+    assert order.to_dict() == ORDER
+    assert order.get('product_qty', 0.0) == 0.0
+    with pytest.raises(AttributeError):
+        order.product_qty
+    
+    assert pickle.loads(pickle.dumps(order)) == order
+    assert order != ManufacturingOrder.from_dict(dict(ORDER, state='cancel'))
+    assert repr(order) == "<ManufacturingOrder id=4 'MO/004'>"
+
+
+def test_make_record_class():
+    Line = make_record_class('Line', 'mrp.line', ['id', 'day', 'owner'], date_fields=['day'], many2one_fields=['owner'])
+    line = Line.from_dict({'id': 1, 'day': '2024-01-02', 'owner': [3, 'Cy'], 'ignored': True})
+    assert (line.day, line.owner.id) == (datetime(2024, 1, 2), 3)
+    assert Line.__slots__ == ('id', '_raw_day', '_raw_owner')
+    assert line.to_dict() == {'id': 1, 'day': '2024-01-02', 'owner': [3, 'Cy']}
+
+
+def test_helpers_return_records(client, server):
+    orders = client.search_manufacturing_orders([('state', '=', 'done')], limit=5, order='id', as_records=True)
+    assert all(isinstance(order, ManufacturingOrder) for order in orders)
+    assert [order.to_dict() for order in orders] == client.search_manufacturing_orders(
+        [('state', '=', 'done')], limit=5, order='id')
+    
+    products = client.search_products(limit=2, as_records=True)
+    assert isinstance(products[0], Product)
+    
+    with pytest.raises(ValueError):
+        client.search_manufacturing_orders(fields=['name', 'no_slot'], as_records=True)
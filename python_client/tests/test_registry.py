@@ -0,0 +1,81 @@
+"""Shared client registry and persisted sessions"""
+
+import pytest
+
+from python_client import OdooClient
+from python_client.fakeserver import FakeOdooError
+from python_client.registry import ClientRegistry, SessionStore
+
+MODEL = 'res.users'
+
+
+@pytest.fixture
+def registry(server):
+    registry = ClientRegistry()
+    yield registry
+    registry.clear()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / 'sessions.json'), ttl=60)
+
+
+def new_client(server, store, api_key='secret'):
+    return OdooClient(server.url, server.db, 'admin', api_key, session_store=store)
+
+
+def test_registry_hands_out_one_client_per_credentials(registry, server):
+    client = registry.get(server.url, server.db, 'admin', 'secret')
+    assert registry.get(server.url + '/', server.db, 'admin', 'secret') is client
+    assert registry.get(server.url, server.db, 'admin', 'secret', protocol='xmlrpc') is not client
+    assert len(registry) == 2
+    
+    # A new API key replaces (and closes) the registered client
+    replaced = registry.get(server.url, server.db, 'admin', 'other')
+    assert replaced is not client and len(registry) == 2
+    
+    registry.remove(replaced)
+    assert len(registry) == 1
+
+
+def test_cached_uid_skips_authentication(server, store):
+    first = new_client(server, store)
+    first.authenticate()
+    
+    before = server.request_count
+    second = new_client(server, store)
+    assert second.search_count(MODEL) == len(server.data[MODEL])
+    assert server.request_count - before == 1
+    assert second.uid == first.uid
+    
+    # Another API key for the same user never reuses the entry
+    before = server.request_count
+    new_client(server, store, api_key='other').authenticate()
+    assert server.request_count - before == 1
+
+
+def test_expired_sessions_are_ignored(server, store, monkeypatch):
+    new_client(server, store).authenticate()
+    client = new_client(server, store)
+    assert store.get(client, 'uid') is not None
+    
+    monkeypatch.setattr(store, 'ttl', -1)
+    assert store.get(client, 'uid') is None
+
+
+def test_rejected_cached_uid_logs_in_again(server, store, monkeypatch):
+    new_client(server, store).authenticate()
+    client = new_client(server, store)
+    search_count = server._rpc_search_count
+    rejected = []
+    
+    def reject_once(*args, **kwargs):
+        if not rejected:
+            rejected.append(1)
+            raise FakeOdooError("Access Denied")
+        return search_count(*args, **kwargs)
+    
+    monkeypatch.setattr(server, '_rpc_search_count', reject_once)
+    assert client.search_count(MODEL) == len(server.data[MODEL])
+    assert rejected and not client._uid_from_store
@@ -0,0 +1,105 @@
+"""Adaptive concurrency limiter and retry policy against the fake server"""
+
+import socket
+
+import pytest
+
+from python_client import OdooClient, OdooAPIError, OdooConnectionError
+from python_client.resilience import AdaptiveLimiter, LimiterTimeout, RetryBudget, RetryPolicy
+
+MODEL = 'product.product'
+
+
+def unreachable_url():
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        return f"http://localhost:{sock.getsockname()[1]}"
+
+
+@pytest.fixture
+def make_client(server):
+    clients = []
+    
+    def make(**options):
+        client = OdooClient(server.url, server.db, 'admin', 'secret', **options)
+        client.authenticate()
+        clients.append(client)
+        return client
+    
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_connection_errors_shrink_the_limit(make_client):
+    limiter = AdaptiveLimiter(initial_limit=8, cooldown=0)
+    client = make_client(limiter=limiter)
+    client.search_count(MODEL)
+    
+    client.url = unreachable_url()
+    for expected in (4, 2, 1, 1):
+        with pytest.raises(OdooConnectionError):
+            client.search_count(MODEL)
+        assert limiter.limit == expected
+    assert limiter.stats()['overloads'] == 4 and limiter.in_flight == 0
+
+
+def test_slow_calls_shrink_and_fast_calls_grow_the_limit(make_client, server):
+    limiter = AdaptiveLimiter(initial_limit=4, latency_target=0.05, cooldown=0)
+    client = make_client(limiter=limiter)
+    
+    server.latency = 0.1
+    client.search_count(MODEL)
+    assert limiter.limit == 2
+    
+    server.latency = 0
+    for _ in range(4):
+        client.search_count(MODEL)
+    assert limiter.limit == 3  # 2 -> 2.5 -> 2.9 -> 3.24 -> 3.55
+
+
+def test_limiter_times_out_when_no_slot_frees():
+    limiter = AdaptiveLimiter(initial_limit=1)
+    limiter.acquire()
+    with pytest.raises(LimiterTimeout):
+        limiter.acquire(timeout=0.01)
+    assert limiter.stats()['rejections'] == 1
+
+
+def test_reads_are_retried_after_connection_errors(make_client, server, monkeypatch):
+    client = make_client(retry=RetryPolicy(max_attempts=3, base_delay=0))
+    execute_kw = client._execute_kw
+    failures = []
+    
+    def flaky(*args):
+        if len(failures) < 2:
+            failures.append(1)
+            raise OdooConnectionError("connection reset")
+        return execute_kw(*args)
+    
+    monkeypatch.setattr(client, '_execute_kw', flaky)
+    assert client.search_count(MODEL) == len(server.data[MODEL])
+    assert client.metrics.snapshot()[f'{MODEL}.search_count/jsonrpc']['retries'] == 2
+
+
+def test_writes_and_exhausted_budgets_are_not_retried(make_client, server):
+    client = make_client(retry=RetryPolicy(max_attempts=3, base_delay=0))
+    client.url = unreachable_url()
+    with pytest.raises(OdooConnectionError):
+        client.write(MODEL, [1], {'name': 'x'})
+    assert client.retry.budget.stats()['retries'] == 0
+    
+    budget = RetryBudget(ratio=0, min_per_second=0)
+    client = make_client(retry=RetryPolicy(max_attempts=3, base_delay=0, budget=budget))
+    client.url = unreachable_url()
+    with pytest.raises(OdooConnectionError):
+        client.search_count(MODEL)
+    assert budget.stats() == {'tokens': 0, 'retries': 0, 'exhausted': 1}
+
+
+def test_api_errors_do_not_touch_the_limit(make_client):
+    limiter = AdaptiveLimiter(initial_limit=4, cooldown=0)
+    client = make_client(limiter=limiter)
+    with pytest.raises(OdooAPIError):
+        client.search_read(MODEL, [], ['no_such_field'])
+    assert limiter.limit == 4 and limiter.stats()['overloads'] == 0
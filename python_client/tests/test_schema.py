@@ -0,0 +1,111 @@
+"""Field lists of model helpers and fields renamed across Odoo versions"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from python_client import OdooClient, RecordLoader
+from python_client.datagen import generate_dataset
+from python_client.fakeserver import FakeOdooServer
+
+MODEL = 'mrp.production'
+
+
+def timestamp(value):
+    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def odoo17():
+    """Server whose manufacturing orders use the Odoo 17 field names"""
+    data = generate_dataset(300, products=20, users=5)
+    for record in data[MODEL].values():
+        record['date_start'] = record.pop('date_planned_start')
+    with FakeOdooServer(data) as server:
+        yield server
+
+
+@pytest.fixture
+def client17(odoo17):
+    client = OdooClient(odoo17.url, odoo17.db, 'admin', 'secret')
+    client.authenticate()
+    yield client
+    client.close()
+
+
+def test_helpers_do_not_fetch_the_schema_by_default(client, server):
+    before = server.request_count
+    orders = client.search_manufacturing_orders(limit=5)
+    assert server.request_count - before == 1
+    assert len(orders) == 5 and 'date_planned_start' in orders[0]
+
+
+def test_unknown_fields_are_rejected_like_odoo(client17):
+    with pytest.raises(Exception, match='Invalid field'):
+        client17.search_read('res.users', [], ['no_such_field'])
+
+
+def test_renamed_fields_are_substituted_when_rejected(client17, odoo17):
+    orders = client17.search_manufacturing_orders(
+        domain=[('date_planned_start', '>=', '2000-01-01')], limit=5
+    )
+    assert len(orders) == 5
+    assert all('date_planned_start' in order and 'date_start' not in order for order in orders)
+    
+    # The schema is known now: later calls resolve the names up front
+    before = odoo17.request_count
+    order = client17.get_manufacturing_order(orders[0]['id'])
+    assert odoo17.request_count - before == 1
+    assert order['date_planned_start'] == orders[0]['date_planned_start']
+
+
+def test_loader_and_generic_reads_use_renamed_fields(client17, odoo17):
+    record_id = sorted(odoo17.data[MODEL])[0]
+    with RecordLoader(client17).batch() as loader:
+        future = loader.get_manufacturing_order(record_id)
+    assert 'date_planned_start' in future.result()
+    
+    records = client17.read(MODEL, [record_id], ['name', 'date_planned_start'])
+    assert records[0]['date_planned_start'] == odoo17.data[MODEL][record_id]['date_start']
+
+
+def test_lean_helpers_resolve_against_the_schema(client17):
+    orders = client17.search_manufacturing_orders(limit=3, lean=True)
+    assert 'date_planned_start' in orders[0]
+
+
+def test_async_client_substitutes_renamed_fields(odoo17):
+    pytest.importorskip('aiohttp')
+    from python_client import AsyncOdooClient
+    
+    async def run():
+        async with AsyncOdooClient(odoo17.url, odoo17.db, 'admin', 'secret') as client:
+            return await client.search_manufacturing_orders(limit=3)
+    
+    orders = asyncio.run(run())
+    assert len(orders) == 3 and 'date_planned_start' in orders[0]
+
+
+def test_streamed_columns_retry_with_renamed_fields(client17, odoo17):
+    store = client17.fetch_manufacturing_order_columns(fields=['name', 'date_planned_start'], use_numpy=False)
+    first = sorted(odoo17.data[MODEL])[0]
+    assert len(store) == len(odoo17.data[MODEL]) and 'date_start' not in store
+    assert store['date_planned_start'][0] == timestamp(odoo17.data[MODEL][first]['date_start'])
+    
+    # The schema is known now: the stream is sent with the renamed field
+    before = odoo17.request_count
+    store = client17.search_read_columns(MODEL, [], ['date_planned_start'], limit=5, order='id', use_numpy=False)
+    assert odoo17.request_count - before == 1
+    assert store['date_planned_start'][0] == timestamp(odoo17.data[MODEL][first]['date_start'])
+
+
+def test_analytics_from_client_on_odoo17(client17, odoo17):
+    pytest.importorskip('numpy')
+    from python_client.analytics import ProductionAnalytics
+    
+    analytics = ProductionAnalytics.from_client(client17)
+    assert len(analytics) == len(odoo17.data[MODEL])
+    assert analytics.store.kinds['date_planned_start'] == 'datetime'
+    # Production time needs the planned start, read as date_start
+    assert analytics.kpis()['avg_production_time'] > 0
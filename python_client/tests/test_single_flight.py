@@ -0,0 +1,98 @@
+"""Single-flight deduplication of identical concurrent reads"""
+
+import threading
+import time
+
+import pytest
+
+from python_client import OdooAPIError, OdooClient
+
+MODEL = 'product.product'
+WORKERS = 8
+
+
+@pytest.fixture
+def shared_client(server):
+    client = OdooClient(server.url, server.db, 'admin', 'secret', single_flight=True)
+    client.authenticate()
+    yield client
+    client.close()
+
+
+def slow_reads(server, delay=0.3):
+    search_read = server._rpc_search_read
+    
+    def _rpc_search_read(*args, **kwargs):
+        time.sleep(delay)
+        return search_read(*args, **kwargs)
+    server._rpc_search_read = _rpc_search_read
+
+
+def run_concurrently(call, count=WORKERS):
+    barrier = threading.Barrier(count)
+    outcomes = [None] * count
+    
+    def run(i):
+        barrier.wait()
+        try:
+            outcomes[i] = call()
+        except Exception as e:
+            outcomes[i] = e
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def read_products(client):
+    return client.search_read(MODEL, [('active', '=', True)], ['name', 'list_price'], limit=20, order='id')
+
+
+def test_identical_reads_share_one_request(shared_client, server):
+    slow_reads(server)
+    before = server.request_count
+    
+    results = run_concurrently(lambda: read_products(shared_client))
+    
+    assert server.request_count - before == 1
+    assert shared_client.metrics.snapshot()[MODEL]['collapsed_calls'] == WORKERS - 1
+    assert all(result == results[0] for result in results)
+    # Every caller owns its records
+    results[0][0]['name'] = 'changed'
+    assert all(result[0]['name'] != 'changed' for result in results[1:])
+
+
+def test_single_flight_is_off_by_default(client, server):
+    slow_reads(server, 0.1)
+    before = server.request_count
+    
+    run_concurrently(lambda: read_products(client))
+    
+    assert server.request_count - before == WORKERS
+
+
+def test_followers_receive_the_leader_error(shared_client, server):
+    slow_reads(server)
+    
+    outcomes = run_concurrently(lambda: shared_client.search_read(MODEL, [], ['no_such_field']))
+    
+    assert all(isinstance(outcome, OdooAPIError) for outcome in outcomes)
+    assert shared_client.metrics.snapshot()[MODEL]['collapsed_calls'] == WORKERS - 1
+
+
+def test_read_after_write_does_not_join_older_read(shared_client, server):
+    slow_reads(server, 0.5)
+    product_id = sorted(server.data[MODEL])[0]
+    older = threading.Thread(target=read_products, args=(shared_client,))
+    older.start()
+    time.sleep(0.1)
+    
+    shared_client.write(MODEL, [product_id], {'list_price': 1234.5})
+    records = read_products(shared_client)
+    older.join()
+    
+    assert records[0]['id'] == product_id
+    assert records[0]['list_price'] == 1234.5
+    assert shared_client.metrics.snapshot().get(MODEL, {}).get('collapsed_calls', 0) == 0
@@ -0,0 +1,133 @@
+"""XML-RPC response decoding and the pooled XML-RPC transport"""
+
+import xmlrpc.client
+from datetime import datetime
+
+import pytest
+
+from python_client import OdooAPIError, OdooClient
+from python_client.codec import JSONCodec
+from python_client.datagen import generate_dataset
+from python_client.fakeserver import FakeOdooServer
+from python_client.transport import _loads_as_json, loads_response
+
+MODEL = 'mrp.production'
+
+# Shapes the JSON rewrite handles
+COMMON_VALUES = [
+    1,
+    -42,
+    2 ** 31 - 1,
+    3.5,
+    -0.125,
+    True,
+    False,
+    None,
+    '',
+    'plain',
+    'quotes " and \\ backslashes',
+    '<tag> & entities \'apos\'',
+    'line\nbreaks\tand tabs',
+    'unicode é 漢字  ',
+    ' \u2028 separators \x7f',
+    [],
+    {},
+    [1, 'two', 3.0, None, False],
+    {'id': 7, 'name': 'WH/MO/00007', 'product_id': [3, 'Table'], 'move_raw_ids': [11, 12]},
+    {'nested': [{'a': [], 'b': {}}, [[1], [2, [3]]]], 'key with "quotes"': '>'},
+    [{'id': i, 'state': 'done', 'qty': i / 4, 'note': False} for i in range(50)],
+]
+
+# Shapes left to xmlrpc.client.loads
+OTHER_VALUES = [
+    xmlrpc.client.DateTime('20240501T12:30:00'),
+    xmlrpc.client.Binary(b'\x00\x01binary\xff'),
+    {'create_date': xmlrpc.client.DateTime('20240501T12:30:00'), 'name': 'x'},
+    [xmlrpc.client.Binary(b'data'), 1],
+]
+
+
+def response(value, **kwargs) -> bytes:
+    return xmlrpc.client.dumps((value,), methodresponse=True, allow_none=True, **kwargs).encode('utf-8')
+
+
+def stdlib(body: bytes, use_builtin_types: bool = False):
+    params, _ = xmlrpc.client.loads(body, use_builtin_types=use_builtin_types)
+    return params
+
+
+@pytest.mark.parametrize('value', COMMON_VALUES)
+def test_common_responses_take_the_json_path(value):
+    body = response(value)
+    
+    assert _loads_as_json(body, JSONCodec()) is not None
+    assert loads_response(body) == stdlib(body)
+
+
+@pytest.mark.parametrize('value', OTHER_VALUES)
+def test_other_responses_match_the_stdlib(value):
+    body = response(value)
+    
+    assert _loads_as_json(body, JSONCodec()) is None
+    assert loads_response(body) == stdlib(body)
+    assert loads_response(body, use_builtin_types=True) == stdlib(body, use_builtin_types=True)
+
+
+@pytest.mark.parametrize('body', [
+    # Untyped string values
+    b'<?xml version="1.0"?><methodResponse><params><param><value>plain</value></param></params></methodResponse>',
+    b'<methodResponse><params><param><value><array><data><value>a</value><value><int>1</int></value>'
+    b'</data></array></value></param></params></methodResponse>',
+    b'<methodResponse><params><param><value></value></param></params></methodResponse>',
+    # Pretty-printed by another server
+    b'<?xml version="1.0"?>\n<methodResponse>\n  <params>\n    <param>\n      <value><struct>\n'
+    b'        <member><name>a</name><value><int>1</int></value></member>\n'
+    b'      </struct></value>\n    </param>\n  </params>\n</methodResponse>\n',
+    # Raw line endings and character references
+    b'<methodResponse><params><param><value><string>a\r\nb\rc&#233;&#x4E2D;&amp;&lt;</string></value>'
+    b'</param></params></methodResponse>',
+    # 64-bit integers
+    b'<methodResponse><params><param><value><i8>9007199254740993</i8></value></param></params></methodResponse>',
+    # Other declared encodings
+    '<?xml version="1.0" encoding="iso-8859-1"?><methodResponse><params><param><value>'
+    '<string>caf\xe9</string></value></param></params></methodResponse>'.encode('iso-8859-1'),
+], ids=['untyped', 'untyped-in-array', 'empty-value', 'pretty-printed', 'line-endings',
+        'i8', 'latin-1'])
+def test_handwritten_responses_match_the_stdlib(body):
+    assert loads_response(body) == stdlib(body)
+
+
+def test_faults_are_raised():
+    body = xmlrpc.client.dumps(xmlrpc.client.Fault(1, 'Access <denied> & "logged"'), allow_none=True).encode('utf-8')
+    
+    with pytest.raises(xmlrpc.client.Fault) as raised:
+        loads_response(body)
+    
+    assert raised.value.faultCode == 1
+    assert raised.value.faultString == 'Access <denied> & "logged"'
+
+
+@pytest.mark.parametrize('gzip', [False, True])
+def test_xmlrpc_client_reads_like_jsonrpc(gzip):
+    with FakeOdooServer(generate_dataset(300, products=20, users=5), gzip=gzip) as server:
+        jsonrpc = OdooClient(server.url, server.db, 'admin', 'secret')
+        xmlrpc_client = OdooClient(server.url, server.db, 'admin', 'secret', protocol='xmlrpc')
+        try:
+            domain = [('state', '=', 'done')]
+            fields = ['name', 'state', 'product_id', 'product_qty', 'move_raw_ids', 'date_planned_start']
+            
+            assert xmlrpc_client.authenticate() == jsonrpc.authenticate()
+            assert (xmlrpc_client.search_read(MODEL, domain, fields, limit=0)
+                    == jsonrpc.search_read(MODEL, domain, fields, limit=0))
+            
+            with pytest.raises(OdooAPIError, match='XML-RPC Fault'):
+                xmlrpc_client.read(MODEL, [10 ** 6], ['name'])
+        finally:
+            jsonrpc.close()
+            xmlrpc_client.close()
+
+
+def test_datetimes_are_decoded_with_builtin_types():
+    body = response({'date': xmlrpc.client.DateTime('20240501T12:30:00')})
+    
+    assert loads_response(body, use_builtin_types=True) == ({'date': datetime(2024, 5, 1, 12, 30)},)
@@ -0,0 +1,63 @@
+"""Change watcher polling (driven by poll() instead of the background thread)"""
+
+import threading
+
+from python_client.watch import ChangeWatcher
+
+MODEL = 'mrp.production'
+
+
+def record_events(watcher, monkeypatch):
+    events = []
+    monkeypatch.setattr(watcher, '_notify', lambda *event: events.append(event))
+    return events
+
+
+def test_poll_delivers_same_second_writes_once(client, server, monkeypatch):
+    watcher = ChangeWatcher(client, MODEL, [('state', '!=', 'cancel')], coalesce=0, page_size=7)
+    events = record_events(watcher, monkeypatch)
+    assert watcher.poll() is False  # the first poll only records the state
+    
+    # One write: 30 records (more than a page) share the same write_date
+    written = sorted(server.data[MODEL])[:30]
+    client.write(MODEL, written, {'priority': '1'})
+    new_id = client.create(MODEL, {'product_id': 1, 'product_qty': 1.0})
+    
+    assert watcher.poll() is True
+    (created, updated, removed), = events
+    assert [r['id'] for r in created] == [new_id]
+    assert sorted(r['id'] for r in updated) == written
+    assert removed == []
+    
+    assert watcher.poll() is False
+
+
+def test_poll_reports_records_leaving_the_domain(client, server, monkeypatch):
+    watcher = ChangeWatcher(client, MODEL, [('state', '=', 'done')], coalesce=0)
+    events = record_events(watcher, monkeypatch)
+    watcher.poll()
+    
+    done = sorted(client.search(MODEL, [('state', '=', 'done')], limit=3))
+    client.write(MODEL, done, {'state': 'cancel'})
+    
+    assert watcher.poll() is True
+    assert events == [([], [], done)]
+
+
+def test_polling_survives_unexpected_errors(client, monkeypatch):
+    watcher = ChangeWatcher(client, MODEL, min_interval=0.01, max_interval=0.01)
+    stop = threading.Event()
+    calls = []
+    
+    def poll(stop):
+        calls.append(1)
+        if len(calls) == 1:
+            raise KeyError('write_date')
+        stop.set()
+        return False
+    
+    monkeypatch.setattr(watcher, 'poll', poll)
+    thread = threading.Thread(target=watcher._run, args=(stop,), daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive() and len(calls) == 2
@@ -0,0 +1,200 @@
+"""
+Pooled XML-RPC transport
+========================
+
+``xmlrpc.client.Transport`` opens one ``http.client`` connection per proxy,
+is not safe to share between threads and never asks for compressed
+responses. :class:`RequestsTransport` sends XML-RPC calls through the
+client's pooled ``requests`` session instead:
+
+- keep-alive connections from the session's pool, shared by all threads
+  (the transport itself holds no connection state)
+- gzip/deflate responses negotiated and decoded by ``requests``
+- the client's timeout applies to XML-RPC calls
+- request/response sizes of the last call are kept per thread for metrics
+
+Responses are decoded by :func:`loads_response`, which rewrites the tag
+structure of common ``methodResponse`` bodies (struct, array, string, int,
+double, boolean, nil) into JSON and parses that with the JSON codec, several
+times faster than the stdlib unmarshaller. Anything else (faults, dateTime,
+base64, untyped values, other layouts) goes through ``xmlrpc.client.loads``.
+
+Example usage:
+    >>> transport = RequestsTransport(client._get_session, 'https', timeout=30)
+    >>> proxy = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport)
+"""
+
+import re
+import json
+import threading
+import xmlrpc.client
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+
+from .codec import JSONCodec
+
+XMLRPC_HEADERS = {'Content-Type': 'text/xml'}
+
+# Strings and member names that need escaping before the JSON rewrite
+# (quotes, backslashes, entities, line breaks, '>', control characters)
+_SPECIAL_TEXT = re.compile(r'<(string|name)>([^<]*?[&"\\>\x00-\x1f][^<]*)</\1>')
+_ENTITY = re.compile(r'&(lt|gt|amp|quot|apos|#[0-9]+|#x[0-9a-fA-F]+);')
+_NAMED_ENTITIES = {'lt': '<', 'gt': '>', 'amp': '&', 'quot': '"', 'apos': "'"}
+_UNTYPED_VALUE = re.compile(r'<value>(?!<)')
+
+_RESPONSE_HEAD = '<methodResponse><params><param><value>'
+_RESPONSE_TAIL = '</value></param></params></methodResponse>'
+
+# Tag sequences -> JSON, applied in order once line breaks between tags are gone
+_JSON_REWRITES = (
+    ('</value></member><member><name>', ',"'),
+    ('<struct><member><name>', '{"'),
+    ('</value></member></struct>', '}'),
+    ('<struct></struct>', '{}'),
+    ('</name><value>', '":'),
+    ('</value><value>', ','),
+    ('<array><data><value>', '['),
+    ('</value></data></array>', ']'),
+    ('<array><data></data></array>', '[]'),
+    ('<string>', '"'), ('</string>', '"'),
+    ('<int>', ''), ('</int>', ''), ('<i4>', ''), ('</i4>', ''), ('<i8>', ''), ('</i8>', ''),
+    ('<double>', ''), ('</double>', ''),
+    ('<boolean>1</boolean>', 'true'), ('<boolean>0</boolean>', 'false'),
+    ('<nil/>', 'null'),
+)
+
+
+def _unescape_entity(match: 're.Match') -> str:
+    name = match.group(1)
+    if name[0] == '#':
+        return chr(int(name[2:], 16) if name[1] == 'x' else int(name[1:]))
+    return _NAMED_ENTITIES[name]
+
+
+def _escape_text(match: 're.Match') -> str:
+    """Turn XML text into JSON string content free of '<', '>' and line breaks"""
+    text = match.group(2)
+    if '\r' in text:
+        # XML parsers normalize raw line endings to '\n'
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if '&' in text:
+        text = _ENTITY.sub(_unescape_entity, text)
+    text = json.dumps(text, ensure_ascii=False)[1:-1].replace('<', '\\u003c').replace('>', '\\u003e')
+    return f"<{match.group(1)}>{text}</{match.group(1)}>"
+
+
+def _loads_as_json(body: bytes, codec: JSONCodec) -> Optional[Tuple[Any, ...]]:
+    """Decode a methodResponse through JSON, or None if it has another shape"""
+    try:
+        text = body.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    
+    if text.startswith('<?xml'):
+        end = text.find('?>')
+        declaration = text[:end].lower()
+        if 'encoding' in declaration and 'utf-8' not in declaration:
+            return None
+        text = text[end + 2:]
+    
+    # Text is escaped first, so the only line breaks left are between tags
+    text = _SPECIAL_TEXT.sub(_escape_text, text).replace('\n', '')
+    if not (text.startswith(_RESPONSE_HEAD) and text.endswith(_RESPONSE_TAIL)):
+        return None
+    text = text[len(_RESPONSE_HEAD):-len(_RESPONSE_TAIL)]
+    if '<value></value>' in text or _UNTYPED_VALUE.search(text):
+        return None
+    
+    for old, new in _JSON_REWRITES:
+        text = text.replace(old, new)
+    if '<' in text:
+        return None
+    
+    try:
+        return (codec.loads(text),)
+    except ValueError:
+        return None
+
+
+def loads_response(
+    body: bytes,
+    codec: Optional[JSONCodec] = None,
+    use_builtin_types: bool = False
+) -> Tuple[Any, ...]:
+    """
+    Decode an XML-RPC methodResponse body
+    
+    Args:
+        body: Response body
+        codec: JSON codec used by the fast path (default: stdlib json)
+        use_builtin_types: Passed to xmlrpc.client.loads for dateTime/base64
+    
+    Returns:
+        Tuple of response params (a single result for Odoo)
+    
+    Raises:
+        xmlrpc.client.Fault: For fault responses
+    """
+    params = _loads_as_json(body, codec or JSONCodec())
+    if params is None:
+        params, _ = xmlrpc.client.loads(body, use_builtin_types=use_builtin_types)
+    return params
+
+
+class RequestsTransport(xmlrpc.client.Transport):
+    """
+    Thread-safe XML-RPC transport over a pooled requests session
+    """
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], requests.Session],
+        scheme: str = 'https',
+        timeout: Optional[float] = None,
+        codec: Optional[JSONCodec] = None,
+        use_builtin_types: bool = False
+    ):
+        """
+        Initialize the transport
+        
+        Args:
+            session_factory: Returns the session to send a call with (called
+                per request, so per-thread or per-process sessions work)
+            scheme: 'http' or 'https'
+            timeout: Request timeout in seconds
+            codec: JSON codec used to decode responses
+            use_builtin_types: Decode dateTime/base64 to datetime/bytes
+        """
+        super().__init__(use_builtin_types=use_builtin_types)
+        self.session_factory = session_factory
+        self.scheme = scheme
+        self.timeout = timeout
+        self.codec = codec or JSONCodec()
+        self._local = threading.local()
+    
+    def request(self, host: str, handler: str, request_body: bytes, verbose: bool = False) -> Tuple[Any, ...]:
+        """Send one call (ServerProxy entry point) and decode the response"""
+        self._local.sizes = (len(request_body), None)
+        url = f"{self.scheme}://{host}{handler}"
+        response = self.session_factory().post(
+            url, data=request_body, headers=XMLRPC_HEADERS, timeout=self.timeout
+        )
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                host + handler, response.status_code, response.reason, dict(response.headers)
+            )
+        
+        body = response.content
+        self._local.sizes = (len(request_body), len(body))
+        return loads_response(body, self.codec, self._use_builtin_types)
+    
+    def pop_sizes(self) -> Tuple[Optional[int], Optional[int]]:
+        """(request bytes, decoded response bytes) of this thread's last call, then forget them"""
+        sizes = getattr(self._local, 'sizes', (None, None))
+        self._local.sizes = (None, None)
+        return sizes
+    
+    def close(self) -> None:
+        # Connections belong to the session pool
+        pass
@@ -0,0 +1,308 @@
+"""
+Change watcher
+==============
+
+Polls a model for records entering, changing in or leaving a domain and
+pushes the changes to in-process subscribers. One upstream poller is shared
+by every subscriber of the same (model, domain):
+
+- each cycle starts with a cheap probe (``search_count`` plus the latest
+  ``write_date``); the changed records are only fetched when the probe moved
+- the interval drops to ``min_interval`` after a change and grows towards
+  ``max_interval`` while nothing happens
+- after a change is detected the watcher waits ``coalesce`` seconds, so a
+  burst of writes is delivered as one event
+- the union of the subscribers' fields is fetched once and each subscriber
+  receives its own projection
+
+Example usage:
+    >>> def on_change(event):
+    ...     for mo in event.updated:
+    ...         print(mo['name'], mo['state'])
+    >>> sub = client.watch('mrp.production', [('state', '!=', 'cancel')], ['name', 'state'], on_change)
+    >>> sub.cancel()
+"""
+
+import threading
+from collections import namedtuple
+from typing import Dict, List, Any, Optional, Callable
+
+from .odoo_client import OdooClient, logger, DEFAULT_PAGE_SIZE
+from .sync import iter_change_pages
+
+# Changes delivered to subscribers: records that entered the domain, records
+# whose write_date moved, and ids that left the domain (or were deleted)
+ChangeEvent = namedtuple('ChangeEvent', ['model', 'created', 'updated', 'removed'])
+
+# Interval growth factor while the model is idle
+IDLE_BACKOFF = 1.5
+
+
+class Subscription:
+    """Handle returned by :meth:`ChangeWatcher.subscribe`"""
+    
+    __slots__ = ('watcher', 'callback', 'fields', 'active')
+    
+    def __init__(self, watcher: 'ChangeWatcher', callback: Callable[[ChangeEvent], Any], fields: Optional[List[str]]):
+        self.watcher = watcher
+        self.callback = callback
+        self.fields = fields
+        self.active = True
+    
+    def cancel(self) -> None:
+        """Stop receiving events (the poller stops with its last subscriber)"""
+        self.watcher.unsubscribe(self)
+    
+    def _project(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.fields is None:
+            return [dict(record) for record in records]
+        return [
+            {field: record[field] for field in self.fields if field in record}
+            for record in records
+        ]
+
+
+class ChangeWatcher:
+    """
+    Shared poller for the records of one model matching one domain
+    
+    The watcher keeps the ``write_date`` of every matching id. A probe whose
+    count or latest ``write_date`` differs from that state triggers a keyset
+    fetch of the records written since the latest known ``write_date``; ids
+    are only listed again when the count shows that records left the domain.
+    Like :meth:`OdooClient.sync_changes`, two writes to the same record
+    within the same second are seen as one.
+    """
+    
+    def __init__(
+        self,
+        client: OdooClient,
+        model: str,
+        domain: List[tuple] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        coalesce: float = 0.5,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ):
+        """
+        Initialize the watcher (polling starts with the first subscriber)
+        
+        Args:
+            client: Client used for the probes and fetches
+            model: Model name
+            domain: Records to watch
+            min_interval: Seconds between polls while records keep changing
+            max_interval: Upper bound of the interval while idle
+            coalesce: Seconds to wait after a detected change before fetching
+            page_size: Records per request when fetching changes
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Need 0 < min_interval <= max_interval")
+        
+        self.client = client
+        self.model = model
+        self.domain = list(domain or [])
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.coalesce = coalesce
+        self.page_size = page_size
+        self.interval = min_interval
+        
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        # Set to stop the current polling thread (a new event per thread)
+        self._stop: Optional[threading.Event] = None
+        # id -> write_date of the records currently matching the domain
+        self._write_dates: Optional[Dict[int, str]] = None
+        self._watermark: Optional[str] = None
+    
+    # ==================== Subscriptions ====================
+    
+    def subscribe(self, callback: Callable[[ChangeEvent], Any], fields: List[str] = None) -> Subscription:
+        """
+        Register a callback and start polling if needed
+        
+        Args:
+            callback: Called with a ChangeEvent from the polling thread
+            fields: Fields of the delivered records (None = all fields)
+        
+        Returns:
+            Subscription handle
+        """
+        if fields is not None:
+            fields = list(fields) + (['id'] if 'id' not in fields else [])
+        subscription = Subscription(self, callback, fields)
+        with self._lock:
+            self._subscribers.append(subscription)
+            if self._stop is None:
+                self._stop = threading.Event()
+                threading.Thread(
+                    target=self._run, args=(self._stop,), name=f"odoo-watch-{self.model}", daemon=True
+                ).start()
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber; the last one stops the polling thread"""
+        with self._lock:
+            subscription.active = False
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+            if not self._subscribers and self._stop is not None:
+                self._stop.set()
+                self._stop = None
+    
+    def stop(self) -> None:
+        """Cancel every subscription"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            self.unsubscribe(subscription)
+    
+    @property
+    def subscribers(self) -> int:
+        """Number of active subscriptions"""
+        return len(self._subscribers)
+    
+    def _fields(self) -> Optional[List[str]]:
+        """Union of the subscribers' fields (None if any wants all fields)"""
+        fields = {'id', 'write_date'}
+        with self._lock:
+            for subscription in self._subscribers:
+                if subscription.fields is None:
+                    return None
+                fields.update(subscription.fields)
+        return sorted(fields)
+    
+    # ==================== Polling ====================
+    
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                changed = self.poll(stop)
+            except Exception:
+                # Any failure (not only API errors) must not end the polling thread
+                logger.exception(f"Watching {self.model} failed")
+                changed = False
+            
+            if changed:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * IDLE_BACKOFF, self.max_interval)
+            stop.wait(self.interval)
+    
+    def poll(self, stop: threading.Event = None) -> bool:
+        """
+        Run one probe (and fetch) cycle, notifying subscribers of changes
+        
+        The first call only records the current state.
+        
+        Args:
+            stop: Event cutting the coalescing wait short
+        
+        Returns:
+            True if changes were delivered
+        """
+        if self._write_dates is None:
+            self._load_state()
+            return False
+        
+        moved, count = self._probe()
+        if not moved:
+            return False
+        
+        if self.coalesce:
+            (stop or threading.Event()).wait(self.coalesce)
+        
+        created, updated = self._fetch_changes()
+        removed = self._removed_ids(count)
+        if not (created or updated or removed):
+            return False
+        
+        self.client.metrics.increment(self.model, 'watch_events')
+        self._notify(created, updated, removed)
+        return True
+    
+    def _execute(self, method: str, args: list, kwargs: Dict[str, Any] = None) -> Any:
+        # Straight to the server: local snapshots and the record cache would
+        # hide changes made by other clients
+        return self.client.execute(self.model, method, args, kwargs or {})
+    
+    def _load_state(self) -> None:
+        records = self._execute('search_read', [self.domain], {'fields': ['write_date']})
+        self._write_dates = {record['id']: record['write_date'] for record in records}
+        self._watermark = max(self._write_dates.values(), default=None)
+    
+    def _probe(self) -> tuple:
+        """
+        Compare the server's count and latest write_date with the known state
+        
+        Returns:
+            (moved, server count)
+        """
+        self.client.metrics.increment(self.model, 'watch_probes')
+        count = self._execute('search_count', [self.domain])
+        if count != len(self._write_dates):
+            return True, count
+        latest = self._execute('search_read', [self.domain], {
+            'fields': ['write_date'], 'limit': 1, 'order': 'write_date desc, id desc',
+        })
+        return (latest[0]['write_date'] if latest else None) != self._watermark, count
+    
+    def _fetch_changes(self) -> tuple:
+        """Read records written at or after the watermark that are new or changed"""
+        self.client.metrics.increment(self.model, 'watch_fetches')
+        fields = self._fields()
+        created = []
+        updated = []
+        
+        def fetch(domain: List[Any], order: str) -> List[Dict[str, Any]]:
+            return self._execute('search_read', [domain], {
+                'fields': fields, 'limit': self.page_size, 'order': order,
+            })
+        
+        # The whole watermark second is read again: records written in it
+        # after the previous fetch have no larger write_date
+        for page, _, _ in iter_change_pages(fetch, self.domain, self._watermark, 0, self.page_size):
+            for record in page:
+                known = self._write_dates.get(record['id'])
+                if known is None:
+                    created.append(record)
+                elif known != record['write_date']:
+                    updated.append(record)
+                self._write_dates[record['id']] = record['write_date']
+        
+        if created or updated:
+            self._watermark = max(self._watermark or '', *(r['write_date'] for r in created + updated))
+        return created, updated
+    
+    def _removed_ids(self, count: int) -> List[int]:
+        """
+        List ids again if more records are known than the probe counted
+        
+        Records created after the probe can trigger a needless listing;
+        records removed after it are caught by the next probe.
+        """
+        if count >= len(self._write_dates):
+            return []
+        
+        current = set(self._execute('search', [self.domain]))
+        removed = sorted(set(self._write_dates) - current)
+        for record_id in removed:
+            del self._write_dates[record_id]
+        self._watermark = max(self._write_dates.values(), default=None)
+        return removed
+    
+    def _notify(self, created: List[Dict[str, Any]], updated: List[Dict[str, Any]], removed: List[int]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        
+        for subscription in subscribers:
+            if not subscription.active:
+                continue
+            event = ChangeEvent(
+                self.model, subscription._project(created), subscription._project(updated), list(removed)
+            )
+            try:
+                subscription.callback(event)
+            except Exception as e:
+                logger.error(f"Watch callback for {self.model} failed: {str(e)}")